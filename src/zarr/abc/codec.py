@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import numpy as np
@@ -12,8 +12,16 @@ from zarr.core.buffer import Buffer, NDBuffer
 from zarr.core.chunk_grids import ChunkGrid
 from zarr.core.common import ChunkCoords, concurrent_map
 from zarr.core.config import config
+from zarr.core.executor import (
+    CodecExecutor,
+    InlineExecutor,
+    ProcessExecutor,
+    get_codec_executor,
+    to_thread_pool,
+)
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing_extensions import Self
 
     from zarr.core.array_spec import ArraySpec
@@ -28,6 +36,10 @@ __all__ = [
     "BytesBytesCodec",
     "ArrayBytesCodecPartialDecodeMixin",
     "ArrayBytesCodecPartialEncodeMixin",
+    "ArrayArrayCodecPartialMixin",
+    "BytesBytesCodecPartialDecodeMixin",
+    "SyncCodecMixin",
+    "BatchCodecMixin",
     "CodecPipeline",
 ]
 
@@ -123,6 +135,8 @@ class _Codec(Generic[CodecInput, CodecOutput], Metadata):
         -------
         Iterable[CodecInput | None]
         """
+        if isinstance(self, BatchCodecMixin) and _supports_batch(self):
+            return await _run_batch(self, self._decode_batch, list(chunks_and_specs))
         return await _batching_helper(self._decode_single, chunks_and_specs)
 
     async def _encode_single(
@@ -146,6 +160,8 @@ class _Codec(Generic[CodecInput, CodecOutput], Metadata):
         -------
         Iterable[CodecOutput | None]
         """
+        if isinstance(self, BatchCodecMixin) and _supports_batch(self):
+            return await _run_batch(self, self._encode_batch, list(chunks_and_specs))
         return await _batching_helper(self._encode_single, chunks_and_specs)
 
 
@@ -158,13 +174,48 @@ class ArrayArrayCodec(_Codec[NDBuffer, NDBuffer]):
 class ArrayBytesCodec(_Codec[NDBuffer, Buffer]):
     """Base class for array-to-bytes codecs."""
 
-    ...
+    def _decode_into_view(
+        self, out: NDBuffer, chunk_spec: ArraySpec
+    ) -> npt.NDArray[np.uint8] | None:
+        """Returns a writable byte view on the memory of ``out``, such that the encoded bytes
+        of a chunk written into the view decode to ``out``. Returns None, if the codec
+        cannot decode in place.
+
+        Parameters
+        ----------
+        out : NDBuffer
+            The region of the output array that the chunk is decoded to.
+        chunk_spec : ArraySpec
+
+        Returns
+        -------
+        np.ndarray | None
+        """
+        return None
 
 
 class BytesBytesCodec(_Codec[Buffer, Buffer]):
     """Base class for bytes-to-bytes codecs."""
 
-    ...
+    def _decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> bool:
+        """Synchronously decodes a chunk directly into ``out``.
+
+        Parameters
+        ----------
+        chunk_bytes : Buffer
+        chunk_spec : ArraySpec
+        out : np.ndarray
+            Writable, contiguous uint8 array with the size of the decoded chunk.
+
+        Returns
+        -------
+        bool
+            False, if the codec cannot decode in place or the size of the decoded chunk does
+            not match ``out``. In that case, ``out`` is left untouched.
+        """
+        return False
 
 
 Codec = ArrayArrayCodec | ArrayBytesCodec | BytesBytesCodec
@@ -242,6 +293,104 @@ class ArrayBytesCodecPartialEncodeMixin:
         )
 
 
+class ArrayArrayCodecPartialMixin:
+    """Mixin for array-to-array codecs that can map a selection of a decoded chunk to a
+    selection of the encoded chunk. Codec pipelines use the mapping to pass partial decoding
+    and encoding through to the array-to-bytes codec."""
+
+    @abstractmethod
+    def _encode_selection(
+        self, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> SelectorTuple | None:
+        """Maps a selection of the decoded chunk to the selection of the encoded chunk that
+        contains the same elements.
+
+        Parameters
+        ----------
+        selection : SelectorTuple
+        chunk_spec : ArraySpec
+            The spec of the decoded chunk.
+
+        Returns
+        -------
+        SelectorTuple | None
+            None, if the selection cannot be mapped.
+        """
+        ...
+
+    @abstractmethod
+    def _decode_partial_array(
+        self, chunk_array: NDBuffer, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> NDBuffer:
+        """Converts the elements of the encoded chunk at the mapped selection into the elements
+        of the decoded chunk at `selection`."""
+        ...
+
+    @abstractmethod
+    def _encode_partial_array(
+        self, chunk_array: NDBuffer, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> NDBuffer:
+        """Converts the elements of the decoded chunk at `selection` into the elements of the
+        encoded chunk at the mapped selection."""
+        ...
+
+
+class BytesBytesCodecPartialDecodeMixin:
+    """Mixin for bytes-to-bytes codecs that can decode a byte range of a chunk by fetching
+    only the parts of the encoded chunk that are needed for it."""
+
+    @abstractmethod
+    async def _decode_partial_single(
+        self, byte_getter: ByteGetter, byte_range: tuple[int, int], chunk_spec: ArraySpec
+    ) -> Buffer | None:
+        """Decodes the bytes ``[start, stop)`` of a chunk.
+
+        Parameters
+        ----------
+        byte_getter : ByteGetter
+            Used to fetch parts of the encoded chunk.
+        byte_range : tuple[int, int]
+            The start and stop offsets in the decoded chunk.
+        chunk_spec : ArraySpec
+
+        Returns
+        -------
+        Buffer | None
+            The decoded bytes of the range or None, if the chunk does not exist.
+        """
+        ...
+
+
+class SyncCodecMixin(Generic[CodecInput, CodecOutput]):
+    """Mixin for codecs that implement synchronous decoding and encoding.
+    Codec pipelines can run the synchronous implementations of a whole chain of codecs
+    for a chunk in a single worker thread, instead of scheduling each codec separately."""
+
+    @abstractmethod
+    def _decode_sync(self, chunk_data: CodecOutput, chunk_spec: ArraySpec) -> CodecInput: ...
+
+    @abstractmethod
+    def _encode_sync(self, chunk_data: CodecInput, chunk_spec: ArraySpec) -> CodecOutput | None: ...
+
+
+class BatchCodecMixin(SyncCodecMixin[CodecInput, CodecOutput]):
+    """Mixin for codecs with kernels that decode and encode a whole batch of chunks in a
+    single call, e.g. to process all chunks with one vectorized operation. The batch is
+    processed by a single call on the event loop or in the compute thread pool, depending on
+    the executor that is configured for the codec (see ``codec_executor``), instead of one
+    task per chunk."""
+
+    @abstractmethod
+    def _decode_batch(
+        self, chunks_and_specs: Sequence[tuple[CodecOutput, ArraySpec]]
+    ) -> list[CodecInput]: ...
+
+    @abstractmethod
+    def _encode_batch(
+        self, chunks_and_specs: Sequence[tuple[CodecInput, ArraySpec]]
+    ) -> list[CodecOutput | None]: ...
+
+
 class CodecPipeline(Metadata):
     """Base class for implementing CodecPipeline.
     A CodecPipeline implements the read and write paths for chunk data.
@@ -376,6 +525,8 @@ class CodecPipeline(Metadata):
             The ByteGetter is used to fetch the necessary bytes.
             The chunk spec contains information about the construction of an array from the bytes.
         out : NDBuffer
+            The output array, which may be uninitialized. Every selected region is written,
+            regions of missing chunks are set to the fill value.
         """
         ...
 
@@ -432,3 +583,77 @@ def _noop_for_none(
         return await func(chunk, chunk_spec)
 
     return wrap
+
+
+_codec_names: dict[type, str] = {}
+
+
+def _codec_executor(codec: object) -> CodecExecutor:
+    # the name of a codec does not depend on its configuration, so it is looked up once per class
+    codec_cls = type(codec)
+    name = _codec_names.get(codec_cls)
+    if name is None:
+        name = _codec_names[codec_cls] = codec.to_dict()["name"]  # type: ignore[attr-defined]
+    return get_codec_executor(name)
+
+
+async def _run_batch(
+    codec: object,
+    func: Callable[[list[tuple[CodecInput, ArraySpec]]], Sequence[CodecOutput | None]],
+    batch_info: Sequence[tuple[CodecInput | None, ArraySpec]],
+) -> list[CodecOutput | None]:
+    """Runs a batch kernel of a codec on the event loop, if the codec is configured for the
+    inline executor, or in the compute thread pool otherwise."""
+    if isinstance(_codec_executor(codec), InlineExecutor):
+        return _apply_to_non_none(func, batch_info)
+    return await to_thread_pool("compute", _apply_to_non_none, func, batch_info)
+
+
+def _apply_to_non_none(
+    func: Callable[[list[tuple[CodecInput, ArraySpec]]], Sequence[CodecOutput | None]],
+    batch_info: Sequence[tuple[CodecInput | None, ArraySpec]],
+) -> list[CodecOutput | None]:
+    indices = [i for i, (chunk, _) in enumerate(batch_info) if chunk is not None]
+    out: list[CodecOutput | None] = [None] * len(batch_info)
+    results = func([batch_info[i] for i in indices])  # type: ignore[misc]
+    for i, result in zip(indices, results, strict=True):
+        out[i] = result
+    return out
+
+
+def _defined_in(codec: object, name: str) -> int:
+    return next(i for i, cls in enumerate(type(codec).__mro__) if name in vars(cls))
+
+
+_implements_sync: dict[type, bool] = {}
+
+
+def _supports_sync(codec: object) -> bool:
+    codec_cls = type(codec)
+    implements_sync = _implements_sync.get(codec_cls)
+    if implements_sync is None:
+        # subclasses that only override the async implementations must not be bypassed
+        implements_sync = _implements_sync[codec_cls] = (
+            isinstance(codec, SyncCodecMixin)
+            and _defined_in(codec, "_decode_sync") <= _defined_in(codec, "_decode_single")
+            and _defined_in(codec, "_encode_sync") <= _defined_in(codec, "_encode_single")
+        )
+    if not implements_sync:
+        return False
+    # codecs that are configured for the process executor keep the per-chunk dispatch
+    return not isinstance(_codec_executor(codec), ProcessExecutor)
+
+
+def _supports_decode_into(codec: object) -> bool:
+    # the hook is only used if it is at least as specialized as the async implementation
+    if isinstance(codec, ArrayBytesCodec):
+        return _defined_in(codec, "_decode_into_view") <= _defined_in(codec, "_decode_single")
+    if isinstance(codec, BytesBytesCodec):
+        return _supports_sync(codec) and _defined_in(codec, "_decode_into") <= _defined_in(
+            codec, "_decode_single"
+        )
+    return False
+
+
+def _supports_batch(codec: object) -> bool:
+    return isinstance(codec, BatchCodecMixin) and _supports_sync(codec)
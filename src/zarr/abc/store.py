@@ -1,13 +1,27 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Hashable, Sequence
 from typing import Any, NamedTuple, Protocol, runtime_checkable
 
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import Self
 
-from zarr.core.buffer import Buffer, BufferPrototype
-from zarr.core.common import AccessModeLiteral, BytesLike
+from zarr.core.buffer import Buffer, BufferPrototype, default_buffer_prototype
+from zarr.core.common import AccessModeLiteral, BytesLike, concurrent_map
+from zarr.core.config import config
 
-__all__ = ["Store", "AccessMode", "ByteGetter", "ByteSetter", "set_or_delete"]
+__all__ = [
+    "Store",
+    "AccessMode",
+    "ByteGetter",
+    "ByteIntoGetter",
+    "ByteRangesGetter",
+    "ByteSetter",
+    "get_many",
+    "set_or_delete",
+    "set_or_delete_many",
+]
 
 
 class AccessMode(NamedTuple):
@@ -93,6 +107,59 @@ class Store(ABC):
         """
         ...
 
+    async def get_into(self, key: str, out: npt.NDArray[np.uint8]) -> bool:
+        """Read the value associated with a given key into a pre-allocated byte array.
+        The default implementation copies the result of ``get`` into ``out``.
+
+        Parameters
+        ----------
+        key : str
+        out : np.ndarray
+            Writable, contiguous uint8 array with the size of the value.
+
+        Returns
+        -------
+        bool
+            False, if the key does not exist.
+
+        Raises
+        ------
+        ValueError
+            If the size of the value does not match the size of ``out``.
+        """
+        value = await self.get(key, default_buffer_prototype())
+        if value is None:
+            return False
+        data = value.as_numpy_array()
+        if data.nbytes != out.nbytes:
+            raise ValueError(
+                f"Value of {key!r} has {data.nbytes} bytes, but the output has {out.nbytes} bytes."
+            )
+        out[:] = data
+        return True
+
+    async def getsize(self, key: str) -> int:
+        """Return the size of the value associated with a given key in bytes.
+        The default implementation reads the whole value.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        FileNotFoundError
+            If the key does not exist.
+        """
+        value = await self.get(key, default_buffer_prototype())
+        if value is None:
+            raise FileNotFoundError(key)
+        return len(value)
+
     @abstractmethod
     async def get_partial_values(
         self,
@@ -112,6 +179,25 @@ class Store(ABC):
         """
         ...
 
+    async def get_many(self, prototype: BufferPrototype, keys: list[str]) -> list[Buffer | None]:
+        """Retrieve the values of several keys. Stores that can read many keys in one request
+        should override the default implementation, which calls ``get`` for each key.
+
+        Parameters
+        ----------
+        prototype : BufferPrototype
+        keys : list[str]
+
+        Returns
+        -------
+        list of values, in the order of the keys, with None for missing keys
+        """
+
+        async def _get(key: str) -> Buffer | None:
+            return await self.get(key, prototype)
+
+        return await concurrent_map([(key,) for key in keys], _get, config.get("async.concurrency"))
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if a key exists in the store.
@@ -153,6 +239,26 @@ class Store(ABC):
         """
         ...
 
+    async def set_many(self, key_values: list[tuple[str, Buffer]]) -> None:
+        """Store several (key, value) pairs. Stores that can write many keys in one request
+        should override the default implementation, which calls ``set`` for each pair.
+
+        Parameters
+        ----------
+        key_values : list[tuple[str, Buffer]]
+        """
+        await concurrent_map(key_values, self.set, config.get("async.concurrency"))
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Remove several keys from the store. Stores that can delete many keys in one request
+        should override the default implementation, which calls ``delete`` for each key.
+
+        Parameters
+        ----------
+        keys : list[str]
+        """
+        await concurrent_map([(key,) for key in keys], self.delete, config.get("async.concurrency"))
+
     @property
     @abstractmethod
     def supports_partial_writes(self) -> bool:
@@ -231,6 +337,18 @@ class ByteGetter(Protocol):
     ) -> Buffer | None: ...
 
 
+@runtime_checkable
+class ByteIntoGetter(Protocol):
+    async def get_into(self, out: npt.NDArray[np.uint8]) -> bool: ...
+
+
+@runtime_checkable
+class ByteRangesGetter(Protocol):
+    async def get_partial_values(
+        self, prototype: BufferPrototype, byte_ranges: list[tuple[int | None, int | None]]
+    ) -> list[Buffer | None]: ...
+
+
 @runtime_checkable
 class ByteSetter(Protocol):
     async def get(
@@ -242,8 +360,123 @@ class ByteSetter(Protocol):
     async def delete(self) -> None: ...
 
 
+def _specializes(store: Store, method: str, base_method: str) -> bool:
+    # stores that only override `base_method` must not be bypassed by an inherited `method`
+    mro = type(store).__mro__
+
+    def _defined_in(name: str) -> int:
+        return next(i for i, cls in enumerate(mro) if name in vars(cls))
+
+    return _defined_in(method) <= _defined_in(base_method)
+
+
+def _specializes_get_into(store: Store) -> bool:
+    return _specializes(store, "get_into", "get")
+
+
 async def set_or_delete(byte_setter: ByteSetter, value: Buffer | None) -> None:
     if value is None:
         await byte_setter.delete()
     else:
         await byte_setter.set(value)
+
+
+def _group_by_store(items: Sequence[object]) -> tuple[dict[int, list[int]], list[int]]:
+    # byte getters with the `store` and `path` of a StorePath can be batched per store
+    groups: dict[int, list[int]] = {}
+    others = []
+    for i, item in enumerate(items):
+        store = getattr(item, "store", None)
+        if isinstance(store, Store) and isinstance(getattr(item, "path", None), str):
+            groups.setdefault(id(store), []).append(i)
+        else:
+            others.append(i)
+    return groups, others
+
+
+async def get_many(
+    byte_getters: Sequence[ByteGetter], prototypes: Sequence[BufferPrototype]
+) -> list[Buffer | None]:
+    """Retrieve the values of several byte getters, with one ``Store.get_many`` call per store
+    and prototype for StorePaths."""
+    values: list[Buffer | None] = [None] * len(byte_getters)
+    groups, others = _group_by_store(byte_getters)
+    requests: list[Awaitable[None]] = []
+    for indices in groups.values():
+        by_prototype: dict[Hashable, list[int]] = {}
+        for i in indices:
+            by_prototype.setdefault(prototypes[i], []).append(i)
+        for same_prototype in by_prototype.values():
+            requests.append(_get_group(byte_getters, prototypes, same_prototype, values))
+    if others:
+        requests.append(_get_each(byte_getters, prototypes, others, values))
+    await asyncio.gather(*requests)
+    return values
+
+
+async def _get_group(
+    byte_getters: Sequence[ByteGetter],
+    prototypes: Sequence[BufferPrototype],
+    indices: list[int],
+    values: list[Buffer | None],
+) -> None:
+    store: Store = byte_getters[indices[0]].store  # type: ignore[attr-defined]
+    paths = [byte_getters[i].path for i in indices]  # type: ignore[attr-defined]
+    prototype = prototypes[indices[0]]
+    if _specializes(store, "get_many", "get"):
+        group_values = await store.get_many(prototype, paths)
+    else:
+        group_values = await Store.get_many(store, prototype, paths)
+    for i, value in zip(indices, group_values, strict=True):
+        values[i] = value
+
+
+async def _get_each(
+    byte_getters: Sequence[ByteGetter],
+    prototypes: Sequence[BufferPrototype],
+    indices: list[int],
+    values: list[Buffer | None],
+) -> None:
+    async def _get(i: int) -> None:
+        values[i] = await byte_getters[i].get(prototypes[i])
+
+    await concurrent_map([(i,) for i in indices], _get, config.get("async.concurrency"))
+
+
+async def set_or_delete_many(
+    byte_setters: Sequence[ByteSetter], values: Sequence[Buffer | None]
+) -> None:
+    """Store or, for None, delete the values of several byte setters, with one
+    ``Store.set_many`` and one ``Store.delete_many`` call per store for StorePaths."""
+    groups, others = _group_by_store(byte_setters)
+    requests: list[Awaitable[Any]] = []
+    for indices in groups.values():
+        store: Store = byte_setters[indices[0]].store  # type: ignore[attr-defined]
+        key_values = []
+        deleted = []
+        for i in indices:
+            path: str = byte_setters[i].path  # type: ignore[attr-defined]
+            value = values[i]
+            if value is None:
+                deleted.append(path)
+            else:
+                key_values.append((path, value))
+        if key_values:
+            if _specializes(store, "set_many", "set"):
+                requests.append(store.set_many(key_values))
+            else:
+                requests.append(Store.set_many(store, key_values))
+        if deleted:
+            if _specializes(store, "delete_many", "delete"):
+                requests.append(store.delete_many(deleted))
+            else:
+                requests.append(Store.delete_many(store, deleted))
+    if others:
+        requests.append(
+            concurrent_map(
+                [(byte_setters[i], values[i]) for i in others],
+                set_or_delete,
+                config.get("async.concurrency"),
+            )
+        )
+    await asyncio.gather(*requests)
@@ -4,7 +4,7 @@ from zarr.codecs.blosc import BloscCname, BloscCodec, BloscShuffle
 from zarr.codecs.bytes import BytesCodec, Endian
 from zarr.codecs.crc32c_ import Crc32cCodec
 from zarr.codecs.gzip import GzipCodec
-from zarr.codecs.pipeline import BatchedCodecPipeline
+from zarr.codecs.pipeline import BatchedCodecPipeline, StreamingCodecPipeline
 from zarr.codecs.sharding import ShardingCodec, ShardingCodecIndexLocation
 from zarr.codecs.transpose import TransposeCodec
 from zarr.codecs.zstd import ZstdCodec
@@ -20,6 +20,7 @@ __all__ = [
     "GzipCodec",
     "ShardingCodec",
     "ShardingCodecIndexLocation",
+    "StreamingCodecPipeline",
     "TransposeCodec",
     "ZstdCodec",
 ]
@@ -8,7 +8,8 @@ from numcodecs.compat import ensure_bytes, ensure_ndarray
 from zarr.abc.codec import ArrayArrayCodec, ArrayBytesCodec
 from zarr.core.array_spec import ArraySpec
 from zarr.core.buffer import Buffer, NDBuffer, default_buffer_prototype
-from zarr.core.common import JSON, to_thread
+from zarr.core.common import JSON
+from zarr.core.executor import get_codec_executor
 from zarr.registry import get_ndbuffer_class
 
 
@@ -25,8 +26,8 @@ class V2Compressor(ArrayBytesCodec):
     ) -> NDBuffer:
         if self.compressor is not None:
             compressor = numcodecs.get_codec(self.compressor)
-            chunk_numpy_array = ensure_ndarray(
-                await to_thread(compressor.decode, chunk_bytes.as_array_like())
+            chunk_numpy_array = await get_codec_executor(compressor.codec_id).run(
+                compressor.decode, chunk_bytes.as_numpy_array()
             )
         else:
             chunk_numpy_array = ensure_ndarray(chunk_bytes.as_array_like())
@@ -51,7 +52,9 @@ class V2Compressor(ArrayBytesCodec):
             ):
                 chunk_numpy_array = chunk_numpy_array.copy(order="A")
             encoded_chunk_bytes = ensure_bytes(
-                await to_thread(compressor.encode, chunk_numpy_array)
+                await get_codec_executor(compressor.codec_id).run(
+                    compressor.encode, chunk_numpy_array
+                )
             )
         else:
             encoded_chunk_bytes = ensure_bytes(chunk_numpy_array)
@@ -73,12 +76,15 @@ class V2Filters(ArrayArrayCodec):
         chunk_array: NDBuffer,
         chunk_spec: ArraySpec,
     ) -> NDBuffer:
-        chunk_ndarray = chunk_array.as_ndarray_like()
+        # numcodecs filters run on host memory
+        chunk_ndarray = chunk_array.as_numpy_array()
         # apply filters in reverse order
         if self.filters is not None:
             for filter_metadata in self.filters[::-1]:
                 filter = numcodecs.get_codec(filter_metadata)
-                chunk_ndarray = await to_thread(filter.decode, chunk_ndarray)
+                chunk_ndarray = await get_codec_executor(filter.codec_id).run(
+                    filter.decode, chunk_ndarray
+                )
 
         # ensure correct chunk shape
         if chunk_ndarray.shape != chunk_spec.shape:
@@ -94,11 +100,13 @@ class V2Filters(ArrayArrayCodec):
         chunk_array: NDBuffer,
         chunk_spec: ArraySpec,
     ) -> NDBuffer | None:
-        chunk_ndarray = chunk_array.as_ndarray_like().ravel(order=chunk_spec.order)
+        chunk_ndarray = chunk_array.as_numpy_array().ravel(order=chunk_spec.order)
 
         for filter_metadata in self.filters:
             filter = numcodecs.get_codec(filter_metadata)
-            chunk_ndarray = await to_thread(filter.encode, chunk_ndarray)
+            chunk_ndarray = await get_codec_executor(filter.codec_id).run(
+                filter.encode, chunk_ndarray
+            )
 
         return get_ndbuffer_class().from_ndarray_like(chunk_ndarray)
 
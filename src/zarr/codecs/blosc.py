@@ -2,21 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, partial
 from typing import TYPE_CHECKING
 
 import numcodecs
+import numpy as np
 from numcodecs.blosc import Blosc
 
-from zarr.abc.codec import BytesBytesCodec
+from zarr.abc.codec import BytesBytesCodec, BytesBytesCodecPartialDecodeMixin, SyncCodecMixin
 from zarr.core.array_spec import ArraySpec
-from zarr.core.buffer import Buffer, as_numpy_array_wrapper
-from zarr.core.common import JSON, parse_enum, parse_named_configuration, to_thread
+from zarr.core.buffer import Buffer
+from zarr.core.common import JSON, parse_enum, parse_named_configuration, product
+from zarr.core.executor import get_codec_executor
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing_extensions import Self
 
+    from zarr.abc.store import ByteGetter
+
 
 class BloscShuffle(Enum):
     noshuffle = "noshuffle"
@@ -47,6 +52,13 @@ class BloscCname(Enum):
 # See https://zarr.readthedocs.io/en/stable/tutorial.html#configuring-blosc
 numcodecs.blosc.use_threads = False
 
+# Size of the header of a blosc buffer. It is followed by the offsets of the compressed blocks,
+# unless the data was stored without compression (memcpyed).
+BLOSC_HEADER_SIZE = 16
+# Lower bound of the block size that blosc picks when no block size is set, used to estimate the
+# number of block offsets that follow the header.
+BLOSC_MIN_AUTO_BLOCKSIZE = 2**13
+
 
 def parse_typesize(data: JSON) -> int:
     if isinstance(data, int):
@@ -72,8 +84,14 @@ def parse_blocksize(data: JSON) -> int:
     raise TypeError(f"Value should be an int. Got {type(data)} instead.")
 
 
+def _decompress_partial(start: int, nitems: int, data: npt.NDArray[np.uint8]) -> bytes:
+    return numcodecs.blosc.decompress_partial(data, start, nitems)  # type: ignore[no-any-return]
+
+
 @dataclass(frozen=True)
-class BloscCodec(BytesBytesCodec):
+class BloscCodec(
+    BytesBytesCodec, BytesBytesCodecPartialDecodeMixin, SyncCodecMixin[Buffer, Buffer]
+):
     is_fixed_size = False
 
     typesize: int | None
@@ -159,9 +177,10 @@ class BloscCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await to_thread(
-            as_numpy_array_wrapper, self._blosc_codec.decode, chunk_bytes, chunk_spec.prototype
+        chunk = await get_codec_executor("blosc").run(
+            self._blosc_codec.decode, chunk_bytes.as_numpy_array()
         )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
 
     async def _encode_single(
         self,
@@ -170,12 +189,101 @@ class BloscCodec(BytesBytesCodec):
     ) -> Buffer | None:
         # Since blosc only support host memory, we convert the input and output of the encoding
         # between numpy array and buffer
-        return await to_thread(
-            lambda chunk: chunk_spec.prototype.buffer.from_bytes(
-                self._blosc_codec.encode(chunk.as_numpy_array())
-            ),
-            chunk_bytes,
+        chunk = await get_codec_executor("blosc").run(
+            self._blosc_codec.encode, chunk_bytes.as_numpy_array()
+        )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
+
+    def _decode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer:
+        return chunk_spec.prototype.buffer.from_bytes(
+            self._blosc_codec.decode(chunk_bytes.as_numpy_array())
+        )
+
+    def _decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> bool:
+        data = chunk_bytes.as_numpy_array()
+        if numcodecs.blosc.cbuffer_sizes(data)[0] != out.nbytes:
+            return False
+        self._blosc_codec.decode(data, out=out)
+        return True
+
+    def _encode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer | None:
+        return chunk_spec.prototype.buffer.from_bytes(
+            self._blosc_codec.encode(chunk_bytes.as_numpy_array())
+        )
+
+    async def _decode_partial_single(
+        self, byte_getter: ByteGetter, byte_range: tuple[int, int], chunk_spec: ArraySpec
+    ) -> Buffer | None:
+        # Reads the header and the block offsets with one request and then only the compressed
+        # blocks that overlap with `byte_range`. Blocks that are not needed are left
+        # uninitialized in the reassembled buffer, because blosc only touches the blocks it
+        # decompresses.
+        prototype = chunk_spec.prototype
+        chunk_nbytes = product(chunk_spec.shape) * chunk_spec.dtype.itemsize
+        max_nblocks = -(-chunk_nbytes // (self.blocksize or BLOSC_MIN_AUTO_BLOCKSIZE))
+        prefix_buf = await byte_getter.get(
+            prototype, byte_range=(0, BLOSC_HEADER_SIZE + max_nblocks * 4)
+        )
+        if prefix_buf is None:
+            return None
+        prefix = prefix_buf.as_numpy_array()
+        header = prefix[:BLOSC_HEADER_SIZE]
+        nbytes, cbytes, blocksize = numcodecs.blosc.cbuffer_sizes(header)
+        typesize, _, memcpyed = numcodecs.blosc.cbuffer_metainfo(header)
+        start, stop = min(byte_range[0], nbytes), min(byte_range[1], nbytes)
+        if start >= stop:
+            return prototype.buffer.create_zero_length()
+
+        if memcpyed:
+            return await byte_getter.get(
+                prototype, byte_range=(BLOSC_HEADER_SIZE + start, stop - start)
+            )
+
+        nblocks = -(-nbytes // blocksize)
+        if nblocks == 1 or nbytes % typesize != 0:
+            chunk_bytes = await byte_getter.get(prototype)
+            if chunk_bytes is None:
+                return None
+            return (await self._decode_single(chunk_bytes, chunk_spec))[start:stop]
+
+        bstarts_stop = BLOSC_HEADER_SIZE + nblocks * 4
+        if len(prefix) < bstarts_stop:
+            # blocks are smaller than expected
+            rest_buf = await byte_getter.get(
+                prototype, byte_range=(len(prefix), bstarts_stop - len(prefix))
+            )
+            if rest_buf is None:
+                return None
+            prefix = np.concatenate([prefix, rest_buf.as_numpy_array()])
+        prefix = prefix[:bstarts_stop]
+        bstarts = prefix[BLOSC_HEADER_SIZE:].view("<i4")
+        bends = np.append(np.sort(bstarts), cbytes)
+        needed = bstarts[start // blocksize : (stop - 1) // blocksize + 1]
+        data_start = int(needed.min())
+        data_stop = int(bends[np.searchsorted(bends, needed.max(), side="right")])
+        data_buf = await byte_getter.get(prototype, byte_range=(data_start, data_stop - data_start))
+        if data_buf is None:
+            return None
+
+        compressed = np.empty(cbytes, dtype=np.uint8)
+        compressed[:bstarts_stop] = prefix
+        compressed[data_start:data_stop] = data_buf.as_numpy_array()
+        item_start, item_stop = start // typesize, -(-stop // typesize)
+        decoded = await get_codec_executor("blosc").run(
+            partial(_decompress_partial, item_start, item_stop - item_start), compressed
         )
+        offset = start - item_start * typesize
+        return prototype.buffer.from_array_like(decoded.view("b"))[offset : offset + stop - start]
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
         raise NotImplementedError
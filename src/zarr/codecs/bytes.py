@@ -3,17 +3,20 @@ from __future__ import annotations
 import sys
 from dataclasses import dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from zarr.abc.codec import ArrayBytesCodec
+from zarr.abc.codec import ArrayBytesCodec, BatchCodecMixin
 from zarr.core.array_spec import ArraySpec
 from zarr.core.buffer import Buffer, NDArrayLike, NDBuffer
 from zarr.core.common import JSON, parse_enum, parse_named_configuration
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
     from typing_extensions import Self
 
 
@@ -26,7 +29,7 @@ default_system_endian = Endian(sys.byteorder)
 
 
 @dataclass(frozen=True)
-class BytesCodec(ArrayBytesCodec):
+class BytesCodec(ArrayBytesCodec, BatchCodecMixin[NDBuffer, Buffer]):
     is_fixed_size = True
 
     endian: Endian | None
@@ -65,18 +68,42 @@ class BytesCodec(ArrayBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> NDBuffer:
-        assert isinstance(chunk_bytes, Buffer)
+        return self._decode_sync(chunk_bytes, chunk_spec)
+
+    def _decoded_dtype(self, chunk_spec: ArraySpec) -> np.dtype[Any]:
         if chunk_spec.dtype.itemsize > 0:
             if self.endian == Endian.little:
                 prefix = "<"
             else:
                 prefix = ">"
-            dtype = np.dtype(f"{prefix}{chunk_spec.dtype.str[1:]}")
-        else:
-            dtype = np.dtype(f"|{chunk_spec.dtype.str[1:]}")
+            return np.dtype(f"{prefix}{chunk_spec.dtype.str[1:]}")
+        return np.dtype(f"|{chunk_spec.dtype.str[1:]}")
 
+    def _decode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> NDBuffer:
+        return self._decode_as(chunk_bytes, chunk_spec, self._decoded_dtype(chunk_spec))
+
+    def _decode_batch(self, chunks_and_specs: Sequence[tuple[Buffer, ArraySpec]]) -> list[NDBuffer]:
+        # the decoded data type is resolved once per data type of the batch
+        dtypes: dict[np.dtype[Any], np.dtype[Any]] = {}
+        out = []
+        for chunk_bytes, chunk_spec in chunks_and_specs:
+            dtype = dtypes.get(chunk_spec.dtype)
+            if dtype is None:
+                dtype = dtypes[chunk_spec.dtype] = self._decoded_dtype(chunk_spec)
+            out.append(self._decode_as(chunk_bytes, chunk_spec, dtype))
+        return out
+
+    def _decode_as(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, dtype: np.dtype[Any]
+    ) -> NDBuffer:
+        assert isinstance(chunk_bytes, Buffer)
         as_array_like = chunk_bytes.as_array_like()
-        if isinstance(as_array_like, NDArrayLike):
+        # checking against the NDArrayLike protocol is slow, so arrays are checked first
+        if isinstance(as_array_like, np.ndarray | NDArrayLike):
             as_nd_array_like = as_array_like
         else:
             as_nd_array_like = np.asanyarray(as_array_like)
@@ -91,12 +118,52 @@ class BytesCodec(ArrayBytesCodec):
             )
         return chunk_array
 
+    def _decode_into_view(
+        self, out: NDBuffer, chunk_spec: ArraySpec
+    ) -> npt.NDArray[np.uint8] | None:
+        array = out.as_ndarray_like()
+        if (
+            not isinstance(array, np.ndarray)
+            or array.shape != chunk_spec.shape
+            or not array.flags.c_contiguous
+            or not array.flags.writeable
+            or chunk_spec.dtype.itemsize == 0
+            or array.dtype != self._decoded_dtype(chunk_spec)
+        ):
+            return None
+        return array.reshape(-1).view(np.uint8)
+
     async def _encode_single(
         self,
         chunk_array: NDBuffer,
         chunk_spec: ArraySpec,
     ) -> Buffer | None:
-        assert isinstance(chunk_array, NDBuffer)
+        return self._encode_sync(chunk_array, chunk_spec)
+
+    def _encode_sync(
+        self,
+        chunk_array: NDBuffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer | None:
+        return self._encode_as(chunk_array, chunk_spec, self._encoded_dtype(chunk_array))
+
+    def _encode_batch(
+        self, chunks_and_specs: Sequence[tuple[NDBuffer, ArraySpec]]
+    ) -> list[Buffer | None]:
+        # the encoded data type is resolved once per data type of the batch
+        dtypes: dict[np.dtype[Any], np.dtype[Any] | None] = {}
+        out: list[Buffer | None] = []
+        for chunk_array, chunk_spec in chunks_and_specs:
+            if chunk_array.dtype in dtypes:
+                dtype = dtypes[chunk_array.dtype]
+            else:
+                dtype = dtypes[chunk_array.dtype] = self._encoded_dtype(chunk_array)
+            out.append(self._encode_as(chunk_array, chunk_spec, dtype))
+        return out
+
+    def _encoded_dtype(self, chunk_array: NDBuffer) -> np.dtype[Any] | None:
+        """Returns the data type with the byte order of the codec, if it differs from the
+        byte order of the chunk, or None otherwise."""
         if (
             chunk_array.dtype.itemsize > 1
             and self.endian is not None
@@ -104,8 +171,15 @@ class BytesCodec(ArrayBytesCodec):
         ):
             # type-ignore is a numpy bug
             # see https://github.com/numpy/numpy/issues/26473
-            new_dtype = chunk_array.dtype.newbyteorder(self.endian.name)  # type: ignore[arg-type]
-            chunk_array = chunk_array.astype(new_dtype)
+            return chunk_array.dtype.newbyteorder(self.endian.name)  # type: ignore[arg-type]
+        return None
+
+    def _encode_as(
+        self, chunk_array: NDBuffer, chunk_spec: ArraySpec, dtype: np.dtype[Any] | None
+    ) -> Buffer:
+        assert isinstance(chunk_array, NDBuffer)
+        if dtype is not None:
+            chunk_array = chunk_array.astype(dtype)
 
         nd_array = chunk_array.as_ndarray_like()
         # Flatten the nd-array (only copy if needed) and reinterpret as bytes
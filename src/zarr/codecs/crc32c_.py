@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+import numpy.typing as npt
 from crc32c import crc32c
 
-from zarr.abc.codec import BytesBytesCodec
+from zarr.abc.codec import BatchCodecMixin, BytesBytesCodec
 from zarr.core.array_spec import ArraySpec
 from zarr.core.buffer import Buffer
 from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.executor import get_codec_executor
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from typing_extensions import Self
 
 
+def _compute_checksum(data: npt.NDArray[Any]) -> npt.NDArray[np.uint32]:
+    return np.array([crc32c(data)], dtype=np.uint32)
+
+
+def _check_checksum(stored_checksum: bytes, computed_checksum: bytes) -> None:
+    if computed_checksum != stored_checksum:
+        raise ValueError(
+            f"Stored and computed checksum do not match. Stored: {stored_checksum!r}. Computed: {computed_checksum!r}."
+        )
+
+
 @dataclass(frozen=True)
-class Crc32cCodec(BytesBytesCodec):
+class Crc32cCodec(BytesBytesCodec, BatchCodecMixin[Buffer, Buffer]):
     is_fixed_size = True
 
     @classmethod
@@ -37,12 +52,10 @@ class Crc32cCodec(BytesBytesCodec):
         crc32_bytes = data[-4:]
         inner_bytes = data[:-4]
 
-        computed_checksum = np.uint32(crc32c(inner_bytes)).tobytes()
-        stored_checksum = bytes(crc32_bytes)
-        if computed_checksum != stored_checksum:
-            raise ValueError(
-                f"Stored and computed checksum do not match. Stored: {stored_checksum!r}. Computed: {computed_checksum!r}."
-            )
+        computed_checksum = (
+            await get_codec_executor("crc32c").run(_compute_checksum, inner_bytes)
+        ).tobytes()
+        _check_checksum(bytes(crc32_bytes), computed_checksum)
         return chunk_spec.prototype.buffer.from_array_like(inner_bytes)
 
     async def _encode_single(
@@ -52,10 +65,43 @@ class Crc32cCodec(BytesBytesCodec):
     ) -> Buffer | None:
         data = chunk_bytes.as_numpy_array()
         # Calculate the checksum and "cast" it to a numpy array
-        checksum = np.array([crc32c(data)], dtype=np.uint32)
+        checksum = await get_codec_executor("crc32c").run(_compute_checksum, data)
         # Append the checksum (as bytes) to the data
         return chunk_spec.prototype.buffer.from_array_like(np.append(data, checksum.view("b")))
 
+    def _decode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer:
+        data = chunk_bytes.as_numpy_array()
+        inner_bytes = data[:-4]
+        _check_checksum(bytes(data[-4:]), _compute_checksum(inner_bytes).tobytes())
+        return chunk_spec.prototype.buffer.from_array_like(inner_bytes)
+
+    def _encode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer | None:
+        data = chunk_bytes.as_numpy_array()
+        checksum = _compute_checksum(data)
+        return chunk_spec.prototype.buffer.from_array_like(np.append(data, checksum.view("b")))
+
+    def _decode_batch(self, chunks_and_specs: Sequence[tuple[Buffer, ArraySpec]]) -> list[Buffer]:
+        return [
+            self._decode_sync(chunk_bytes, chunk_spec)
+            for chunk_bytes, chunk_spec in chunks_and_specs
+        ]
+
+    def _encode_batch(
+        self, chunks_and_specs: Sequence[tuple[Buffer, ArraySpec]]
+    ) -> list[Buffer | None]:
+        return [
+            self._encode_sync(chunk_bytes, chunk_spec)
+            for chunk_bytes, chunk_spec in chunks_and_specs
+        ]
+
     def compute_encoded_size(self, input_byte_length: int, _chunk_spec: ArraySpec) -> int:
         return input_byte_length + 4
 
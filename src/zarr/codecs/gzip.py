@@ -5,13 +5,16 @@ from typing import TYPE_CHECKING
 
 from numcodecs.gzip import GZip
 
-from zarr.abc.codec import BytesBytesCodec
+from zarr.abc.codec import BytesBytesCodec, SyncCodecMixin
 from zarr.core.array_spec import ArraySpec
-from zarr.core.buffer import Buffer, as_numpy_array_wrapper
-from zarr.core.common import JSON, parse_named_configuration, to_thread
+from zarr.core.buffer import Buffer
+from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.executor import get_codec_executor
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
     from typing_extensions import Self
 
 
@@ -26,7 +29,7 @@ def parse_gzip_level(data: JSON) -> int:
 
 
 @dataclass(frozen=True)
-class GzipCodec(BytesBytesCodec):
+class GzipCodec(BytesBytesCodec, SyncCodecMixin[Buffer, Buffer]):
     is_fixed_size = False
 
     level: int = 5
@@ -49,17 +52,47 @@ class GzipCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await to_thread(
-            as_numpy_array_wrapper, GZip(self.level).decode, chunk_bytes, chunk_spec.prototype
+        chunk = await get_codec_executor("gzip").run(
+            GZip(self.level).decode, chunk_bytes.as_numpy_array()
         )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
 
     async def _encode_single(
         self,
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer | None:
-        return await to_thread(
-            as_numpy_array_wrapper, GZip(self.level).encode, chunk_bytes, chunk_spec.prototype
+        chunk = await get_codec_executor("gzip").run(
+            GZip(self.level).encode, chunk_bytes.as_numpy_array()
+        )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
+
+    def _decode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer:
+        return chunk_spec.prototype.buffer.from_bytes(
+            GZip(self.level).decode(chunk_bytes.as_numpy_array())
+        )
+
+    def _decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> bool:
+        data = chunk_bytes.as_numpy_array()
+        # the gzip trailer holds the decompressed size modulo 2**32
+        if len(data) < 4 or int.from_bytes(data[-4:].tobytes(), "little") != out.nbytes % 2**32:
+            return False
+        GZip(self.level).decode(data, out=out)
+        return True
+
+    def _encode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer | None:
+        return chunk_spec.prototype.buffer.from_bytes(
+            GZip(self.level).encode(chunk_bytes.as_numpy_array())
         )
 
     def compute_encoded_size(
@@ -1,31 +1,61 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
 from itertools import islice, pairwise
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from warnings import warn
 
 import numpy as np
 
 from zarr.abc.codec import (
     ArrayArrayCodec,
+    ArrayArrayCodecPartialMixin,
     ArrayBytesCodec,
     ArrayBytesCodecPartialDecodeMixin,
     ArrayBytesCodecPartialEncodeMixin,
+    BatchCodecMixin,
     BytesBytesCodec,
+    BytesBytesCodecPartialDecodeMixin,
     Codec,
     CodecPipeline,
+    SyncCodecMixin,
+    _apply_to_non_none,
+    _codec_executor,
+    _supports_batch,
+    _supports_decode_into,
+    _supports_sync,
 )
-from zarr.abc.store import ByteGetter, ByteSetter
+from zarr.abc.store import (
+    ByteGetter,
+    ByteIntoGetter,
+    ByteSetter,
+    get_many,
+    set_or_delete_many,
+)
+from zarr.codecs.bytes import BytesCodec
 from zarr.core.buffer import Buffer, BufferPrototype, NDBuffer
 from zarr.core.chunk_grids import ChunkGrid
-from zarr.core.common import JSON, ChunkCoords, concurrent_map, parse_named_configuration
+from zarr.core.common import (
+    JSON,
+    ChunkCoords,
+    concurrent_map,
+    parse_named_configuration,
+    product,
+)
 from zarr.core.config import config
+from zarr.core.executor import InlineExecutor, to_thread_pool
 from zarr.core.indexing import SelectorTuple, is_scalar, is_total_slice
 from zarr.registry import get_codec_class, register_pipeline
+from zarr.store.common import StorePath
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing_extensions import Self
 
     from zarr.core.array_spec import ArraySpec
@@ -51,6 +81,228 @@ def batched(iterable: Iterable[T], n: int) -> Iterable[tuple[T, ...]]:
         yield batch
 
 
+_STOP = object()
+
+# Upper bound of in-flight mini-batches for auto-tuned pipelines, if `async.concurrency`
+# is not set.
+_AUTO_MAX_CONCURRENCY = 64
+
+
+async def _run_stages(
+    items: Iterable[Any],
+    stages: list[Callable[[Any], Awaitable[Any]]],
+    concurrency: int,
+    queue_size: int,
+) -> None:
+    """Streams `items` through a chain of async `stages`.
+
+    Each stage is served by `concurrency` workers and stages are connected by bounded
+    queues of `queue_size` items. An item moves on to the next stage as soon as the
+    current stage has processed it, so that I/O-bound and CPU-bound stages overlap.
+    The results of the last stage are discarded."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least one")
+    queues: list[asyncio.Queue[Any]] = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+
+    async def _feed() -> None:
+        for item in items:
+            await queues[0].put(item)
+        for _ in range(concurrency):
+            await queues[0].put(_STOP)
+
+    async def _work(stage: Callable[[Any], Awaitable[Any]], i: int) -> None:
+        while (item := await queues[i].get()) is not _STOP:
+            result = await stage(item)
+            if i + 1 < len(queues):
+                await queues[i + 1].put(result)
+
+    async def _run_stage(stage: Callable[[Any], Awaitable[Any]], i: int) -> None:
+        workers = [asyncio.ensure_future(_work(stage, i)) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        if i + 1 < len(queues):
+            for _ in range(concurrency):
+                await queues[i + 1].put(_STOP)
+
+    tasks = [
+        asyncio.ensure_future(_feed()),
+        *[asyncio.ensure_future(_run_stage(stage, i)) for i, stage in enumerate(stages)],
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()  # re-raises the first exception, if any
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@dataclass
+class _StageTimings:
+    """Accumulated time spent in the I/O and the compute stages of a mini-batch."""
+
+    io: float = 0.0
+    compute: float = 0.0
+
+    @contextmanager
+    def measure(self, stage: Literal["io", "compute"]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if stage == "io":
+                self.io += elapsed
+            else:
+                self.compute += elapsed
+
+
+# Set for the tasks of an auto-tuned read or write, so that the stages of a mini-batch
+# can report their timings.
+_stage_timings: ContextVar[_StageTimings] = ContextVar("_stage_timings")
+
+
+@contextmanager
+def _measure_stage(stage: Literal["io", "compute"]) -> Iterator[None]:
+    timings = _stage_timings.get(None)
+    if timings is None:
+        yield
+    else:
+        with timings.measure(stage):
+            yield
+
+
+@dataclass
+class _AdaptiveBatchTuner:
+    """Hill-climbing controller for the mini-batch size and the number of in-flight
+    mini-batches.
+
+    The tuner measures the throughput (chunks per second) over windows of completed
+    mini-batches. While the throughput improves, it keeps growing one of the two knobs:
+    the concurrency when the I/O stage dominates, the batch size when the compute stage
+    dominates. When a change lowers the throughput, it is reverted and the knob is not
+    grown any further. Both knobs are bounded, so that the decoded chunks held in memory
+    stay below `memory_limit` bytes."""
+
+    chunk_nbytes: int
+    memory_limit: int
+    max_concurrency: int
+    batch_size: int = 1
+    concurrency: int = 1
+    _window_start: float = field(default_factory=time.perf_counter)
+    _window_chunks: int = 0
+    _window_batches: int = 0
+    _window_timings: _StageTimings = field(default_factory=_StageTimings)
+    _last_throughput: float | None = None
+    _last_change: Literal["batch_size", "concurrency"] | None = None
+    _settled: set[str] = field(default_factory=set)
+
+    def _fits(self, batch_size: int, concurrency: int) -> bool:
+        return batch_size * concurrency * max(self.chunk_nbytes, 1) <= self.memory_limit
+
+    def record(self, num_chunks: int, timings: _StageTimings) -> None:
+        """Records a completed mini-batch and adjusts the knobs at the end of a window."""
+        self._window_chunks += num_chunks
+        self._window_batches += 1
+        self._window_timings.io += timings.io
+        self._window_timings.compute += timings.compute
+        if self._window_batches < max(2, self.concurrency):
+            return
+
+        elapsed = time.perf_counter() - self._window_start
+        throughput = self._window_chunks / max(elapsed, 1e-9)
+        io_bound = self._window_timings.io >= self._window_timings.compute
+        self._window_start = time.perf_counter()
+        self._window_chunks = 0
+        self._window_batches = 0
+        self._window_timings = _StageTimings()
+
+        if self._last_throughput is not None and self._last_change is not None:
+            if throughput < self._last_throughput * 0.95:
+                # the last change made things worse: revert it
+                self._settled.add(self._last_change)
+                if self._last_change == "batch_size":
+                    self.batch_size = max(1, self.batch_size // 2)
+                else:
+                    self.concurrency = max(1, self.concurrency // 2)
+                self._last_change = None
+                return
+            if throughput < self._last_throughput * 1.05:
+                # no significant gain from the last change
+                self._settled.add(self._last_change)
+        self._last_throughput = throughput
+        self._grow(io_bound)
+
+    def _grow(self, io_bound: bool) -> None:
+        knobs: list[Literal["batch_size", "concurrency"]] = (
+            ["concurrency", "batch_size"] if io_bound else ["batch_size", "concurrency"]
+        )
+        for knob in knobs:
+            if knob in self._settled:
+                continue
+            if knob == "concurrency":
+                concurrency = min(self.concurrency * 2, self.max_concurrency)
+                if concurrency > self.concurrency and self._fits(self.batch_size, concurrency):
+                    self.concurrency = concurrency
+                    self._last_change = knob
+                    return
+            else:
+                batch_size = self.batch_size * 2
+                if self._fits(batch_size, self.concurrency):
+                    self.batch_size = batch_size
+                    self._last_change = knob
+                    return
+            self._settled.add(knob)
+        self._last_change = None
+
+
+def _selection_byte_range(
+    selection: SelectorTuple, chunk_spec: ArraySpec
+) -> tuple[int, int] | None:
+    """Returns the byte range of a C-ordered chunk that contains all elements of a basic
+    selection. Returns None for other selections and empty selections."""
+    itemsize = chunk_spec.dtype.itemsize
+    if itemsize == 0 or not isinstance(selection, tuple) or len(selection) != len(chunk_spec.shape):
+        return None
+    first = last = 0
+    for dim_sel, dim_len in zip(selection, chunk_spec.shape, strict=True):
+        if isinstance(dim_sel, int | np.integer):
+            dim_first = dim_last = int(dim_sel)
+        elif isinstance(dim_sel, slice):
+            start, stop, step = dim_sel.indices(dim_len)
+            if step < 1 or start >= stop:
+                return None
+            dim_first, dim_last = start, start + (stop - start - 1) // step * step
+        else:
+            return None
+        first = first * dim_len + dim_first
+        last = last * dim_len + dim_last
+    return (first * itemsize, (last + 1) * itemsize)
+
+
+_byte_getter_support: dict[type, tuple[bool, bool]] = {}
+
+
+def _supported_reads(byte_getters: Iterable[ByteGetter]) -> tuple[bool, bool]:
+    """Returns whether all byte getters can read into a buffer (``get_into``) and whether all
+    of them can be fetched with ``Store.get_many``. The checks are cached per class, because
+    checking against runtime protocols is slow."""
+    reads_into = gets_many = True
+    for byte_getter_cls in {type(byte_getter) for byte_getter in byte_getters}:
+        support = _byte_getter_support.get(byte_getter_cls)
+        if support is None:
+            support = _byte_getter_support[byte_getter_cls] = (
+                issubclass(byte_getter_cls, ByteIntoGetter),
+                issubclass(byte_getter_cls, StorePath),
+            )
+        reads_into = reads_into and support[0]
+        gets_many = gets_many and support[1]
+    return reads_into, gets_many
+
+
 def resolve_batched(codec: Codec, chunk_specs: Iterable[ArraySpec]) -> Iterable[ArraySpec]:
     return [codec.resolve_metadata(chunk_spec) for chunk_spec in chunk_specs]
 
@@ -62,15 +314,28 @@ class BatchedCodecPipeline(CodecPipeline):
     This batched codec pipeline divides the chunk batches into batches of a configurable
     batch size ("mini-batch"). Fetching, decoding, encoding and storing are performed in
     lock step for each mini-batch. Multiple mini-batches are processing concurrently.
+
+    With a batch size of "auto", the mini-batch size and the number of concurrently
+    processed mini-batches are tuned while a read or write runs, based on the measured
+    throughput of the I/O and compute stages. The memory held by in-flight mini-batches
+    is bounded by ``codec_pipeline.memory_limit`` bytes.
+
+    If all codecs implement synchronous decoding and encoding, the whole codec chain of a
+    chunk is run in a single task of the compute thread pool, see
+    ``supports_fused_execution``. If all codecs additionally implement batch decoding and
+    encoding (``BatchCodecMixin``), the codec chain of a whole mini-batch is run in a single
+    task.
     """
 
     array_array_codecs: tuple[ArrayArrayCodec, ...]
     array_bytes_codec: ArrayBytesCodec
     bytes_bytes_codecs: tuple[BytesBytesCodec, ...]
-    batch_size: int
+    batch_size: int | Literal["auto"]
 
     @classmethod
-    def from_dict(cls, data: Iterable[JSON | Codec], *, batch_size: int | None = None) -> Self:
+    def from_dict(
+        cls, data: Iterable[JSON | Codec], *, batch_size: int | Literal["auto"] | None = None
+    ) -> Self:
         out: list[Codec] = []
         if not isinstance(data, Iterable):
             raise TypeError(f"Expected iterable, got {type(data)}")
@@ -92,7 +357,9 @@ class BatchedCodecPipeline(CodecPipeline):
         return type(self).from_list([c.evolve_from_array_spec(array_spec=array_spec) for c in self])
 
     @classmethod
-    def from_list(cls, codecs: Iterable[Codec], *, batch_size: int | None = None) -> Self:
+    def from_list(
+        cls, codecs: Iterable[Codec], *, batch_size: int | Literal["auto"] | None = None
+    ) -> Self:
         array_array_codecs, array_bytes_codec, bytes_bytes_codecs = codecs_from_list(codecs)
 
         return cls(
@@ -106,34 +373,70 @@ class BatchedCodecPipeline(CodecPipeline):
     def supports_partial_decode(self) -> bool:
         """Determines whether the codec pipeline supports partial decoding.
 
-        Currently, only codec pipelines with a single ArrayBytesCodec that supports
-        partial decoding can support partial decoding. This limitation is due to the fact
-        that ArrayArrayCodecs can change the slice selection leading to non-contiguous
-        slices and BytesBytesCodecs can change the chunk bytes in a way that slice
-        selections cannot be attributed to byte ranges anymore which renders partial
-        decoding infeasible.
-
-        This limitation may softened in the future."""
-        return (len(self.array_array_codecs) + len(self.bytes_bytes_codecs)) == 0 and isinstance(
-            self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin
+        Currently, only codec pipelines with an ArrayBytesCodec that supports partial
+        decoding and no BytesBytesCodecs can support partial decoding, because
+        BytesBytesCodecs can change the chunk bytes in a way that slice selections cannot be
+        attributed to byte ranges anymore. ArrayArrayCodecs are supported if they can map
+        the selections through to the ArrayBytesCodec (see `ArrayArrayCodecPartialMixin`).
+        Chunks with selections that cannot be mapped are decoded as a whole."""
+        return (
+            len(self.bytes_bytes_codecs) == 0
+            and all(
+                isinstance(codec, ArrayArrayCodecPartialMixin) for codec in self.array_array_codecs
+            )
+            and isinstance(self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin)
         )
 
     @property
     def supports_partial_encode(self) -> bool:
         """Determines whether the codec pipeline supports partial encoding.
 
-        Currently, only codec pipelines with a single ArrayBytesCodec that supports
-        partial encoding can support partial encoding. This limitation is due to the fact
-        that ArrayArrayCodecs can change the slice selection leading to non-contiguous
-        slices and BytesBytesCodecs can change the chunk bytes in a way that slice
-        selections cannot be attributed to byte ranges anymore which renders partial
-        encoding infeasible.
+        Currently, only codec pipelines with an ArrayBytesCodec that supports partial
+        encoding and no BytesBytesCodecs can support partial encoding, because
+        BytesBytesCodecs can change the chunk bytes in a way that slice selections cannot be
+        attributed to byte ranges anymore. ArrayArrayCodecs are supported if they can map
+        the selections through to the ArrayBytesCodec (see `ArrayArrayCodecPartialMixin`).
+        Chunks with selections that cannot be mapped are encoded as a whole."""
+        return (
+            len(self.bytes_bytes_codecs) == 0
+            and all(
+                isinstance(codec, ArrayArrayCodecPartialMixin) for codec in self.array_array_codecs
+            )
+            and isinstance(self.array_bytes_codec, ArrayBytesCodecPartialEncodeMixin)
+        )
 
-        This limitation may softened in the future."""
-        return (len(self.array_array_codecs) + len(self.bytes_bytes_codecs)) == 0 and isinstance(
-            self.array_bytes_codec, ArrayBytesCodecPartialEncodeMixin
+    @property
+    def supports_partial_decompress(self) -> bool:
+        """Determines whether the codec pipeline can decode byte ranges of chunks.
+
+        This requires a BytesCodec, which stores the elements of a chunk contiguously in
+        C order, followed by a single BytesBytesCodec that implements partial decoding (see
+        `BytesBytesCodecPartialDecodeMixin`). Decoding byte ranges takes more requests per
+        chunk, so it is opt-in via ``codec_pipeline.partial_decompress``."""
+        return (
+            not self.array_array_codecs
+            and isinstance(self.array_bytes_codec, BytesCodec)
+            and len(self.bytes_bytes_codecs) == 1
+            and isinstance(self.bytes_bytes_codecs[0], BytesBytesCodecPartialDecodeMixin)
         )
 
+    @property
+    def supports_fused_execution(self) -> bool:
+        """Determines whether the codec chain of a chunk can be run in a single worker task.
+
+        This requires all codecs to implement synchronous decoding and encoding via the
+        ``SyncCodecMixin``. Codecs that are configured to run in the process executor
+        (see ``codec_executor``) are dispatched one at a time instead. Chains of codecs that
+        are all configured for the inline executor, like the default bytes, transpose and
+        crc32c codecs, are run on the event loop."""
+        return all(_supports_sync(codec) for codec in self)
+
+    @property
+    def _runs_inline(self) -> bool:
+        """Whether all codecs are configured for the inline executor (see ``codec_executor``),
+        so that their chain can run on the event loop."""
+        return all(isinstance(_codec_executor(codec), InlineExecutor) for codec in self)
+
     def __iter__(self) -> Iterator[Codec]:
         yield from self.array_array_codecs
         yield self.array_bytes_codec
@@ -174,10 +477,138 @@ class BatchedCodecPipeline(CodecPipeline):
 
         return (aa_codecs_with_spec, ab_codec_with_spec, bb_codecs_with_spec)
 
+    def _decode_chunk_sync(
+        self, chunk_bytes: Buffer | None, chunk_spec: ArraySpec
+    ) -> NDBuffer | None:
+        if chunk_bytes is None:
+            return None
+        (
+            aa_codecs_with_spec,
+            (ab_codec, (ab_chunk_spec,)),
+            bb_codecs_with_spec,
+        ) = self._codecs_with_resolved_metadata_batched([chunk_spec])
+
+        for bb_codec, (bb_chunk_spec,) in bb_codecs_with_spec[::-1]:
+            assert isinstance(bb_codec, SyncCodecMixin)
+            chunk_bytes = bb_codec._decode_sync(chunk_bytes, bb_chunk_spec)
+
+        assert isinstance(ab_codec, SyncCodecMixin)
+        chunk_array: NDBuffer = ab_codec._decode_sync(chunk_bytes, ab_chunk_spec)
+
+        for aa_codec, (aa_chunk_spec,) in aa_codecs_with_spec[::-1]:
+            assert isinstance(aa_codec, SyncCodecMixin)
+            chunk_array = aa_codec._decode_sync(chunk_array, aa_chunk_spec)
+        return chunk_array
+
+    def _encode_chunk_sync(
+        self, chunk_array: NDBuffer | None, chunk_spec: ArraySpec
+    ) -> Buffer | None:
+        for aa_codec in self.array_array_codecs:
+            if chunk_array is None:
+                return None
+            assert isinstance(aa_codec, SyncCodecMixin)
+            chunk_array = aa_codec._encode_sync(chunk_array, chunk_spec)
+            chunk_spec = aa_codec.resolve_metadata(chunk_spec)
+
+        if chunk_array is None:
+            return None
+        assert isinstance(self.array_bytes_codec, SyncCodecMixin)
+        chunk_bytes: Buffer | None = self.array_bytes_codec._encode_sync(chunk_array, chunk_spec)
+        chunk_spec = self.array_bytes_codec.resolve_metadata(chunk_spec)
+
+        for bb_codec in self.bytes_bytes_codecs:
+            if chunk_bytes is None:
+                return None
+            assert isinstance(bb_codec, SyncCodecMixin)
+            chunk_bytes = bb_codec._encode_sync(chunk_bytes, chunk_spec)
+            chunk_spec = bb_codec.resolve_metadata(chunk_spec)
+        return chunk_bytes
+
+    def _decode_batch_sync(
+        self, chunk_bytes_and_specs: list[tuple[Buffer | None, ArraySpec]]
+    ) -> list[NDBuffer | None]:
+        chunk_bytes_batch: list[Buffer | None]
+        chunk_bytes_batch, chunk_specs = _unzip2(chunk_bytes_and_specs)
+        (
+            aa_codecs_with_spec,
+            (ab_codec, ab_chunk_specs),
+            bb_codecs_with_spec,
+        ) = self._codecs_with_resolved_metadata_batched(chunk_specs)
+
+        for bb_codec, bb_chunk_specs in bb_codecs_with_spec[::-1]:
+            assert isinstance(bb_codec, BatchCodecMixin)
+            chunk_bytes_batch = _apply_to_non_none(
+                bb_codec._decode_batch, list(zip(chunk_bytes_batch, bb_chunk_specs, strict=True))
+            )
+
+        assert isinstance(ab_codec, BatchCodecMixin)
+        chunk_array_batch: list[NDBuffer | None] = _apply_to_non_none(
+            ab_codec._decode_batch, list(zip(chunk_bytes_batch, ab_chunk_specs, strict=True))
+        )
+
+        for aa_codec, aa_chunk_specs in aa_codecs_with_spec[::-1]:
+            assert isinstance(aa_codec, BatchCodecMixin)
+            chunk_array_batch = _apply_to_non_none(
+                aa_codec._decode_batch, list(zip(chunk_array_batch, aa_chunk_specs, strict=True))
+            )
+        return chunk_array_batch
+
+    def _encode_batch_sync(
+        self, chunk_arrays_and_specs: list[tuple[NDBuffer | None, ArraySpec]]
+    ) -> list[Buffer | None]:
+        chunk_array_batch: list[NDBuffer | None]
+        chunk_array_batch, chunk_specs = _unzip2(chunk_arrays_and_specs)
+
+        for aa_codec in self.array_array_codecs:
+            assert isinstance(aa_codec, BatchCodecMixin)
+            chunk_array_batch = _apply_to_non_none(
+                aa_codec._encode_batch, list(zip(chunk_array_batch, chunk_specs, strict=True))
+            )
+            chunk_specs = [aa_codec.resolve_metadata(chunk_spec) for chunk_spec in chunk_specs]
+
+        assert isinstance(self.array_bytes_codec, BatchCodecMixin)
+        chunk_bytes_batch: list[Buffer | None] = _apply_to_non_none(
+            self.array_bytes_codec._encode_batch,
+            list(zip(chunk_array_batch, chunk_specs, strict=True)),
+        )
+        chunk_specs = [
+            self.array_bytes_codec.resolve_metadata(chunk_spec) for chunk_spec in chunk_specs
+        ]
+
+        for bb_codec in self.bytes_bytes_codecs:
+            assert isinstance(bb_codec, BatchCodecMixin)
+            chunk_bytes_batch = _apply_to_non_none(
+                bb_codec._encode_batch, list(zip(chunk_bytes_batch, chunk_specs, strict=True))
+            )
+            chunk_specs = [bb_codec.resolve_metadata(chunk_spec) for chunk_spec in chunk_specs]
+        return chunk_bytes_batch
+
     async def decode_batch(
         self,
         chunk_bytes_and_specs: Iterable[tuple[Buffer | None, ArraySpec]],
     ) -> Iterable[NDBuffer | None]:
+        if all(_supports_batch(codec) for codec in self):
+            if self._runs_inline:
+                return self._decode_batch_sync(list(chunk_bytes_and_specs))
+            return await to_thread_pool(
+                "compute", self._decode_batch_sync, list(chunk_bytes_and_specs)
+            )
+        if self.supports_fused_execution:
+            if self._runs_inline:
+                # the chain is too cheap to be worth a thread hop per chunk
+                return [
+                    self._decode_chunk_sync(chunk_bytes, chunk_spec)
+                    for chunk_bytes, chunk_spec in chunk_bytes_and_specs
+                ]
+            return await concurrent_map(
+                [
+                    (self._decode_chunk_sync, chunk_bytes, chunk_spec)
+                    for chunk_bytes, chunk_spec in chunk_bytes_and_specs
+                ],
+                partial(to_thread_pool, "compute"),
+                config.get("async.concurrency"),
+            )
+
         chunk_bytes_batch: Iterable[Buffer | None]
         chunk_bytes_batch, chunk_specs = _unzip2(chunk_bytes_and_specs)
 
@@ -204,18 +635,89 @@ class BatchedCodecPipeline(CodecPipeline):
 
         return chunk_array_batch
 
+    def _map_selection(
+        self, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> list[tuple[SelectorTuple, ArraySpec]] | None:
+        """Maps a selection of a chunk through the array-to-array codecs. Returns the selection
+        and spec at the input of each array-to-array codec, followed by those at the input of
+        the array-to-bytes codec. Returns None, if a codec cannot map the selection."""
+        selections_and_specs = [(selection, chunk_spec)]
+        for aa_codec in self.array_array_codecs:
+            assert isinstance(aa_codec, ArrayArrayCodecPartialMixin)
+            selection_maybe = aa_codec._encode_selection(selection, chunk_spec)
+            if selection_maybe is None:
+                return None
+            selection = selection_maybe
+            chunk_spec = aa_codec.resolve_metadata(chunk_spec)
+            selections_and_specs.append((selection, chunk_spec))
+        return selections_and_specs
+
+    def _maps_all_selections(
+        self, batch_info: Iterable[tuple[Any, ArraySpec, SelectorTuple, SelectorTuple]]
+    ) -> bool:
+        return not self.array_array_codecs or all(
+            self._map_selection(chunk_selection, chunk_spec) is not None
+            for _, chunk_spec, chunk_selection, _ in batch_info
+        )
+
     async def decode_partial_batch(
         self,
         batch_info: Iterable[tuple[ByteGetter, SelectorTuple, ArraySpec]],
     ) -> Iterable[NDBuffer | None]:
         assert self.supports_partial_decode
         assert isinstance(self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin)
-        return await self.array_bytes_codec.decode_partial(batch_info)
+        if not self.array_array_codecs:
+            return await self.array_bytes_codec.decode_partial(batch_info)
+
+        batch_info = list(batch_info)
+        mapped_batch = []
+        for _, selection, chunk_spec in batch_info:
+            mapped = self._map_selection(selection, chunk_spec)
+            assert mapped is not None
+            mapped_batch.append(mapped)
+        chunk_array_batch = await self.array_bytes_codec.decode_partial(
+            [
+                (byte_getter, *mapped[-1])
+                for (byte_getter, _, _), mapped in zip(batch_info, mapped_batch, strict=True)
+            ]
+        )
+        out: list[NDBuffer | None] = []
+        for chunk_array, mapped in zip(chunk_array_batch, mapped_batch, strict=True):
+            if chunk_array is not None:
+                for aa_codec, (selection, chunk_spec) in zip(
+                    self.array_array_codecs[::-1], mapped[-2::-1], strict=True
+                ):
+                    assert isinstance(aa_codec, ArrayArrayCodecPartialMixin)
+                    chunk_array = aa_codec._decode_partial_array(chunk_array, selection, chunk_spec)
+            out.append(chunk_array)
+        return out
 
     async def encode_batch(
         self,
         chunk_arrays_and_specs: Iterable[tuple[NDBuffer | None, ArraySpec]],
     ) -> Iterable[Buffer | None]:
+        if all(_supports_batch(codec) for codec in self):
+            if self._runs_inline:
+                return self._encode_batch_sync(list(chunk_arrays_and_specs))
+            return await to_thread_pool(
+                "compute", self._encode_batch_sync, list(chunk_arrays_and_specs)
+            )
+        if self.supports_fused_execution:
+            if self._runs_inline:
+                # the chain is too cheap to be worth a thread hop per chunk
+                return [
+                    self._encode_chunk_sync(chunk_array, chunk_spec)
+                    for chunk_array, chunk_spec in chunk_arrays_and_specs
+                ]
+            return await concurrent_map(
+                [
+                    (self._encode_chunk_sync, chunk_array, chunk_spec)
+                    for chunk_array, chunk_spec in chunk_arrays_and_specs
+                ],
+                partial(to_thread_pool, "compute"),
+                config.get("async.concurrency"),
+            )
+
         chunk_array_batch: Iterable[NDBuffer | None]
         chunk_specs: Iterable[ArraySpec]
         chunk_array_batch, chunk_specs = _unzip2(chunk_arrays_and_specs)
@@ -245,7 +747,23 @@ class BatchedCodecPipeline(CodecPipeline):
     ) -> None:
         assert self.supports_partial_encode
         assert isinstance(self.array_bytes_codec, ArrayBytesCodecPartialEncodeMixin)
-        await self.array_bytes_codec.encode_partial(batch_info)
+        if not self.array_array_codecs:
+            await self.array_bytes_codec.encode_partial(batch_info)
+            return
+
+        mapped_batch_info = []
+        for byte_setter, chunk_array, selection, chunk_spec in batch_info:
+            mapped = self._map_selection(selection, chunk_spec)
+            assert mapped is not None
+            for aa_codec, (aa_selection, aa_chunk_spec) in zip(
+                self.array_array_codecs, mapped, strict=False
+            ):
+                assert isinstance(aa_codec, ArrayArrayCodecPartialMixin)
+                chunk_array = aa_codec._encode_partial_array(
+                    chunk_array, aa_selection, aa_chunk_spec
+                )
+            mapped_batch_info.append((byte_setter, chunk_array, *mapped[-1]))
+        await self.array_bytes_codec.encode_partial(mapped_batch_info)
 
     async def read_batch(
         self,
@@ -253,7 +771,8 @@ class BatchedCodecPipeline(CodecPipeline):
         out: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
-        if self.supports_partial_decode:
+        batch_info = list(batch_info)
+        if self.supports_partial_decode and self._maps_all_selections(batch_info):
             chunk_array_batch = await self.decode_partial_batch(
                 [
                     (byte_getter, chunk_selection, chunk_spec)
@@ -268,25 +787,44 @@ class BatchedCodecPipeline(CodecPipeline):
                 else:
                     out[out_selection] = chunk_spec.fill_value
         else:
-            chunk_bytes_batch = await concurrent_map(
-                [
-                    (byte_getter, array_spec.prototype)
-                    for byte_getter, array_spec, _, _ in batch_info
-                ],
-                lambda byte_getter, prototype: byte_getter.get(prototype),
-                config.get("async.concurrency"),
-            )
-            chunk_array_batch = await self.decode_batch(
+            batch_info = await self._read_byte_ranges(batch_info, out, drop_axes)
+            byte_getters = [byte_getter for byte_getter, _, _, _ in batch_info]
+            reads_into, gets_many = _supported_reads(byte_getters)
+            # chunks that are decoded directly into `out`
+            targets: list[npt.NDArray[np.uint8] | None] = (
                 [
-                    (chunk_bytes, chunk_spec)
-                    for chunk_bytes, (_, chunk_spec, _, _) in zip(
-                        chunk_bytes_batch, batch_info, strict=False
-                    )
-                ],
+                    self._decode_into_target(out, chunk_spec, chunk_selection, out_selection)
+                    for _, chunk_spec, chunk_selection, out_selection in batch_info
+                ]
+                if drop_axes == () and self._decodes_into(reads_into)
+                else [None] * len(batch_info)
             )
-            for chunk_array, (_, chunk_spec, chunk_selection, out_selection) in zip(
-                chunk_array_batch, batch_info, strict=False
-            ):
+            with _measure_stage("io"):
+                fetched = await self._fetch_chunks(
+                    byte_getters,
+                    [chunk_spec.prototype for _, chunk_spec, _, _ in batch_info],
+                    targets,
+                    gets_many,
+                )
+            with _measure_stage("compute"):
+                if self.bytes_bytes_codecs:
+                    await self._decode_chunks_into(fetched, batch_info, targets)
+                chunk_array_batch = await self.decode_batch(
+                    [
+                        (None if in_place else chunk_bytes, chunk_spec)
+                        for (chunk_bytes, in_place), (_, chunk_spec, _, _) in zip(
+                            fetched, batch_info, strict=True
+                        )
+                    ],
+                )
+            for chunk_array, (_, in_place), (
+                _,
+                chunk_spec,
+                chunk_selection,
+                out_selection,
+            ) in zip(chunk_array_batch, fetched, batch_info, strict=True):
+                if in_place:
+                    continue
                 if chunk_array is not None:
                     tmp = chunk_array[chunk_selection]
                     if drop_axes != ():
@@ -295,6 +833,219 @@ class BatchedCodecPipeline(CodecPipeline):
                 else:
                     out[out_selection] = chunk_spec.fill_value
 
+    def _partial_decompress_range(
+        self, chunk_selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> tuple[int, int] | None:
+        """Returns the byte range of the decoded chunk that contains the selection, if it is
+        worth decoding the range instead of the whole chunk."""
+        if not (
+            self.supports_partial_decompress and config.get("codec_pipeline.partial_decompress")
+        ):
+            return None
+        byte_range = _selection_byte_range(chunk_selection, chunk_spec)
+        if byte_range is None:
+            return None
+        # the blocks around the range are decoded as well, so small chunks are read as a whole
+        chunk_nbytes = product(chunk_spec.shape) * chunk_spec.dtype.itemsize
+        if (byte_range[1] - byte_range[0]) * 2 > chunk_nbytes:
+            return None
+        return byte_range
+
+    async def _decode_byte_range(
+        self, byte_getter: ByteGetter, byte_range: tuple[int, int], chunk_spec: ArraySpec
+    ) -> NDBuffer | None:
+        """Decodes a chunk of which only the elements within `byte_range` are initialized."""
+        bb_codec = self.bytes_bytes_codecs[0]
+        assert isinstance(bb_codec, BytesBytesCodecPartialDecodeMixin)
+        chunk_bytes = await bb_codec._decode_partial_single(byte_getter, byte_range, chunk_spec)
+        if chunk_bytes is None:
+            return None
+        decoded = np.empty(product(chunk_spec.shape) * chunk_spec.dtype.itemsize, dtype=np.uint8)
+        decoded[byte_range[0] : byte_range[1]] = chunk_bytes.as_numpy_array()
+        assert isinstance(self.array_bytes_codec, BytesCodec)
+        return self.array_bytes_codec._decode_sync(
+            chunk_spec.prototype.buffer.from_array_like(decoded.view("b")), chunk_spec
+        )
+
+    async def _read_byte_ranges(
+        self,
+        batch_info: list[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        out: NDBuffer,
+        drop_axes: tuple[int, ...],
+    ) -> list[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]]:
+        """Reads the chunks with small selections by decoding only the byte ranges that contain
+        the selections. Returns the remaining chunks."""
+        if not (
+            self.supports_partial_decompress and config.get("codec_pipeline.partial_decompress")
+        ):
+            return batch_info
+        byte_ranges = [
+            self._partial_decompress_range(chunk_selection, chunk_spec)
+            for _, chunk_spec, chunk_selection, _ in batch_info
+        ]
+        if all(byte_range is None for byte_range in byte_ranges):
+            return batch_info
+        partial_batch = [
+            (item, byte_range)
+            for item, byte_range in zip(batch_info, byte_ranges, strict=True)
+            if byte_range is not None
+        ]
+        chunk_array_batch = await concurrent_map(
+            [
+                (byte_getter, byte_range, chunk_spec)
+                for (byte_getter, chunk_spec, _, _), byte_range in partial_batch
+            ],
+            self._decode_byte_range,
+            config.get("async.concurrency"),
+        )
+        for chunk_array, ((_, chunk_spec, chunk_selection, out_selection), _) in zip(
+            chunk_array_batch, partial_batch, strict=True
+        ):
+            if chunk_array is not None:
+                tmp = chunk_array[chunk_selection]
+                if drop_axes != ():
+                    tmp = tmp.squeeze(axis=drop_axes)
+                out[out_selection] = tmp
+            else:
+                out[out_selection] = chunk_spec.fill_value
+        return [
+            item
+            for item, byte_range in zip(batch_info, byte_ranges, strict=True)
+            if byte_range is None
+        ]
+
+    def _decodes_into(self, reads_into: bool) -> bool:
+        """Whether the codec chain can decode chunks directly into the output array. Without
+        bytes-to-bytes codecs, the chunks are read into the output array, which requires byte
+        getters that support ``get_into``."""
+        if self.array_array_codecs or not _supports_decode_into(self.array_bytes_codec):
+            return False
+        if self.bytes_bytes_codecs:
+            # the chunks are decompressed into the output array
+            return _supports_decode_into(self.bytes_bytes_codecs[0]) and all(
+                _supports_sync(bb_codec) for bb_codec in self.bytes_bytes_codecs[1:]
+            )
+        return reads_into
+
+    def _decode_into_target(
+        self,
+        out: NDBuffer,
+        chunk_spec: ArraySpec,
+        chunk_selection: SelectorTuple,
+        out_selection: SelectorTuple,
+    ) -> npt.NDArray[np.uint8] | None:
+        """Returns a byte view on the region of `out` that a chunk can be decoded into
+        directly. This requires the chunk to be fully covered by the selection and the region
+        to be contiguous with the memory layout of the decoded chunk."""
+        if not isinstance(out_selection, tuple) or not all(
+            isinstance(dim_sel, slice) and dim_sel.step in (1, None) for dim_sel in out_selection
+        ):
+            return None
+        if not is_total_slice(chunk_selection, chunk_spec.shape):
+            return None
+        out_array = out.as_ndarray_like()
+        if not isinstance(out_array, np.ndarray):
+            return None
+        region = out_array[out_selection]
+        # scalar selections yield copies
+        if not np.may_share_memory(region, out_array):
+            return None
+        return self.array_bytes_codec._decode_into_view(
+            type(out).from_ndarray_like(region), chunk_spec
+        )
+
+    async def _fetch_chunks(
+        self,
+        byte_getters: list[ByteGetter],
+        prototypes: list[BufferPrototype],
+        targets: list[npt.NDArray[np.uint8] | None],
+        gets_many: bool,
+    ) -> list[tuple[Buffer | None, bool]]:
+        """Fetches the bytes of the chunks, or reads them directly into their targets. With
+        `gets_many`, the chunks that are fetched are read with one `Store.get_many` call per
+        store."""
+        fetched: list[tuple[Buffer | None, bool]] = [(None, False)] * len(byte_getters)
+        read_into = []
+        read = []
+        for i, target in enumerate(targets):
+            if target is not None and not self.bytes_bytes_codecs:
+                read_into.append(i)
+            else:
+                read.append(i)
+
+        async def _get_into(i: int) -> None:
+            target = targets[i]
+            assert target is not None
+            fetched[i] = (None, await byte_getters[i].get_into(target))  # type: ignore[attr-defined]
+
+        async def _get(i: int) -> None:
+            fetched[i] = (await byte_getters[i].get(prototypes[i]), False)
+
+        async def _get_many() -> None:
+            values = await get_many([byte_getters[i] for i in read], [prototypes[i] for i in read])
+            for i, value in zip(read, values, strict=True):
+                fetched[i] = (value, False)
+
+        requests: list[Awaitable[Any]] = []
+        if read_into:
+            requests.append(
+                concurrent_map(
+                    [(i,) for i in read_into], _get_into, config.get("async.concurrency")
+                )
+            )
+        if len(read) == 1:
+            requests.append(_get(read[0]))
+        elif read and gets_many:
+            requests.append(_get_many())
+        elif read:
+            requests.append(
+                concurrent_map([(i,) for i in read], _get, config.get("async.concurrency"))
+            )
+        if len(requests) == 1:
+            await requests[0]
+        else:
+            await asyncio.gather(*requests)
+        return fetched
+
+    def _decode_into_sync(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, target: npt.NDArray[np.uint8]
+    ) -> bool:
+        *_, bb_codecs_with_spec = self._codecs_with_resolved_metadata_batched([chunk_spec])
+        for bb_codec, (bb_chunk_spec,) in bb_codecs_with_spec[:0:-1]:
+            assert isinstance(bb_codec, SyncCodecMixin)
+            chunk_bytes = bb_codec._decode_sync(chunk_bytes, bb_chunk_spec)
+        bb_codec, (bb_chunk_spec,) = bb_codecs_with_spec[0]
+        return bb_codec._decode_into(chunk_bytes, bb_chunk_spec, target)
+
+    async def _decode_chunks_into(
+        self,
+        fetched: list[tuple[Buffer | None, bool]],
+        batch_info: list[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        targets: list[npt.NDArray[np.uint8] | None],
+    ) -> None:
+        """Decompresses the fetched chunks that have a target into it. The chunks that have
+        been decoded are marked as such in `fetched`."""
+        decode_into = [
+            i
+            for i, ((chunk_bytes, _), target) in enumerate(zip(fetched, targets, strict=True))
+            if chunk_bytes is not None and target is not None
+        ]
+        if not decode_into:
+            return
+
+        async def _decode_into(i: int) -> None:
+            chunk_bytes, target = fetched[i][0], targets[i]
+            assert chunk_bytes is not None
+            assert target is not None
+            if await to_thread_pool(
+                "compute", self._decode_into_sync, chunk_bytes, batch_info[i][1], target
+            ):
+                fetched[i] = (None, True)
+
+        await concurrent_map(
+            [(i,) for i in decode_into], _decode_into, config.get("async.concurrency")
+        )
+
     def _merge_chunk_array(
         self,
         existing_chunk_array: NDBuffer | None,
@@ -331,13 +1082,28 @@ class BatchedCodecPipeline(CodecPipeline):
         chunk_array[chunk_selection] = chunk_value
         return chunk_array
 
+    def _invalidate_shard_indexes(self, byte_setters: Iterable[ByteSetter]) -> None:
+        """Drops the cached indexes of shards that are written as a whole by this pipeline."""
+        from zarr.codecs.sharding import ShardingCodec, _shard_index_cache
+
+        if isinstance(self.array_bytes_codec, ShardingCodec):
+            for byte_setter in byte_setters:
+                if isinstance(byte_setter, StorePath):
+                    _shard_index_cache.invalidate(str(byte_setter))
+
     async def write_batch(
         self,
         batch_info: Iterable[tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]],
         value: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
-        if self.supports_partial_encode:
+        batch_info = list(batch_info)
+        if (
+            self.supports_partial_encode
+            and self._maps_all_selections(batch_info)
+            # scalars are broadcast by the merge of the full chunk
+            and not (self.array_array_codecs and len(value.shape) == 0)
+        ):
             await self.encode_partial_batch(
                 [
                     (byte_setter, value[out_selection], chunk_selection, chunk_spec)
@@ -347,83 +1113,126 @@ class BatchedCodecPipeline(CodecPipeline):
 
         else:
             # Read existing bytes if not total slice
-            async def _read_key(
-                byte_setter: ByteSetter | None, prototype: BufferPrototype
-            ) -> Buffer | None:
-                if byte_setter is None:
-                    return None
-                return await byte_setter.get(prototype=prototype)
-
-            chunk_bytes_batch: Iterable[Buffer | None]
-            chunk_bytes_batch = await concurrent_map(
-                [
-                    (
-                        None if is_total_slice(chunk_selection, chunk_spec.shape) else byte_setter,
-                        chunk_spec.prototype,
-                    )
-                    for byte_setter, chunk_spec, chunk_selection, _ in batch_info
-                ],
-                _read_key,
-                config.get("async.concurrency"),
-            )
-            chunk_array_batch = await self.decode_batch(
-                [
-                    (chunk_bytes, chunk_spec)
-                    for chunk_bytes, (_, chunk_spec, _, _) in zip(
-                        chunk_bytes_batch, batch_info, strict=False
+            read = [
+                i
+                for i, (_, chunk_spec, chunk_selection, _) in enumerate(batch_info)
+                if not is_total_slice(chunk_selection, chunk_spec.shape)
+            ]
+            existing_bytes_batch: list[Buffer | None] = [None] * len(batch_info)
+            with _measure_stage("io"):
+                if read:
+                    existing = await get_many(
+                        [batch_info[i][0] for i in read],
+                        [batch_info[i][1].prototype for i in read],
                     )
-                ],
-            )
-
-            chunk_array_batch = [
-                self._merge_chunk_array(
-                    chunk_array, value, out_selection, chunk_spec, chunk_selection, drop_axes
-                )
-                for chunk_array, (_, chunk_spec, chunk_selection, out_selection) in zip(
-                    chunk_array_batch, batch_info, strict=False
+                    for i, chunk_bytes in zip(read, existing, strict=True):
+                        existing_bytes_batch[i] = chunk_bytes
+            with _measure_stage("compute"):
+                chunk_array_batch = await self.decode_batch(
+                    [
+                        (chunk_bytes, chunk_spec)
+                        for chunk_bytes, (_, chunk_spec, _, _) in zip(
+                            existing_bytes_batch, batch_info, strict=False
+                        )
+                    ],
                 )
-            ]
 
-            chunk_array_batch = [
-                None
-                if chunk_array is None or chunk_array.all_equal(chunk_spec.fill_value)
-                else chunk_array
-                for chunk_array, (_, chunk_spec, _, _) in zip(
-                    chunk_array_batch, batch_info, strict=False
-                )
-            ]
+                chunk_array_batch = [
+                    self._merge_chunk_array(
+                        chunk_array, value, out_selection, chunk_spec, chunk_selection, drop_axes
+                    )
+                    for chunk_array, (_, chunk_spec, chunk_selection, out_selection) in zip(
+                        chunk_array_batch, batch_info, strict=False
+                    )
+                ]
 
-            chunk_bytes_batch = await self.encode_batch(
-                [
-                    (chunk_array, chunk_spec)
+                chunk_array_batch = [
+                    None
+                    if chunk_array is None or chunk_array.all_equal(chunk_spec.fill_value)
+                    else chunk_array
                     for chunk_array, (_, chunk_spec, _, _) in zip(
                         chunk_array_batch, batch_info, strict=False
                     )
-                ],
-            )
+                ]
 
-            async def _write_key(byte_setter: ByteSetter, chunk_bytes: Buffer | None) -> None:
-                if chunk_bytes is None:
-                    await byte_setter.delete()
-                else:
-                    await byte_setter.set(chunk_bytes)
+                chunk_bytes_batch = await self.encode_batch(
+                    [
+                        (chunk_array, chunk_spec)
+                        for chunk_array, (_, chunk_spec, _, _) in zip(
+                            chunk_array_batch, batch_info, strict=False
+                        )
+                    ],
+                )
 
-            await concurrent_map(
-                [
-                    (byte_setter, chunk_bytes)
-                    for chunk_bytes, (byte_setter, _, _, _) in zip(
-                        chunk_bytes_batch, batch_info, strict=False
+            byte_setters = [byte_setter for byte_setter, _, _, _ in batch_info]
+            with _measure_stage("io"):
+                try:
+                    await set_or_delete_many(byte_setters, list(chunk_bytes_batch))
+                finally:
+                    self._invalidate_shard_indexes(byte_setters)
+
+    async def _run_auto_batched(
+        self,
+        batch_info: Iterable[T],
+        chunk_spec_of: Callable[[T], ArraySpec],
+        process_batch: Callable[[tuple[T, ...]], Awaitable[U]],
+    ) -> list[U]:
+        """Processes `batch_info` in mini-batches whose size and concurrency are tuned
+        on the fly. Returns the results of `process_batch` in order."""
+        items = iter(batch_info)
+        first = next(items, None)
+        if first is None:
+            return []
+        chunk_spec = chunk_spec_of(first)
+        tuner = _AdaptiveBatchTuner(
+            chunk_nbytes=product(chunk_spec.shape) * chunk_spec.dtype.itemsize,
+            memory_limit=config.get("codec_pipeline.memory_limit"),
+            max_concurrency=config.get("async.concurrency") or _AUTO_MAX_CONCURRENCY,
+        )
+        pending_first: tuple[T, ...] = (first,)
+
+        async def _timed(index: int, batch: tuple[T, ...]) -> tuple[int, U, int, _StageTimings]:
+            timings = _StageTimings()
+            _stage_timings.set(timings)  # tasks run in a copy of the context
+            return (index, await process_batch(batch), len(batch), timings)
+
+        results: dict[int, U] = {}
+        in_flight: set[asyncio.Future[tuple[int, U, int, _StageTimings]]] = set()
+        index = 0
+        try:
+            while True:
+                while len(in_flight) < tuner.concurrency:
+                    batch = pending_first + tuple(
+                        islice(items, tuner.batch_size - len(pending_first))
                     )
-                ],
-                _write_key,
-                config.get("async.concurrency"),
-            )
+                    pending_first = ()
+                    if not batch:
+                        break
+                    in_flight.add(asyncio.ensure_future(_timed(index, batch)))
+                    index += 1
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    batch_index, result, num_chunks, timings = task.result()
+                    results[batch_index] = result
+                    tuner.record(num_chunks, timings)
+        finally:
+            for task in in_flight:
+                task.cancel()
+        return [results[i] for i in range(index)]
 
     async def decode(
         self,
         chunk_bytes_and_specs: Iterable[tuple[Buffer | None, ArraySpec]],
     ) -> Iterable[NDBuffer | None]:
         output: list[NDBuffer | None] = []
+        if self.batch_size == "auto":
+            for decoded in await self._run_auto_batched(
+                chunk_bytes_and_specs, lambda item: item[1], self.decode_batch
+            ):
+                output.extend(decoded)
+            return output
         for batch_info in batched(chunk_bytes_and_specs, self.batch_size):
             output.extend(await self.decode_batch(batch_info))
         return output
@@ -433,6 +1242,12 @@ class BatchedCodecPipeline(CodecPipeline):
         chunk_arrays_and_specs: Iterable[tuple[NDBuffer | None, ArraySpec]],
     ) -> Iterable[Buffer | None]:
         output: list[Buffer | None] = []
+        if self.batch_size == "auto":
+            for encoded in await self._run_auto_batched(
+                chunk_arrays_and_specs, lambda item: item[1], self.encode_batch
+            ):
+                output.extend(encoded)
+            return output
         for single_batch_info in batched(chunk_arrays_and_specs, self.batch_size):
             output.extend(await self.encode_batch(single_batch_info))
         return output
@@ -443,6 +1258,13 @@ class BatchedCodecPipeline(CodecPipeline):
         out: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
+        if self.batch_size == "auto":
+            await self._run_auto_batched(
+                batch_info,
+                lambda item: item[1],
+                lambda single_batch_info: self.read_batch(single_batch_info, out, drop_axes),
+            )
+            return
         await concurrent_map(
             [
                 (single_batch_info, out, drop_axes)
@@ -458,6 +1280,13 @@ class BatchedCodecPipeline(CodecPipeline):
         value: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
+        if self.batch_size == "auto":
+            await self._run_auto_batched(
+                batch_info,
+                lambda item: item[1],
+                lambda single_batch_info: self.write_batch(single_batch_info, value, drop_axes),
+            )
+            return
         await concurrent_map(
             [
                 (single_batch_info, value, drop_axes)
@@ -468,6 +1297,117 @@ class BatchedCodecPipeline(CodecPipeline):
         )
 
 
+@dataclass(frozen=True)
+class StreamingCodecPipeline(BatchedCodecPipeline):
+    """Codec pipeline that streams chunks through overlapping stages.
+
+    Instead of processing mini-batches in lock step, every chunk moves through the
+    fetch, decode and scatter stages (or fetch, merge + encode and store stages on
+    writes) independently. The stages are connected by bounded queues with a
+    configurable size (``codec_pipeline.queue_size``), so that I/O and decoding work
+    overlap while limiting the number of chunks held in memory. Each stage runs with
+    up to ``async.concurrency`` workers (``codec_pipeline.queue_size`` if unset).
+
+    Partial decoding and encoding is delegated to the codecs, like in the
+    BatchedCodecPipeline.
+    """
+
+    def _stage_options(self) -> tuple[int, int]:
+        queue_size = config.get("codec_pipeline.queue_size")
+        return (config.get("async.concurrency") or queue_size, queue_size)
+
+    async def read(
+        self,
+        batch_info: Iterable[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        out: NDBuffer,
+        drop_axes: tuple[int, ...] = (),
+    ) -> None:
+        if self.supports_partial_decode:
+            await super().read(batch_info, out, drop_axes)
+            return
+
+        async def _fetch(
+            item: tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple],
+        ) -> tuple[
+            Buffer | NDBuffer | None, tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]
+        ]:
+            byte_getter, chunk_spec, chunk_selection, _ = item
+            byte_range = self._partial_decompress_range(chunk_selection, chunk_spec)
+            if byte_range is not None:
+                return (await self._decode_byte_range(byte_getter, byte_range, chunk_spec), item)
+            return (await byte_getter.get(prototype=chunk_spec.prototype), item)
+
+        async def _decode_and_scatter(
+            chunk_bytes_and_item: tuple[
+                Buffer | NDBuffer | None,
+                tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple],
+            ],
+        ) -> None:
+            chunk_bytes, (_, chunk_spec, chunk_selection, out_selection) = chunk_bytes_and_item
+            chunk_array: NDBuffer | None
+            if isinstance(chunk_bytes, NDBuffer):
+                # decoded from a byte range while fetching
+                chunk_array = chunk_bytes
+            else:
+                (chunk_array,) = await self.decode_batch([(chunk_bytes, chunk_spec)])
+            if chunk_array is not None:
+                tmp = chunk_array[chunk_selection]
+                if drop_axes != ():
+                    tmp = tmp.squeeze(axis=drop_axes)
+                out[out_selection] = tmp
+            else:
+                out[out_selection] = chunk_spec.fill_value
+
+        await _run_stages(batch_info, [_fetch, _decode_and_scatter], *self._stage_options())
+
+    async def write(
+        self,
+        batch_info: Iterable[tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        value: NDBuffer,
+        drop_axes: tuple[int, ...] = (),
+    ) -> None:
+        if self.supports_partial_encode:
+            await super().write(batch_info, value, drop_axes)
+            return
+
+        async def _fetch(
+            item: tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple],
+        ) -> tuple[Buffer | None, tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]]:
+            byte_setter, chunk_spec, chunk_selection, _ = item
+            if is_total_slice(chunk_selection, chunk_spec.shape):
+                return (None, item)
+            return (await byte_setter.get(prototype=chunk_spec.prototype), item)
+
+        async def _merge_and_encode(
+            chunk_bytes_and_item: tuple[
+                Buffer | None, tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]
+            ],
+        ) -> tuple[ByteSetter, Buffer | None]:
+            chunk_bytes, (byte_setter, chunk_spec, chunk_selection, out_selection) = (
+                chunk_bytes_and_item
+            )
+            (existing_chunk_array,) = await self.decode_batch([(chunk_bytes, chunk_spec)])
+            chunk_array: NDBuffer | None = self._merge_chunk_array(
+                existing_chunk_array, value, out_selection, chunk_spec, chunk_selection, drop_axes
+            )
+            if chunk_array is None or chunk_array.all_equal(chunk_spec.fill_value):
+                chunk_array = None
+            (encoded_chunk_bytes,) = await self.encode_batch([(chunk_array, chunk_spec)])
+            return (byte_setter, encoded_chunk_bytes)
+
+        async def _store(byte_setter_and_bytes: tuple[ByteSetter, Buffer | None]) -> None:
+            byte_setter, chunk_bytes = byte_setter_and_bytes
+            try:
+                if chunk_bytes is None:
+                    await byte_setter.delete()
+                else:
+                    await byte_setter.set(chunk_bytes)
+            finally:
+                self._invalidate_shard_indexes([byte_setter])
+
+        await _run_stages(batch_info, [_fetch, _merge_and_encode, _store], *self._stage_options())
+
+
 def codecs_from_list(
     codecs: Iterable[Codec],
 ) -> tuple[tuple[ArrayArrayCodec, ...], ArrayBytesCodec, tuple[BytesBytesCodec, ...]]:
@@ -477,7 +1417,10 @@ def codecs_from_list(
     array_bytes_maybe: ArrayBytesCodec | None = None
     bytes_bytes: tuple[BytesBytesCodec, ...] = ()
 
-    if any(isinstance(codec, ShardingCodec) for codec in codecs) and len(tuple(codecs)) > 1:
+    codecs = tuple(codecs)
+    if any(isinstance(codec, ShardingCodec) for codec in codecs) and not all(
+        isinstance(codec, ShardingCodec | ArrayArrayCodecPartialMixin) for codec in codecs
+    ):
         warn(
             "Combining a `sharding_indexed` codec disables partial reads and "
             "writes, which may lead to inefficient performance.",
@@ -530,3 +1473,4 @@ def codecs_from_list(
 
 
 register_pipeline(BatchedCodecPipeline)
+register_pipeline(StreamingCodecPipeline)
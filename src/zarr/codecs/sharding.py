@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field, replace
 from enum import Enum
 from functools import lru_cache
-from operator import itemgetter
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import numpy as np
@@ -17,7 +17,7 @@ from zarr.abc.codec import (
     Codec,
     CodecPipeline,
 )
-from zarr.abc.store import ByteGetter, ByteSetter
+from zarr.abc.store import ByteGetter, ByteRangesGetter, ByteSetter
 from zarr.codecs.bytes import BytesCodec
 from zarr.codecs.crc32c_ import Crc32cCodec
 from zarr.core.array_spec import ArraySpec
@@ -30,22 +30,30 @@ from zarr.core.buffer import (
 )
 from zarr.core.chunk_grids import ChunkGrid, RegularChunkGrid
 from zarr.core.common import (
+    BytesLike,
     ChunkCoords,
     ChunkCoordsLike,
+    concurrent_map,
     parse_enum,
     parse_named_configuration,
     parse_shapelike,
     product,
 )
+from zarr.core.config import config
 from zarr.core.indexing import (
     BasicIndexer,
+    ChunkProjection,
     SelectorTuple,
     c_order_iter,
     get_indexer,
+    is_total_slice,
+    morton_order,
     morton_order_iter,
 )
 from zarr.core.metadata import parse_codecs
 from zarr.registry import get_ndbuffer_class, get_pipeline_class, register_codec
+from zarr.store._utils import _coalesce_byte_ranges, _normalize_interval_index
+from zarr.store.common import StorePath
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Iterator
@@ -76,11 +84,15 @@ class _ShardingByteGetter(ByteGetter):
     async def get(
         self, prototype: BufferPrototype, byte_range: tuple[int, int | None] | None = None
     ) -> Buffer | None:
-        assert byte_range is None, "byte_range is not supported within shards"
         assert (
             prototype == default_buffer_prototype()
         ), f"prototype is not supported within shards currently. diff: {prototype} != {default_buffer_prototype()}"
-        return self.shard_dict.get(self.chunk_coords)
+        value = self.shard_dict.get(self.chunk_coords)
+        if value is None or byte_range is None:
+            return value
+        # the inner chunk is in memory, so byte ranges are views of it
+        start, length = _normalize_interval_index(value, byte_range)
+        return value[start : start + length]
 
 
 @dataclass(frozen=True)
@@ -95,6 +107,26 @@ class _ShardingByteSetter(_ShardingByteGetter, ByteSetter):
         del self.shard_dict[self.chunk_coords]
 
 
+def _concatenate_buffers(buffers: list[Buffer], prototype: BufferPrototype) -> Buffer:
+    """Concatenates buffers with a single copy."""
+    if len(buffers) == 1:
+        return buffers[0]
+    if not buffers:
+        return prototype.buffer.create_zero_length()
+    return prototype.buffer.from_array_like(
+        np.concatenate([np.asanyarray(buf.as_array_like()) for buf in buffers])
+    )
+
+
+def _as_bytes_like(buf: Buffer) -> BytesLike:
+    return memoryview(buf.as_numpy_array())  # type: ignore[arg-type]
+
+
+def _coords_to_index(all_chunk_coords: Iterable[ChunkCoords]) -> tuple[npt.NDArray[np.intp], ...]:
+    """Converts chunk coordinates into an index for advanced indexing of per-chunk arrays."""
+    return tuple(np.array(list(all_chunk_coords), dtype=np.intp).T)
+
+
 class _ShardIndex(NamedTuple):
     # dtype uint64, shape (chunks_per_shard_0, chunks_per_shard_1, ..., 2)
     offsets_and_lengths: npt.NDArray[np.uint64]
@@ -134,24 +166,14 @@ class _ShardIndex(NamedTuple):
             )
 
     def is_dense(self, chunk_byte_length: int) -> bool:
-        sorted_offsets_and_lengths = sorted(
-            [
-                (offset, length)
-                for offset, length in self.offsets_and_lengths
-                if offset != MAX_UINT_64
-            ],
-            key=itemgetter(0),
-        )
+        offsets, lengths = self.offsets_and_lengths[self.get_full_chunk_map()].T
 
         # Are all non-empty offsets unique?
-        if len(
-            set(offset for offset, _ in sorted_offsets_and_lengths if offset != MAX_UINT_64)
-        ) != len(sorted_offsets_and_lengths):
+        if len(np.unique(offsets)) != len(offsets):
             return False
 
-        return all(
-            offset % chunk_byte_length == 0 and length == chunk_byte_length
-            for offset, length in sorted_offsets_and_lengths
+        return bool(
+            np.all(offsets % chunk_byte_length == 0) and np.all(lengths == chunk_byte_length)
         )
 
     @classmethod
@@ -161,6 +183,84 @@ class _ShardIndex(NamedTuple):
         return cls(offsets_and_lengths)
 
 
+@dataclass(frozen=True)
+class ShardIndexCacheStats:
+    """Statistics of the shard index cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    nbytes: int
+    max_nbytes: int
+
+
+class _ShardIndexCache:
+    """LRU cache of decoded shard indexes, keyed by the path of the shard.
+    The size of the cache in bytes is limited by ``sharding.index_cache_size``."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[Any, _ShardIndex]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, path: str, index_key: Any) -> _ShardIndex | None:
+        if config.get("sharding.index_cache_size") <= 0:
+            return None
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != index_key:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(path)
+        self._hits += 1
+        return entry[1]
+
+    def set(self, path: str, index_key: Any, index: _ShardIndex) -> None:
+        max_nbytes = config.get("sharding.index_cache_size")
+        if index.offsets_and_lengths.nbytes > max_nbytes:
+            return
+        self.invalidate(path)
+        self._entries[path] = (index_key, index)
+        self._nbytes += index.offsets_and_lengths.nbytes
+        while self._nbytes > max_nbytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted.offsets_and_lengths.nbytes
+            self._evictions += 1
+
+    def invalidate(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._nbytes -= entry[1].offsets_and_lengths.nbytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+    def stats(self) -> ShardIndexCacheStats:
+        return ShardIndexCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            nbytes=self._nbytes,
+            max_nbytes=config.get("sharding.index_cache_size"),
+        )
+
+
+_shard_index_cache = _ShardIndexCache()
+
+
+def shard_index_cache_stats() -> ShardIndexCacheStats:
+    """Returns the statistics of the shard index cache, which is enabled by setting
+    ``sharding.index_cache_size`` to a positive number of bytes.
+
+    Returns
+    -------
+    ShardIndexCacheStats
+    """
+    return _shard_index_cache.stats()
+
+
 class _ShardReader(ShardMapping):
     buf: Buffer
     index: _ShardIndex
@@ -209,8 +309,14 @@ class _ShardReader(ShardMapping):
 
 
 class _ShardBuilder(_ShardReader, ShardMutableMapping):
-    buf: Buffer
+    """Collects the encoded inner chunks of a shard. The chunks are only copied once, when the
+    shard is finalized."""
+
     index: _ShardIndex
+    prototype: BufferPrototype
+    parts: list[Buffer]
+    chunks: dict[ChunkCoords, Buffer]
+    nbytes: int
 
     @classmethod
     def merge_with_morton_order(
@@ -220,14 +326,31 @@ class _ShardBuilder(_ShardReader, ShardMutableMapping):
         *shard_dicts: ShardMapping,
     ) -> _ShardBuilder:
         obj = cls.create_empty(chunks_per_shard)
-        for chunk_coords in morton_order_iter(chunks_per_shard):
+        flat_indices: list[int] = []
+        for flat_index, chunk_coords in zip(
+            morton_order(chunks_per_shard).tolist(),
+            morton_order_iter(chunks_per_shard),
+            strict=True,
+        ):
             if chunk_coords in tombstones:
                 continue
             for shard_dict in shard_dicts:
                 maybe_value = shard_dict.get(chunk_coords, None)
                 if maybe_value is not None:
-                    obj[chunk_coords] = maybe_value
+                    flat_indices.append(flat_index)
+                    obj.parts.append(maybe_value)
+                    obj.chunks[chunk_coords] = maybe_value
                     break
+
+        # the offsets of all chunks are assigned at once
+        lengths = np.fromiter(
+            (len(value) for value in obj.parts), dtype="<u8", count=len(obj.parts)
+        )
+        ends = np.cumsum(lengths, dtype="<u8")
+        offsets_and_lengths = obj.index.offsets_and_lengths.reshape(-1, 2)
+        offsets_and_lengths[flat_indices, 0] = ends - lengths
+        offsets_and_lengths[flat_indices, 1] = lengths
+        obj.nbytes = int(ends[-1]) if len(ends) > 0 else 0
         return obj
 
     @classmethod
@@ -237,19 +360,31 @@ class _ShardBuilder(_ShardReader, ShardMutableMapping):
         if buffer_prototype is None:
             buffer_prototype = default_buffer_prototype()
         obj = cls()
-        obj.buf = buffer_prototype.buffer.create_zero_length()
         obj.index = _ShardIndex.create_empty(chunks_per_shard)
+        obj.prototype = buffer_prototype
+        obj.parts = []
+        obj.chunks = {}
+        obj.nbytes = 0
         return obj
 
+    def __getitem__(self, chunk_coords: ChunkCoords) -> Buffer:
+        return self.chunks[self.index._localize_chunk(chunk_coords)]
+
     def __setitem__(self, chunk_coords: ChunkCoords, value: Buffer) -> None:
-        chunk_start = len(self.buf)
+        chunk_start = self.nbytes
         chunk_length = len(value)
-        self.buf = self.buf + value
+        self.parts.append(value)
+        self.chunks[self.index._localize_chunk(chunk_coords)] = value
+        self.nbytes += chunk_length
         self.index.set_chunk_slice(chunk_coords, slice(chunk_start, chunk_start + chunk_length))
 
     def __delitem__(self, chunk_coords: ChunkCoords) -> None:
         raise NotImplementedError
 
+    def to_buffer(self, *suffix: Buffer) -> Buffer:
+        """Concatenates the chunks, followed by `suffix`, into a single buffer."""
+        return _concatenate_buffers([*self.parts, *suffix], self.prototype)
+
     async def finalize(
         self,
         index_location: ShardingCodecIndexLocation,
@@ -257,12 +392,19 @@ class _ShardBuilder(_ShardReader, ShardMutableMapping):
     ) -> Buffer:
         index_bytes = await index_encoder(self.index)
         if index_location == ShardingCodecIndexLocation.start:
-            self.index.offsets_and_lengths[..., 0] += len(index_bytes)
+            full_chunk_map = self.index.get_full_chunk_map()
+            self.index.offsets_and_lengths[full_chunk_map, 0] += len(index_bytes)
             index_bytes = await index_encoder(self.index)  # encode again with corrected offsets
-            out_buf = index_bytes + self.buf
-        else:
-            out_buf = self.buf + index_bytes
-        return out_buf
+            return _concatenate_buffers([index_bytes, *self.parts], self.prototype)
+        return self.to_buffer(index_bytes)
+
+
+class _ShardSlab(dict[ChunkCoords, Buffer]):
+    """Encoded inner chunks of a slab of a shard. Chunks that are deleted by the codec pipeline,
+    because they only contain the fill value, are simply not written."""
+
+    def __delitem__(self, chunk_coords: ChunkCoords) -> None:
+        self.pop(chunk_coords, None)
 
 
 @dataclass(frozen=True)
@@ -294,8 +436,8 @@ class _MergingShardBuilder(ShardMutableMapping):
         full_chunk_coords_map = np.logical_or(
             full_chunk_coords_map, self.new_dict.index.get_full_chunk_map()
         )
-        for tombstone in self.tombstones:
-            full_chunk_coords_map[tombstone] = False
+        if self.tombstones:
+            full_chunk_coords_map[_coords_to_index(self.tombstones)] = False
         return bool(np.array_equiv(full_chunk_coords_map, False))
 
     async def finalize(
@@ -312,6 +454,47 @@ class _MergingShardBuilder(ShardMutableMapping):
         return await shard_builder.finalize(index_location, index_encoder)
 
 
+@dataclass(frozen=True)
+class _AppendingShardBuilder(ShardMutableMapping):
+    """Collects the inner chunks that are written to an existing shard, so that they can be
+    appended to the shard instead of rewriting it. `old_dict` only holds the existing chunks
+    that are needed to merge partial writes."""
+
+    old_dict: ShardMapping
+    old_index: _ShardIndex
+    new_dict: _ShardBuilder
+    tombstones: set[ChunkCoords] = field(default_factory=set)
+
+    def __getitem__(self, chunk_coords: ChunkCoords) -> Buffer:
+        chunk_bytes_maybe = self.new_dict.get(chunk_coords)
+        if chunk_bytes_maybe is not None:
+            return chunk_bytes_maybe
+        return self.old_dict[chunk_coords]
+
+    def __setitem__(self, chunk_coords: ChunkCoords, value: Buffer) -> None:
+        self.new_dict[chunk_coords] = value
+
+    def __delitem__(self, chunk_coords: ChunkCoords) -> None:
+        self.tombstones.add(chunk_coords)
+
+    def __len__(self) -> int:
+        return self.new_dict.__len__()
+
+    def __iter__(self) -> Iterator[ChunkCoords]:
+        return self.new_dict.__iter__()
+
+    def finalize_index(self, offset: int) -> _ShardIndex:
+        """Returns the index of the shard after the new chunks have been appended at `offset`."""
+        index = _ShardIndex(self.old_index.offsets_and_lengths.copy())
+        new_chunk_map = self.new_dict.index.get_full_chunk_map()
+        index.offsets_and_lengths[new_chunk_map] = self.new_dict.index.offsets_and_lengths[
+            new_chunk_map
+        ] + np.array([offset, 0], dtype="<u8")
+        if self.tombstones:
+            index.offsets_and_lengths[_coords_to_index(self.tombstones)] = MAX_UINT_64
+        return index
+
+
 @dataclass(frozen=True)
 class ShardingCodec(
     ArrayBytesCodec, ArrayBytesCodecPartialDecodeMixin, ArrayBytesCodecPartialEncodeMixin
@@ -343,6 +526,7 @@ class ShardingCodec(
         object.__setattr__(self, "_get_chunk_spec", lru_cache()(self._get_chunk_spec))
         object.__setattr__(self, "_get_index_chunk_spec", lru_cache()(self._get_index_chunk_spec))
         object.__setattr__(self, "_get_chunks_per_shard", lru_cache()(self._get_chunks_per_shard))
+        object.__setattr__(self, "_get_index_pipeline", lru_cache()(self._get_index_pipeline))
 
     # todo: typedict return type
     def __getstate__(self) -> dict[str, Any]:
@@ -359,6 +543,7 @@ class ShardingCodec(
         object.__setattr__(self, "_get_chunk_spec", lru_cache()(self._get_chunk_spec))
         object.__setattr__(self, "_get_index_chunk_spec", lru_cache()(self._get_index_chunk_spec))
         object.__setattr__(self, "_get_chunks_per_shard", lru_cache()(self._get_chunks_per_shard))
+        object.__setattr__(self, "_get_index_pipeline", lru_cache()(self._get_index_pipeline))
 
     @classmethod
     def from_dict(cls, data: dict[str, JSON]) -> Self:
@@ -424,7 +609,7 @@ class ShardingCodec(
 
         # setup output array
         out = chunk_spec.prototype.nd_buffer.create(
-            shape=shard_shape, dtype=shard_spec.dtype, order=shard_spec.order, fill_value=0
+            shape=shard_shape, dtype=shard_spec.dtype, order=shard_spec.order
         )
         shard_dict = await _ShardReader.from_bytes(shard_bytes, self, chunks_per_shard)
 
@@ -467,7 +652,7 @@ class ShardingCodec(
 
         # setup output array
         out = shard_spec.prototype.nd_buffer.create(
-            shape=indexer.shape, dtype=shard_spec.dtype, order=shard_spec.order, fill_value=0
+            shape=indexer.shape, dtype=shard_spec.dtype, order=shard_spec.order
         )
 
         indexed_chunks = list(indexer)
@@ -475,6 +660,7 @@ class ShardingCodec(
 
         # reading bytes of all requested chunks
         shard_dict: ShardMapping = {}
+        shard_dict_maybe: ShardMapping | None
         if self._is_total_shard(all_chunk_coords, chunks_per_shard):
             # read entire shard
             shard_dict_maybe = await self._load_full_shard_maybe(
@@ -487,18 +673,15 @@ class ShardingCodec(
             shard_dict = shard_dict_maybe
         else:
             # read some chunks within the shard
-            shard_index = await self._load_shard_index_maybe(byte_getter, chunks_per_shard)
-            if shard_index is None:
+            shard_dict_maybe = await self._load_partial_shard_maybe(
+                byte_getter=byte_getter,
+                prototype=chunk_spec.prototype,
+                chunks_per_shard=chunks_per_shard,
+                all_chunk_coords=all_chunk_coords,
+            )
+            if shard_dict_maybe is None:
                 return None
-            shard_dict = {}
-            for chunk_coords in all_chunk_coords:
-                chunk_byte_slice = shard_index.get_chunk_slice(chunk_coords)
-                if chunk_byte_slice:
-                    chunk_bytes = await byte_getter.get(
-                        prototype=chunk_spec.prototype, byte_range=chunk_byte_slice
-                    )
-                    if chunk_bytes:
-                        shard_dict[chunk_coords] = chunk_bytes
+            shard_dict = shard_dict_maybe
 
         # decoding chunks and writing them into the output buffer
         await self.codec_pipeline.read(
@@ -562,6 +745,29 @@ class ShardingCodec(
         chunks_per_shard = self._get_chunks_per_shard(shard_spec)
         chunk_spec = self._get_chunk_spec(shard_spec)
 
+        indexer = list(
+            get_indexer(
+                selection, shape=shard_shape, chunk_grid=RegularChunkGrid(chunk_shape=chunk_shape)
+            )
+        )
+
+        write_mode = config.get("sharding.write_mode")
+        if write_mode not in ("rewrite", "append"):
+            raise ValueError(
+                f"sharding.write_mode must be 'rewrite' or 'append', got {write_mode!r}."
+            )
+        if is_total_slice(selection, shard_shape):
+            # the existing shard is overwritten entirely, so it does not need to be read
+            await self._encode_streaming(byte_setter, shard_array, indexer, shard_spec)
+            return
+        if (
+            write_mode == "append"
+            and isinstance(byte_setter, StorePath)
+            and byte_setter.store.supports_partial_writes
+            and await self._encode_partial_append(byte_setter, shard_array, indexer, shard_spec)
+        ):
+            return
+
         shard_dict = _MergingShardBuilder(
             await self._load_full_shard_maybe(
                 byte_getter=byte_setter,
@@ -572,12 +778,6 @@ class ShardingCodec(
             _ShardBuilder.create_empty(chunks_per_shard),
         )
 
-        indexer = list(
-            get_indexer(
-                selection, shape=shard_shape, chunk_grid=RegularChunkGrid(chunk_shape=chunk_shape)
-            )
-        )
-
         await self.codec_pipeline.write(
             [
                 (
@@ -600,22 +800,245 @@ class ShardingCodec(
                     self._encode_shard_index,
                 )
             )
+        if isinstance(byte_setter, StorePath):
+            _shard_index_cache.invalidate(str(byte_setter))
+
+    async def _encode_streaming(
+        self,
+        byte_setter: ByteSetter,
+        shard_array: NDBuffer,
+        indexer: list[ChunkProjection],
+        shard_spec: ArraySpec,
+    ) -> None:
+        """Encodes a complete shard in slabs of inner chunks. For stores that support partial
+        writes, the encoded chunks are flushed to the store whenever more than
+        ``sharding.write_buffer_size`` bytes have accumulated, and the index is written last.
+        Smaller shards are written with a single request."""
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        chunk_spec = self._get_chunk_spec(shard_spec)
+        buffer_size = config.get("sharding.write_buffer_size")
+        can_flush = (
+            buffer_size > 0
+            and isinstance(byte_setter, StorePath)
+            and byte_setter.store.supports_partial_writes
+        )
+
+        # the inner chunks are encoded in Morton order, so that the shard layout does not
+        # depend on the slab size
+        morton_rank = np.empty(product(chunks_per_shard), dtype=np.intp)
+        morton_rank[morton_order(chunks_per_shard)] = np.arange(len(morton_rank))
+        flat_indices = np.ravel_multi_index(
+            _coords_to_index(chunk_coords for chunk_coords, _, _ in indexer), chunks_per_shard
+        )
+        indexer = [indexer[i] for i in np.argsort(morton_rank[flat_indices]).tolist()]
+        chunk_nbytes = product(self.chunk_shape) * shard_spec.dtype.itemsize
+        slab_len = max(1, buffer_size // chunk_nbytes) if can_flush else len(indexer)
+
+        shard_index = _ShardIndex.create_empty(chunks_per_shard)
+        index_size = self._shard_index_size(chunks_per_shard)
+        # position of the next flushed chunk in the shard
+        offset = index_size if self.index_location == ShardingCodecIndexLocation.start else 0
+        shard_builder = _ShardBuilder.create_empty(chunks_per_shard)
+        flushed = False
+
+        async def _flush() -> None:
+            nonlocal shard_builder, offset, flushed
+            assert isinstance(byte_setter, StorePath)
+            full_chunk_map = shard_builder.index.get_full_chunk_map()
+            shard_index.offsets_and_lengths[full_chunk_map] = (
+                shard_builder.index.offsets_and_lengths[full_chunk_map]
+                + np.array([offset, 0], dtype="<u8")
+            )
+            if flushed:
+                await byte_setter.store.set_partial_values(
+                    [(byte_setter.path, offset, _as_bytes_like(shard_builder.to_buffer()))]
+                )
+            elif self.index_location == ShardingCodecIndexLocation.start:
+                # reserve space for the index, which is written last
+                placeholder = shard_builder.prototype.buffer.from_bytes(bytes(index_size))
+                await byte_setter.set(
+                    _concatenate_buffers(
+                        [placeholder, *shard_builder.parts], shard_builder.prototype
+                    )
+                )
+            else:
+                await byte_setter.set(shard_builder.to_buffer())
+            offset += shard_builder.nbytes
+            shard_builder = _ShardBuilder.create_empty(chunks_per_shard)
+            flushed = True
+
+        for slab_start in range(0, len(indexer), slab_len):
+            slab = indexer[slab_start : slab_start + slab_len]
+            slab_dict = _ShardSlab()
+            await self.codec_pipeline.write(
+                [
+                    (
+                        _ShardingByteSetter(slab_dict, chunk_coords),
+                        chunk_spec,
+                        chunk_selection,
+                        out_selection,
+                    )
+                    for chunk_coords, chunk_selection, out_selection in slab
+                ],
+                shard_array,
+            )
+            for chunk_coords, _, _ in slab:
+                if chunk_coords in slab_dict:
+                    shard_builder[chunk_coords] = slab_dict[chunk_coords]
+            if can_flush and shard_builder.nbytes >= buffer_size:
+                await _flush()
+
+        if isinstance(byte_setter, StorePath):
+            _shard_index_cache.invalidate(str(byte_setter))
+        if not flushed:
+            if shard_builder.is_empty():
+                await byte_setter.delete()
+            else:
+                await byte_setter.set(
+                    await shard_builder.finalize(self.index_location, self._encode_shard_index)
+                )
+            return
+        if shard_builder.nbytes > 0:
+            await _flush()
+
+        assert isinstance(byte_setter, StorePath)
+        index_bytes = await self._encode_shard_index(shard_index)
+        index_start = 0 if self.index_location == ShardingCodecIndexLocation.start else offset
+        await byte_setter.store.set_partial_values(
+            [(byte_setter.path, index_start, _as_bytes_like(index_bytes))]
+        )
+
+    async def _encode_partial_append(
+        self,
+        byte_setter: StorePath,
+        shard_array: NDBuffer,
+        indexer: list[ChunkProjection],
+        shard_spec: ArraySpec,
+    ) -> bool:
+        """Appends the written inner chunks to an existing shard and rewrites only its index.
+        The replaced chunks are left as dead space, see `compact_shard`.
+        Returns False, if the shard does not exist yet."""
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        chunk_spec = self._get_chunk_spec(shard_spec)
+
+        try:
+            shard_size = await byte_setter.getsize()
+        except FileNotFoundError:
+            return False
+        shard_index = await self._load_shard_index_maybe(byte_setter, chunks_per_shard)
+        if shard_index is None:
+            return False
+
+        # existing chunks are only needed if they are partially overwritten
+        partial_chunk_coords = {
+            chunk_coords
+            for chunk_coords, chunk_selection, _ in indexer
+            if not is_total_slice(chunk_selection, self.chunk_shape)
+        }
+        shard_dict = _AppendingShardBuilder(
+            await self._load_chunks(
+                byte_setter, chunk_spec.prototype, shard_index, partial_chunk_coords
+            )
+            if partial_chunk_coords
+            else {},
+            shard_index,
+            _ShardBuilder.create_empty(chunks_per_shard),
+        )
+
+        await self.codec_pipeline.write(
+            [
+                (
+                    _ShardingByteSetter(shard_dict, chunk_coords),
+                    chunk_spec,
+                    chunk_selection,
+                    out_selection,
+                )
+                for chunk_coords, chunk_selection, out_selection in indexer
+            ],
+            shard_array,
+        )
+
+        if self.index_location == ShardingCodecIndexLocation.start:
+            data_end = shard_size
+        else:
+            # the new chunks overwrite the old index
+            data_end = shard_size - self._shard_index_size(chunks_per_shard)
+        new_index = shard_dict.finalize_index(data_end)
+        cache_path = str(byte_setter)
+        _shard_index_cache.invalidate(cache_path)
+        if new_index.is_all_empty():
+            await byte_setter.delete()
+            return True
+
+        index_bytes = await self._encode_shard_index(new_index)
+        if self.index_location == ShardingCodecIndexLocation.start:
+            key_start_values = [(data_end, shard_dict.new_dict.to_buffer()), (0, index_bytes)]
+        else:
+            key_start_values = [(data_end, shard_dict.new_dict.to_buffer(index_bytes))]
+        await byte_setter.store.set_partial_values(
+            [
+                (byte_setter.path, start, _as_bytes_like(value))
+                for start, value in key_start_values
+                if len(value) > 0
+            ]
+        )
+        _shard_index_cache.set(
+            cache_path, (chunks_per_shard, self.index_codecs, self.index_location), new_index
+        )
+        return True
+
+    async def compact_shard(self, byte_setter: ByteSetter, shard_spec: ArraySpec) -> bool:
+        """Rewrites a shard without the dead space that is left behind by appending writes
+        (``sharding.write_mode = "append"``).
+
+        Parameters
+        ----------
+        byte_setter : ByteSetter
+        shard_spec : ArraySpec
+
+        Returns
+        -------
+        bool
+            True, if the shard was rewritten.
+        """
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        shard_dict = await self._load_full_shard_maybe(
+            byte_getter=byte_setter,
+            prototype=shard_spec.prototype,
+            chunks_per_shard=chunks_per_shard,
+        )
+        if shard_dict is None:
+            return False
+        full_chunk_map = shard_dict.index.get_full_chunk_map()
+        live_nbytes = int(shard_dict.index.offsets_and_lengths[full_chunk_map, 1].sum())
+        if live_nbytes + self._shard_index_size(chunks_per_shard) == len(shard_dict.buf):
+            return False
+
+        shard_builder = _ShardBuilder.merge_with_morton_order(chunks_per_shard, set(), shard_dict)
+        await byte_setter.set(
+            await shard_builder.finalize(self.index_location, self._encode_shard_index)
+        )
+        if isinstance(byte_setter, StorePath):
+            _shard_index_cache.invalidate(str(byte_setter))
+        return True
 
     def _is_total_shard(
         self, all_chunk_coords: set[ChunkCoords], chunks_per_shard: ChunkCoords
     ) -> bool:
-        return len(all_chunk_coords) == product(chunks_per_shard) and all(
-            chunk_coords in all_chunk_coords for chunk_coords in c_order_iter(chunks_per_shard)
+        if len(all_chunk_coords) != product(chunks_per_shard):
+            return False
+        # the coordinates are unique, so they cover the shard if they are all within it
+        coords = np.array(list(all_chunk_coords), dtype=np.int64).reshape(
+            len(all_chunk_coords), len(chunks_per_shard)
         )
+        return bool(np.all((coords >= 0) & (coords < np.array(chunks_per_shard, dtype=np.int64))))
 
     async def _decode_shard_index(
         self, index_bytes: Buffer, chunks_per_shard: ChunkCoords
     ) -> _ShardIndex:
         index_array = next(
             iter(
-                await get_pipeline_class()
-                .from_list(self.index_codecs)
-                .decode(
+                await self._get_index_pipeline(get_pipeline_class()).decode(
                     [(index_bytes, self._get_index_chunk_spec(chunks_per_shard))],
                 )
             )
@@ -626,9 +1049,7 @@ class ShardingCodec(
     async def _encode_shard_index(self, index: _ShardIndex) -> Buffer:
         index_bytes = next(
             iter(
-                await get_pipeline_class()
-                .from_list(self.index_codecs)
-                .encode(
+                await self._get_index_pipeline(get_pipeline_class()).encode(
                     [
                         (
                             get_ndbuffer_class().from_numpy_array(index.offsets_and_lengths),
@@ -643,14 +1064,13 @@ class ShardingCodec(
         return index_bytes
 
     def _shard_index_size(self, chunks_per_shard: ChunkCoords) -> int:
-        return (
-            get_pipeline_class()
-            .from_list(self.index_codecs)
-            .compute_encoded_size(
-                16 * product(chunks_per_shard), self._get_index_chunk_spec(chunks_per_shard)
-            )
+        return self._get_index_pipeline(get_pipeline_class()).compute_encoded_size(
+            16 * product(chunks_per_shard), self._get_index_chunk_spec(chunks_per_shard)
         )
 
+    def _get_index_pipeline(self, pipeline_class: type[CodecPipeline]) -> CodecPipeline:
+        return pipeline_class.from_list(self.index_codecs)
+
     def _get_index_chunk_spec(self, chunks_per_shard: ChunkCoords) -> ArraySpec:
         return ArraySpec(
             shape=chunks_per_shard + (2,),
@@ -681,6 +1101,22 @@ class ShardingCodec(
 
     async def _load_shard_index_maybe(
         self, byte_getter: ByteGetter, chunks_per_shard: ChunkCoords
+    ) -> _ShardIndex | None:
+        # only shards in stores are cached, not shards nested in other shards
+        cache_path = str(byte_getter) if isinstance(byte_getter, StorePath) else None
+        cache_key = (chunks_per_shard, self.index_codecs, self.index_location)
+        if cache_path is not None:
+            shard_index = _shard_index_cache.get(cache_path, cache_key)
+            if shard_index is not None:
+                return shard_index
+            shard_index = await self._fetch_shard_index_maybe(byte_getter, chunks_per_shard)
+            if shard_index is not None:
+                _shard_index_cache.set(cache_path, cache_key, shard_index)
+            return shard_index
+        return await self._fetch_shard_index_maybe(byte_getter, chunks_per_shard)
+
+    async def _fetch_shard_index_maybe(
+        self, byte_getter: ByteGetter, chunks_per_shard: ChunkCoords
     ) -> _ShardIndex | None:
         shard_index_size = self._shard_index_size(chunks_per_shard)
         if self.index_location == ShardingCodecIndexLocation.start:
@@ -713,6 +1149,61 @@ class ShardingCodec(
             else None
         )
 
+    async def _load_partial_shard_maybe(
+        self,
+        byte_getter: ByteGetter,
+        prototype: BufferPrototype,
+        chunks_per_shard: ChunkCoords,
+        all_chunk_coords: set[ChunkCoords],
+    ) -> ShardMapping | None:
+        shard_index = await self._load_shard_index_maybe(byte_getter, chunks_per_shard)
+        if shard_index is None:
+            return None
+        return await self._load_chunks(byte_getter, prototype, shard_index, all_chunk_coords)
+
+    async def _load_chunks(
+        self,
+        byte_getter: ByteGetter,
+        prototype: BufferPrototype,
+        shard_index: _ShardIndex,
+        all_chunk_coords: set[ChunkCoords],
+    ) -> dict[ChunkCoords, Buffer]:
+        chunk_coords_and_slices = [
+            (chunk_coords, chunk_byte_slice)
+            for chunk_coords in all_chunk_coords
+            if (chunk_byte_slice := shard_index.get_chunk_slice(chunk_coords)) is not None
+        ]
+        # nearby chunks are fetched with a single request, up to the size cap of the stores
+        merged_byte_slices = _coalesce_byte_ranges(
+            [chunk_byte_slice for _, chunk_byte_slice in chunk_coords_and_slices],
+            config.get("sharding.coalesce_max_gap"),
+            config.get("store.coalesce_max_size"),
+        )
+        byte_ranges: list[tuple[int | None, int | None]] = [
+            (start, end - start) for start, end, _ in merged_byte_slices
+        ]
+        if isinstance(byte_getter, ByteRangesGetter):
+            merged_bytes = await byte_getter.get_partial_values(prototype, byte_ranges)
+        else:
+            merged_bytes = await concurrent_map(
+                [(byte_range,) for byte_range in byte_ranges],
+                lambda byte_range: byte_getter.get(prototype=prototype, byte_range=byte_range),
+                config.get("async.concurrency"),
+            )
+
+        shard_dict: dict[ChunkCoords, Buffer] = {}
+        for (start, _, indices), merged_bytes_maybe in zip(
+            merged_byte_slices, merged_bytes, strict=True
+        ):
+            if merged_bytes_maybe is None:
+                continue
+            for i in indices:
+                chunk_coords, (chunk_start, chunk_end) = chunk_coords_and_slices[i]
+                chunk_bytes = merged_bytes_maybe[chunk_start - start : chunk_end - start]
+                if chunk_bytes:
+                    shard_dict[chunk_coords] = chunk_bytes
+        return shard_dict
+
     def compute_encoded_size(self, input_byte_length: int, shard_spec: ArraySpec) -> int:
         chunks_per_shard = self._get_chunks_per_shard(shard_spec)
         return input_byte_length + self._shard_index_size(chunks_per_shard)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, cast
 
 import numpy as np
 
-from zarr.abc.codec import ArrayArrayCodec
+from zarr.abc.codec import ArrayArrayCodec, ArrayArrayCodecPartialMixin, SyncCodecMixin
 from zarr.core.array_spec import ArraySpec
 from zarr.core.buffer import NDBuffer
 from zarr.core.chunk_grids import ChunkGrid
@@ -16,8 +16,11 @@ from zarr.registry import register_codec
 if TYPE_CHECKING:
     from typing import Any
 
+    import numpy.typing as npt
     from typing_extensions import Self
 
+    from zarr.core.indexing import SelectorTuple
+
 
 def parse_transpose_order(data: JSON | Iterable[int]) -> tuple[int, ...]:
     if not isinstance(data, Iterable):
@@ -28,7 +31,9 @@ def parse_transpose_order(data: JSON | Iterable[int]) -> tuple[int, ...]:
 
 
 @dataclass(frozen=True)
-class TransposeCodec(ArrayArrayCodec):
+class TransposeCodec(
+    ArrayArrayCodec, ArrayArrayCodecPartialMixin, SyncCodecMixin[NDBuffer, NDBuffer]
+):
     is_fixed_size = True
 
     order: tuple[int, ...]
@@ -93,12 +98,26 @@ class TransposeCodec(ArrayArrayCodec):
         self,
         chunk_array: NDBuffer,
         chunk_spec: ArraySpec,
+    ) -> NDBuffer:
+        return self._decode_sync(chunk_array, chunk_spec)
+
+    def _decode_sync(
+        self,
+        chunk_array: NDBuffer,
+        chunk_spec: ArraySpec,
     ) -> NDBuffer:
         inverse_order = np.argsort(self.order)
         chunk_array = chunk_array.transpose(inverse_order)
         return chunk_array
 
     async def _encode_single(
+        self,
+        chunk_array: NDBuffer,
+        chunk_spec: ArraySpec,
+    ) -> NDBuffer | None:
+        return self._encode_sync(chunk_array, chunk_spec)
+
+    def _encode_sync(
         self,
         chunk_array: NDBuffer,
         _chunk_spec: ArraySpec,
@@ -106,6 +125,31 @@ class TransposeCodec(ArrayArrayCodec):
         chunk_array = chunk_array.transpose(self.order)
         return chunk_array
 
+    def _encode_selection(
+        self, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> SelectorTuple | None:
+        # only basic selections are permuted, fancy selections may be broadcast together
+        if not isinstance(selection, tuple) or len(selection) != len(self.order):
+            return None
+        if not all(isinstance(s, slice | int | np.integer) for s in selection):
+            return None
+        return tuple(selection[i] for i in self.order)
+
+    def _selected_axes_order(self, selection: SelectorTuple) -> npt.NDArray[np.intp]:
+        # integer selectors drop their axis, the other axes keep their transposed order
+        assert isinstance(selection, tuple)
+        return np.argsort([i for i in self.order if isinstance(selection[i], slice)])
+
+    def _decode_partial_array(
+        self, chunk_array: NDBuffer, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> NDBuffer:
+        return chunk_array.transpose(self._selected_axes_order(selection))
+
+    def _encode_partial_array(
+        self, chunk_array: NDBuffer, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> NDBuffer:
+        return chunk_array.transpose(np.argsort(self._selected_axes_order(selection)))
+
     def compute_encoded_size(self, input_byte_length: int, _chunk_spec: ArraySpec) -> int:
         return input_byte_length
 
@@ -7,13 +7,16 @@ from typing import TYPE_CHECKING
 
 from numcodecs.zstd import Zstd
 
-from zarr.abc.codec import BytesBytesCodec
+from zarr.abc.codec import BytesBytesCodec, SyncCodecMixin
 from zarr.core.array_spec import ArraySpec
-from zarr.core.buffer import Buffer, as_numpy_array_wrapper
-from zarr.core.common import JSON, parse_named_configuration, to_thread
+from zarr.core.buffer import Buffer
+from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.executor import get_codec_executor
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
     from typing_extensions import Self
 
 
@@ -31,8 +34,23 @@ def parse_checksum(data: JSON) -> bool:
     raise TypeError(f"Expected bool. Got {type(data)}.")
 
 
+def _frame_content_size(data: bytes) -> int | None:
+    """Returns the decompressed size from the header of a zstd frame, if it is stored."""
+    if len(data) < 6 or data[:4] != b"\x28\xb5\x2f\xfd":
+        return None
+    descriptor = data[4]
+    fcs_flag = descriptor >> 6
+    single_segment = (descriptor >> 5) & 1
+    offset = 5 + (1 - single_segment) + (0, 1, 2, 4)[descriptor & 3]
+    fcs_size = (single_segment, 2, 4, 8)[fcs_flag]
+    if fcs_size == 0 or len(data) < offset + fcs_size:
+        return None
+    size = int.from_bytes(data[offset : offset + fcs_size], "little")
+    return size + 256 if fcs_size == 2 else size
+
+
 @dataclass(frozen=True)
-class ZstdCodec(BytesBytesCodec):
+class ZstdCodec(BytesBytesCodec, SyncCodecMixin[Buffer, Buffer]):
     is_fixed_size = True
 
     level: int = 0
@@ -71,17 +89,46 @@ class ZstdCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await to_thread(
-            as_numpy_array_wrapper, self._zstd_codec.decode, chunk_bytes, chunk_spec.prototype
+        chunk = await get_codec_executor("zstd").run(
+            self._zstd_codec.decode, chunk_bytes.as_numpy_array()
         )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
 
     async def _encode_single(
         self,
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer | None:
-        return await to_thread(
-            as_numpy_array_wrapper, self._zstd_codec.encode, chunk_bytes, chunk_spec.prototype
+        chunk = await get_codec_executor("zstd").run(
+            self._zstd_codec.encode, chunk_bytes.as_numpy_array()
+        )
+        return chunk_spec.prototype.buffer.from_array_like(chunk.reshape(-1).view("b"))
+
+    def _decode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer:
+        return chunk_spec.prototype.buffer.from_bytes(
+            self._zstd_codec.decode(chunk_bytes.as_numpy_array())
+        )
+
+    def _decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> bool:
+        data = chunk_bytes.as_numpy_array()
+        if _frame_content_size(data[:18].tobytes()) != out.nbytes:
+            return False
+        self._zstd_codec.decode(data, out=out)
+        return True
+
+    def _encode_sync(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> Buffer | None:
+        return chunk_spec.prototype.buffer.from_bytes(
+            self._zstd_codec.encode(chunk_bytes.as_numpy_array())
         )
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
@@ -11,10 +11,12 @@ import numpy.typing as npt
 
 from zarr.abc.codec import Codec, CodecPipeline
 from zarr.abc.store import set_or_delete
-from zarr.codecs import BytesCodec
+from zarr.codecs import BytesCodec, ShardingCodec
 from zarr.codecs._v2 import V2Compressor, V2Filters
+from zarr.core.array_spec import ArraySpec
 from zarr.core.attributes import Attributes
 from zarr.core.buffer import BufferPrototype, NDArrayLike, NDBuffer, default_buffer_prototype
+from zarr.core.chunk_cache import _chunk_cache
 from zarr.core.chunk_grids import RegularChunkGrid, _guess_chunks
 from zarr.core.chunk_key_encodings import (
     ChunkKeyEncoding,
@@ -47,6 +49,7 @@ from zarr.core.indexing import (
     OrthogonalIndexer,
     OrthogonalSelection,
     Selection,
+    SelectorTuple,
     VIndex,
     check_fields,
     check_no_multi_fields,
@@ -203,6 +206,9 @@ class AsyncArray:
         else:
             raise ValueError(f"Insupported zarr_format. Got: {zarr_format}")
 
+        # decoded chunks of a previous array at the same path are stale
+        _chunk_cache.invalidate_prefix(f"{result.store_path}/")
+
         if data is not None:
             # insert user-provided data
             await result.setitem(..., data)
@@ -455,29 +461,101 @@ class AsyncArray:
                     f"shape of out argument doesn't match. Expected {indexer.shape}, got {out.shape}"
                 )
         else:
+            # the output is not initialized, because the codec pipeline writes every selected
+            # region, including the fill value for missing chunks
             out_buffer = prototype.nd_buffer.create(
                 shape=indexer.shape,
                 dtype=out_dtype,
                 order=self.order,
-                fill_value=self.metadata.fill_value,
             )
         if product(indexer.shape) > 0:
-            # reading chunks and decoding them
-            await self.codec_pipeline.read(
-                [
-                    (
-                        self.store_path / self.metadata.encode_chunk_key(chunk_coords),
-                        self.metadata.get_chunk_spec(chunk_coords, self.order, prototype=prototype),
-                        chunk_selection,
-                        out_selection,
-                    )
-                    for chunk_coords, chunk_selection, out_selection in indexer
-                ],
-                out_buffer,
-                drop_axes=indexer.drop_axes,
-            )
+            batch_info: list[tuple[StorePath, ArraySpec, SelectorTuple, SelectorTuple]] = [
+                (
+                    self.store_path / self.metadata.encode_chunk_key(chunk_coords),
+                    self.metadata.get_chunk_spec(chunk_coords, self.order, prototype=prototype),
+                    chunk_selection,
+                    out_selection,
+                )
+                for chunk_coords, chunk_selection, out_selection in indexer
+            ]
+            if _chunk_cache.enabled:
+                batch_info = await self._read_cached_chunks(
+                    batch_info, out_buffer, indexer.drop_axes, prototype=prototype
+                )
+            if batch_info:
+                # reading chunks and decoding them
+                await self.codec_pipeline.read(
+                    batch_info,
+                    out_buffer,
+                    drop_axes=indexer.drop_axes,
+                )
         return out_buffer.as_ndarray_like()
 
+    def _chunk_cache_key(self, chunk_spec: ArraySpec) -> Any:
+        return (self.codec_pipeline, chunk_spec.shape, chunk_spec.dtype, chunk_spec.prototype)
+
+    async def _read_cached_chunks(
+        self,
+        batch_info: list[tuple[StorePath, ArraySpec, SelectorTuple, SelectorTuple]],
+        out: NDBuffer,
+        drop_axes: tuple[int, ...],
+        *,
+        prototype: BufferPrototype,
+    ) -> list[tuple[StorePath, ArraySpec, SelectorTuple, SelectorTuple]]:
+        """Reads the selected chunks from the decoded chunk cache. Chunks that are not cached
+        yet are decoded as a whole and added to the cache, unless they are written while being
+        read. For sharded arrays, the chunks are the shards. Returns the chunks that do not fit
+        into the cache."""
+
+        def _scatter(
+            chunk_array: NDBuffer, chunk_selection: SelectorTuple, out_selection: SelectorTuple
+        ) -> None:
+            tmp = chunk_array[chunk_selection]
+            if drop_axes != ():
+                tmp = tmp.squeeze(axis=drop_axes)
+            out[out_selection] = tmp
+
+        remaining = []
+        missing = []
+        for item in batch_info:
+            chunk_path, chunk_spec, chunk_selection, out_selection = item
+            chunk_array = _chunk_cache.get(str(chunk_path), self._chunk_cache_key(chunk_spec))
+            if chunk_array is not None:
+                _scatter(chunk_array, chunk_selection, out_selection)
+            elif product(chunk_spec.shape) * chunk_spec.dtype.itemsize > _chunk_cache.max_nbytes:
+                remaining.append(item)
+            else:
+                missing.append(item)
+        if not missing:
+            return remaining
+
+        # chunks that are invalidated during the read are not cached, as they may be stale
+        generations = [_chunk_cache.generation(str(chunk_path)) for chunk_path, *_ in missing]
+        # the chunks of a regular grid all have the same shape
+        chunk_shape = missing[0][1].shape
+        chunk_arrays = prototype.nd_buffer.create(
+            shape=(len(missing), *chunk_shape), dtype=self.metadata.dtype, order=self.order
+        )
+        total_selection = tuple(slice(0, dim_len, 1) for dim_len in chunk_shape)
+        await self.codec_pipeline.read(
+            [
+                (chunk_path, chunk_spec, total_selection, (i, *total_selection))
+                for i, (chunk_path, chunk_spec, _, _) in enumerate(missing)
+            ],
+            chunk_arrays,
+        )
+        for i, (chunk_path, chunk_spec, chunk_selection, out_selection) in enumerate(missing):
+            chunk_array = chunk_arrays[i]
+            _scatter(chunk_array, chunk_selection, out_selection)
+            # a view would keep the whole batch alive, while the cache only accounts for the chunk
+            _chunk_cache.set(
+                str(chunk_path),
+                self._chunk_cache_key(chunk_spec),
+                chunk_array.copy(),
+                generation=generations[i],
+            )
+        return remaining
+
     async def getitem(
         self,
         selection: BasicSelection,
@@ -527,20 +605,26 @@ class AsyncArray:
         # Buffer and NDBuffer between components.
         value_buffer = prototype.nd_buffer.from_ndarray_like(value)
 
-        # merging with existing data and encoding chunks
-        await self.codec_pipeline.write(
-            [
-                (
-                    self.store_path / self.metadata.encode_chunk_key(chunk_coords),
-                    self.metadata.get_chunk_spec(chunk_coords, self.order, prototype),
-                    chunk_selection,
-                    out_selection,
-                )
-                for chunk_coords, chunk_selection, out_selection in indexer
-            ],
-            value_buffer,
-            drop_axes=indexer.drop_axes,
-        )
+        batch_info = [
+            (
+                self.store_path / self.metadata.encode_chunk_key(chunk_coords),
+                self.metadata.get_chunk_spec(chunk_coords, self.order, prototype),
+                chunk_selection,
+                out_selection,
+            )
+            for chunk_coords, chunk_selection, out_selection in indexer
+        ]
+        try:
+            # merging with existing data and encoding chunks
+            await self.codec_pipeline.write(
+                batch_info,
+                value_buffer,
+                drop_axes=indexer.drop_axes,
+            )
+        finally:
+            # invalidating also tells reads of these chunks that are in flight to not cache them
+            for chunk_path, _, _, _ in batch_info:
+                _chunk_cache.invalidate(str(chunk_path))
 
     async def setitem(
         self,
@@ -571,6 +655,7 @@ class AsyncArray:
 
             async def _delete_key(key: str) -> None:
                 await (self.store_path / key).delete()
+                _chunk_cache.invalidate(str(self.store_path / key))
 
             await concurrent_map(
                 [
@@ -585,6 +670,36 @@ class AsyncArray:
         await self._save_metadata(new_metadata)
         return replace(self, metadata=new_metadata)
 
+    async def compact_shards(self) -> int:
+        """Rewrites the shards of the array without the dead space that is left behind by
+        appending writes (``sharding.write_mode = "append"``).
+
+        Returns
+        -------
+        int
+            The number of rewritten shards.
+        """
+        codecs = self.metadata.codecs if isinstance(self.metadata, ArrayV3Metadata) else ()
+        if len(codecs) != 1 or not isinstance(codecs[0], ShardingCodec):
+            return 0
+        sharding_codec = codecs[0]
+
+        async def _compact_shard(chunk_coords: ChunkCoords) -> bool:
+            return await sharding_codec.compact_shard(
+                self.store_path / self.metadata.encode_chunk_key(chunk_coords),
+                self.metadata.get_chunk_spec(chunk_coords, self.order, default_buffer_prototype()),
+            )
+
+        compacted = await concurrent_map(
+            [
+                (chunk_coords,)
+                for chunk_coords in self.metadata.chunk_grid.all_chunk_coords(self.metadata.shape)
+            ],
+            _compact_shard,
+            config.get("async.concurrency"),
+        )
+        return sum(compacted)
+
     async def update_attributes(self, new_attributes: dict[str, JSON]) -> AsyncArray:
         new_metadata = self.metadata.update_attributes(new_attributes)
 
@@ -2038,6 +2153,17 @@ class Array:
             )
         )
 
+    def compact_shards(self) -> int:
+        """Rewrites the shards of the array without the dead space that is left behind by
+        appending writes (``sharding.write_mode = "append"``).
+
+        Returns
+        -------
+        int
+            The number of rewritten shards.
+        """
+        return sync(self._async_array.compact_shards())
+
     def update_attributes(self, new_attributes: dict[str, JSON]) -> Array:
         return type(self)(
             sync(
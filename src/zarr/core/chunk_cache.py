@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from zarr.core.buffer import NDBuffer
+from zarr.core.config import config
+
+__all__ = ["ChunkCacheStats", "chunk_cache_stats", "clear_chunk_cache"]
+
+
+@dataclass(frozen=True)
+class ChunkCacheStats:
+    """Statistics of the decoded chunk cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    nbytes: int
+    max_nbytes: int
+
+
+class _CacheEntry(NamedTuple):
+    chunk_key: Any
+    chunk_array: NDBuffer
+    nbytes: int
+
+
+def parse_chunk_cache_policy(data: Any) -> str:
+    if data in ("lru", "arc"):
+        return str(data)
+    raise ValueError(f"Expected one of ('lru', 'arc') for `chunk_cache.policy`, got {data!r}.")
+
+
+# Number of generation counters that the paths of chunks are hashed to
+_GENERATION_STRIPES = 4096
+
+
+class _ChunkCache:
+    """Cache of decoded chunks, keyed by the path of the chunk.
+
+    The size of the cache in bytes is limited by ``chunk_cache.size``. Chunks are evicted in
+    least recently used order (``chunk_cache.policy = "lru"``) or with the adaptive replacement
+    policy (``"arc"``). ARC keeps chunks that were read once (`_recent`) apart from chunks that
+    were read repeatedly (`_frequent`) and adapts the share of both by tracking the paths of
+    recently evicted chunks, so that scans over many chunks do not flush the hot chunks.
+
+    Every invalidation bumps the generation of the path, so that a read that overlaps with a
+    write can tell that the chunk it fetched may be stale (see `generation`). To bound the
+    memory, paths share a fixed number of generation counters, which at worst skips caching
+    a chunk that is still valid.
+
+    The cached chunks are the chunks of the chunk grid of an array. For sharded arrays,
+    these are the shards, so that a cache miss decodes and caches the whole shard."""
+
+    def __init__(self) -> None:
+        self._recent: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._frequent: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # paths and sizes of chunks that were evicted from `_recent` and `_frequent` (ARC only)
+        self._recent_ghosts: OrderedDict[str, int] = OrderedDict()
+        self._frequent_ghosts: OrderedDict[str, int] = OrderedDict()
+        # the number of bytes that ARC aims to hold in `_recent`
+        self._target = 0
+        self._recent_nbytes = 0
+        self._frequent_nbytes = 0
+        self._recent_ghosts_nbytes = 0
+        self._frequent_ghosts_nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generations = [0] * _GENERATION_STRIPES
+        # bumped when many paths are invalidated at once
+        self._epoch = 0
+
+    @property
+    def max_nbytes(self) -> int:
+        return int(config.get("chunk_cache.size"))
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_nbytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._recent_nbytes + self._frequent_nbytes
+
+    def __len__(self) -> int:
+        return len(self._recent) + len(self._frequent)
+
+    def get(self, path: str, chunk_key: Any) -> NDBuffer | None:
+        arc = parse_chunk_cache_policy(config.get("chunk_cache.policy")) == "arc"
+        entry = self._recent.get(path)
+        if entry is not None and entry.chunk_key == chunk_key:
+            if arc:
+                del self._recent[path]
+                self._recent_nbytes -= entry.nbytes
+                self._frequent[path] = entry
+                self._frequent_nbytes += entry.nbytes
+            else:
+                self._recent.move_to_end(path)
+            self._hits += 1
+            return entry.chunk_array
+        entry = self._frequent.get(path)
+        if entry is not None and entry.chunk_key == chunk_key:
+            self._frequent.move_to_end(path)
+            self._hits += 1
+            return entry.chunk_array
+        self._misses += 1
+        return None
+
+    def generation(self, path: str) -> tuple[int, int]:
+        """Returns the generation of a path, which changes whenever the path is invalidated."""
+        return (self._epoch, self._generations[hash(path) % _GENERATION_STRIPES])
+
+    def set(
+        self,
+        path: str,
+        chunk_key: Any,
+        chunk_array: NDBuffer,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Adds a chunk to the cache. If `generation` is given, the chunk is only added if the
+        path has not been invalidated since `generation` was taken."""
+        if generation is not None and generation != self.generation(path):
+            return
+        max_nbytes = self.max_nbytes
+        arc = parse_chunk_cache_policy(config.get("chunk_cache.policy")) == "arc"
+        nbytes = chunk_array.as_ndarray_like().size * chunk_array.dtype.itemsize
+        if nbytes > max_nbytes:
+            return
+        self._remove(path)
+        entry = _CacheEntry(chunk_key, chunk_array, nbytes)
+        if not arc:
+            self._recent[path] = entry
+            self._recent_nbytes += nbytes
+            self._evict(max_nbytes, arc=False, frequent_ghost=False)
+            return
+
+        frequent_ghost = path in self._frequent_ghosts
+        if path in self._recent_ghosts:
+            # the chunk was evicted from `_recent` too early, grow its share
+            delta = max(self._frequent_ghosts_nbytes // max(self._recent_ghosts_nbytes, 1), 1)
+            self._target = min(self._target + delta * nbytes, max_nbytes)
+            self._recent_ghosts_nbytes -= self._recent_ghosts.pop(path)
+        elif frequent_ghost:
+            delta = max(self._recent_ghosts_nbytes // max(self._frequent_ghosts_nbytes, 1), 1)
+            self._target = max(self._target - delta * nbytes, 0)
+            self._frequent_ghosts_nbytes -= self._frequent_ghosts.pop(path)
+        else:
+            self._recent[path] = entry
+            self._recent_nbytes += nbytes
+            self._evict(max_nbytes, arc=True, frequent_ghost=False)
+            return
+        self._frequent[path] = entry
+        self._frequent_nbytes += nbytes
+        self._evict(max_nbytes, arc=True, frequent_ghost=frequent_ghost)
+
+    def _evict(self, max_nbytes: int, *, arc: bool, frequent_ghost: bool) -> None:
+        while self.nbytes > max_nbytes:
+            if self._recent and (
+                not arc
+                or not self._frequent
+                or self._recent_nbytes > self._target
+                or (frequent_ghost and self._recent_nbytes == self._target)
+            ):
+                path, entry = self._recent.popitem(last=False)
+                self._recent_nbytes -= entry.nbytes
+                if arc:
+                    self._recent_ghosts[path] = entry.nbytes
+                    self._recent_ghosts_nbytes += entry.nbytes
+            else:
+                path, entry = self._frequent.popitem(last=False)
+                self._frequent_nbytes -= entry.nbytes
+                if arc:
+                    self._frequent_ghosts[path] = entry.nbytes
+                    self._frequent_ghosts_nbytes += entry.nbytes
+            self._evictions += 1
+        while self._recent_ghosts_nbytes > max_nbytes:
+            self._recent_ghosts_nbytes -= self._recent_ghosts.popitem(last=False)[1]
+        while self._frequent_ghosts_nbytes > max_nbytes:
+            self._frequent_ghosts_nbytes -= self._frequent_ghosts.popitem(last=False)[1]
+
+    def invalidate(self, path: str) -> None:
+        self._generations[hash(path) % _GENERATION_STRIPES] += 1
+        self._remove(path)
+
+    def _remove(self, path: str) -> None:
+        entry = self._recent.pop(path, None)
+        if entry is not None:
+            self._recent_nbytes -= entry.nbytes
+        entry = self._frequent.pop(path, None)
+        if entry is not None:
+            self._frequent_nbytes -= entry.nbytes
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        self._epoch += 1
+        for path in [path for path in (*self._recent, *self._frequent) if path.startswith(prefix)]:
+            self._remove(path)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._recent.clear()
+        self._frequent.clear()
+        self._recent_ghosts.clear()
+        self._frequent_ghosts.clear()
+        self._target = 0
+        self._recent_nbytes = 0
+        self._frequent_nbytes = 0
+        self._recent_ghosts_nbytes = 0
+        self._frequent_ghosts_nbytes = 0
+
+    def stats(self) -> ChunkCacheStats:
+        return ChunkCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            nbytes=self.nbytes,
+            max_nbytes=self.max_nbytes,
+        )
+
+
+_chunk_cache = _ChunkCache()
+
+
+def chunk_cache_stats() -> ChunkCacheStats:
+    """Returns the statistics of the decoded chunk cache, which is enabled by setting
+    ``chunk_cache.size`` to a positive number of bytes.
+
+    Returns
+    -------
+    ChunkCacheStats
+    """
+    return _chunk_cache.stats()
+
+
+def clear_chunk_cache() -> None:
+    """Removes all chunks from the decoded chunk cache."""
+    _chunk_cache.clear()
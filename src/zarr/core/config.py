@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from donfig import Config as DConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class BadConfigError(ValueError):
     _msg = "bad Config: %r"
@@ -23,10 +26,58 @@ class Config(DConfig):  # type: ignore[misc]
 
     """
 
+    # incremented whenever the configuration is changed through this object, so that values
+    # that are derived from the configuration can be cached until the next change
+    _generation = 0
+
     def reset(self) -> None:
         self.clear()
         self.refresh()
 
+    def _changed(self) -> None:
+        self._generation += 1
+
+    def set(self, arg: Any = None, **kwargs: Any) -> _ConfigSet:
+        config_set = _ConfigSet(super().set(arg, **kwargs), self._changed)
+        self._changed()
+        return config_set
+
+    def refresh(self, **kwargs: Any) -> None:
+        super().refresh(**kwargs)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def update(self, new: Any, priority: str = "new") -> None:
+        super().update(new, priority=priority)
+        self._changed()
+
+    def merge(self, *dicts: Any) -> None:
+        super().merge(*dicts)
+        self._changed()
+
+    def update_defaults(self, new: Any) -> None:
+        super().update_defaults(new)
+        self._changed()
+
+
+class _ConfigSet:
+    """Wraps the context manager of ``Config.set`` to record that the previous values are
+    restored on exit."""
+
+    def __init__(self, config_set: Any, on_exit: Callable[[], None]) -> None:
+        self._config_set = config_set
+        self._on_exit = on_exit
+
+    def __enter__(self) -> Any:
+        return self._config_set.__enter__()
+
+    def __exit__(self, *args: object) -> None:
+        self._config_set.__exit__(*args)
+        self._on_exit()
+
 
 """
 The config module is responsible for managing the configuration of zarr and  is based on the Donfig python library.
@@ -49,6 +100,27 @@ config = Config(
             "codec_pipeline": {
                 "path": "zarr.codecs.pipeline.BatchedCodecPipeline",
                 "batch_size": 1,
+                "queue_size": 16,
+                "memory_limit": 2**28,
+                "partial_decompress": False,
+            },
+            "threading": {"max_workers": None, "io_workers": None, "compute_workers": None},
+            "sharding": {
+                "coalesce_max_gap": 2**16,
+                "index_cache_size": 0,
+                "write_mode": "rewrite",
+                "write_buffer_size": 2**26,
+            },
+            "chunk_cache": {"size": 0, "policy": "lru"},
+            "store": {
+                "coalesce_max_gap": 2**16,
+                "coalesce_max_size": 2**24,
+                "mmap_cache_size": 1024,
+            },
+            "codec_executor": {
+                "default": "thread",
+                "codecs": {"bytes": "inline", "crc32c": "inline", "transpose": "inline"},
+                "process": {"max_workers": None, "start_method": "spawn"},
             },
             "codecs": {
                 "blosc": "zarr.codecs.blosc.BloscCodec",
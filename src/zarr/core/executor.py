@@ -0,0 +1,449 @@
+"""The executor module determines where CPU-bound codec work is performed.
+Codecs hand their compute kernels (e.g. `GZip.decode`) to a `CodecExecutor`, which is
+selected per codec through the `codec_executor` section of the config, e.g.
+export ZARR_CODEC_EXECUTOR__CODECS='{"gzip": "process"}'
+Codecs are looked up by their name; v2 compressors and filters by their numcodecs id.
+
+Threaded work is split over two dedicated thread pools, configured in the `threading`
+section of the config: an "io" pool (used e.g. by LocalStore) and a "compute" pool (used
+by the thread executor). `threading.max_workers` is the global budget of compute threads.
+If it is set, the budget is shared between the compute pool and the internal threads of
+blosc; otherwise the process-wide blosc settings are left alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar, cast
+
+import numcodecs.blosc
+import numpy as np
+from numcodecs.compat import ensure_ndarray
+
+from zarr.core.config import BadConfigError, config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+__all__ = [
+    "CodecExecutor",
+    "InlineExecutor",
+    "ProcessExecutor",
+    "ThreadExecutor",
+    "ThreadPoolStats",
+    "get_codec_executor",
+    "get_executor",
+    "get_thread_pool",
+    "thread_pool_stats",
+    "to_thread_pool",
+]
+
+P = ParamSpec("P")
+U = TypeVar("U")
+
+ThreadPoolName = Literal["io", "compute"]
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    """Snapshot of the state of a thread pool.
+
+    Attributes
+    ----------
+    max_workers : int
+        The number of threads of the pool.
+    queued : int
+        The number of tasks that are waiting for a thread.
+    active : int
+        The number of tasks that are currently running.
+    completed : int
+        The number of tasks that have finished.
+    max_queued : int
+        The highest number of waiting tasks that has been observed.
+    """
+
+    max_workers: int
+    queued: int
+    active: int
+    completed: int
+    max_queued: int
+
+
+class _MeteredThreadPoolExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor that keeps track of its queue depth."""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._max_queued = 0
+
+    def _run_metered(self, fn: Callable[..., U], /, *args: Any, **kwargs: Any) -> U:
+        with self._stats_lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._completed += 1
+
+    def submit(self, fn: Callable[..., U], /, *args: Any, **kwargs: Any) -> Future[U]:
+        with self._stats_lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+        try:
+            return super().submit(self._run_metered, fn, *args, **kwargs)
+        except BaseException:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+
+    def stats(self) -> ThreadPoolStats:
+        with self._stats_lock:
+            return ThreadPoolStats(
+                max_workers=self._max_workers,
+                queued=self._queued,
+                active=self._active,
+                completed=self._completed,
+                max_queued=self._max_queued,
+            )
+
+
+_thread_pools: dict[ThreadPoolName, tuple[tuple[int, int | None], _MeteredThreadPoolExecutor]] = {}
+_thread_pools_lock = threading.Lock()
+
+
+# the thread budget and the config generation it was computed for
+_cached_thread_budget: tuple[int, tuple[int, int, int | None]] | None = None
+
+
+def _thread_budget() -> tuple[int, int, int | None]:
+    """Returns the number of io threads, compute threads and blosc threads. The number of
+    blosc threads is None, unless `threading.max_workers` is set. The budget is only
+    recomputed after the config has changed."""
+    global _cached_thread_budget
+    generation = config._generation
+    cached = _cached_thread_budget
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    cpu_count = os.cpu_count() or 1
+    max_workers = config.get("threading.max_workers")
+    budget = max_workers or cpu_count
+    io_workers = config.get("threading.io_workers") or min(32, cpu_count + 4)
+    compute_workers = min(config.get("threading.compute_workers") or budget, budget)
+    blosc_nthreads = max(1, budget // compute_workers) if max_workers else None
+    _cached_thread_budget = (generation, (io_workers, compute_workers, blosc_nthreads))
+    return (io_workers, compute_workers, blosc_nthreads)
+
+
+# the blosc settings of the process before they were changed by `_configure_blosc`
+_blosc_state: tuple[bool | None, int] | None = None
+
+
+def _configure_blosc(nthreads: int | None) -> None:
+    global _blosc_state
+    if nthreads is None:
+        # restore the settings from before the budget was configured
+        if _blosc_state is not None:
+            numcodecs.blosc.use_threads, previous_nthreads = _blosc_state
+            numcodecs.blosc.set_nthreads(previous_nthreads)
+            _blosc_state = None
+        return
+    if _blosc_state is None:
+        _blosc_state = (numcodecs.blosc.use_threads, numcodecs.blosc.get_nthreads())
+    # numcodecs serializes blosc calls with a global lock when blosc uses internal threads.
+    # Only enable them if the budget leaves room for more than one thread per blosc call.
+    numcodecs.blosc.use_threads = nthreads > 1
+    numcodecs.blosc.set_nthreads(nthreads)
+
+
+def get_thread_pool(name: ThreadPoolName) -> ThreadPoolExecutor:
+    """Returns the dedicated thread pool for io or compute work.
+
+    The pools are sized according to the `threading` section of the config. If
+    `threading.max_workers` is set, creating the compute pool also sets the number of internal
+    blosc threads, so that compute threads and blosc threads together stay within the budget.
+
+    Parameters
+    ----------
+    name : Literal["io", "compute"]
+
+    Returns
+    -------
+    ThreadPoolExecutor
+    """
+    io_workers, compute_workers, blosc_nthreads = _thread_budget()
+    if name == "io":
+        sizing: tuple[int, int | None] = (io_workers, None)
+    elif name == "compute":
+        sizing = (compute_workers, blosc_nthreads)
+    else:
+        raise ValueError(f"Expected one of ('io', 'compute'), got {name} instead.")
+    cached = _thread_pools.get(name)
+    if cached is not None and cached[0] == sizing:
+        return cached[1]
+    with _thread_pools_lock:
+        cached = _thread_pools.get(name)
+        if cached is not None and cached[0] == sizing:
+            return cached[1]
+        pool = _MeteredThreadPoolExecutor(max_workers=sizing[0], thread_name_prefix=f"zarr-{name}")
+        if name == "compute":
+            _configure_blosc(blosc_nthreads)
+        _thread_pools[name] = (sizing, pool)
+    if cached is not None:
+        # the sizing changed; let the previous pool finish its work in the background
+        cached[1].shutdown(wait=False)
+    return pool
+
+
+def thread_pool_stats() -> dict[str, ThreadPoolStats]:
+    """Returns the current statistics of the thread pools that have been created."""
+    return {name: pool.stats() for name, (_, pool) in _thread_pools.items()}
+
+
+async def to_thread_pool(
+    name: ThreadPoolName, func: Callable[P, U], /, *args: P.args, **kwargs: P.kwargs
+) -> U:
+    """Runs `func` in the io or compute thread pool, like `zarr.core.common.to_thread`."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    func_call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_thread_pool(name), func_call)
+
+
+class CodecExecutor(ABC):
+    """Base class for codec executors.
+
+    An executor runs a function that maps an array (usually the bytes of a chunk) to
+    an array or bytes-like object."""
+
+    @abstractmethod
+    async def run(
+        self, func: Callable[[npt.NDArray[Any]], Any], data: npt.NDArray[Any]
+    ) -> npt.NDArray[Any]:
+        """Calls `func` with `data` and returns the result as a NumPy array.
+
+        Parameters
+        ----------
+        func : Callable[[npt.NDArray[Any]], Any]
+            The function to call. It needs to return an array or a bytes-like object.
+        data : npt.NDArray[Any]
+            The input array.
+
+        Returns
+        -------
+        npt.NDArray[Any]
+        """
+        ...
+
+    def shutdown(self) -> None:  # noqa: B027
+        """Releases the resources held by the executor. Does nothing by default."""
+
+
+class InlineExecutor(CodecExecutor):
+    """Runs codec functions directly on the event loop thread.
+    Useful for very cheap functions, for which a thread hop is more expensive than the work."""
+
+    async def run(
+        self, func: Callable[[npt.NDArray[Any]], Any], data: npt.NDArray[Any]
+    ) -> npt.NDArray[Any]:
+        return cast("npt.NDArray[Any]", ensure_ndarray(func(data)))
+
+
+class ThreadExecutor(CodecExecutor):
+    """Runs codec functions in the compute thread pool."""
+
+    async def run(
+        self, func: Callable[[npt.NDArray[Any]], Any], data: npt.NDArray[Any]
+    ) -> npt.NDArray[Any]:
+        return cast("npt.NDArray[Any]", ensure_ndarray(await to_thread_pool("compute", func, data)))
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    shm = SharedMemory(name=name)
+    # The segment is owned by the parent process. Prevent the resource tracker of this
+    # process from unlinking it, see https://github.com/python/cpython/issues/82300
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _copy_to_shared_memory(data: npt.NDArray[Any]) -> SharedMemory:
+    # zero-sized segments are not allowed
+    shm = SharedMemory(create=True, size=max(data.nbytes, 1))
+    np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
+    return shm
+
+
+def _discard_output(future: Future[Any]) -> None:
+    """Unlinks the output of a worker process whose result is not awaited anymore."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if not isinstance(result, np.ndarray):
+        out_shm = SharedMemory(name=result[0])
+        out_shm.close()
+        out_shm.unlink()
+
+
+def _run_pickled(
+    func: Callable[[npt.NDArray[Any]], Any], data: npt.NDArray[Any]
+) -> npt.NDArray[Any]:
+    """Runs in the worker processes of a ProcessExecutor, for arrays of Python objects."""
+    return cast("npt.NDArray[Any]", ensure_ndarray(func(data)))
+
+
+def _run_in_shared_memory(
+    func: Callable[[npt.NDArray[Any]], Any],
+    name: str,
+    shape: tuple[int, ...],
+    dtype: np.dtype[Any],
+) -> tuple[str, tuple[int, ...], np.dtype[Any]] | npt.NDArray[Any]:
+    """Runs in the worker processes of a ProcessExecutor.
+    Reads the input from, and writes the output to shared memory. Outputs of Python objects
+    (e.g. of the VLen filters of v2 arrays) can not be shared and are pickled instead."""
+    in_shm = _attach_shared_memory(name)
+    try:
+        out = ensure_ndarray(func(np.ndarray(shape, dtype=dtype, buffer=in_shm.buf)))
+        if out.dtype.hasobject:
+            return cast("npt.NDArray[Any]", out)
+        out_shm = _copy_to_shared_memory(out)
+        resource_tracker.unregister(out_shm._name, "shared_memory")  # type: ignore[attr-defined]
+        out_shm.close()
+        return (out_shm.name, out.shape, out.dtype)
+    finally:
+        in_shm.close()
+
+
+class ProcessExecutor(CodecExecutor):
+    """Runs codec functions in a pool of worker processes.
+
+    This allows codecs that hold the GIL to scale over all cores. Chunk data is passed
+    between the processes through shared memory rather than being pickled, except for
+    arrays of Python objects. `func` itself needs to be picklable (e.g. a bound method of a
+    numcodecs codec).
+
+    Parameters
+    ----------
+    max_workers : int | None
+        The number of worker processes. Defaults to the number of CPUs.
+    start_method : str | None
+        The multiprocessing start method of the worker processes.
+    """
+
+    def __init__(self, max_workers: int | None = None, start_method: str | None = "spawn"):
+        self.max_workers = max_workers
+        self.start_method = start_method
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+            )
+        return self._pool
+
+    async def run(
+        self, func: Callable[[npt.NDArray[Any]], Any], data: npt.NDArray[Any]
+    ) -> npt.NDArray[Any]:
+        if data.dtype.hasobject:
+            # shared memory can only hold the data of fixed-size types
+            return await asyncio.wrap_future(self.pool.submit(_run_pickled, func, data))
+        data = np.ascontiguousarray(data)
+        in_shm = _copy_to_shared_memory(data)
+        future = self.pool.submit(_run_in_shared_memory, func, in_shm.name, data.shape, data.dtype)
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # a worker that is already running still writes its output
+            future.add_done_callback(_discard_output)
+            raise
+        finally:
+            in_shm.close()
+            in_shm.unlink()
+        if isinstance(result, np.ndarray):
+            return result
+        out_name, out_shape, out_dtype = result
+        out_shm = SharedMemory(name=out_name)
+        try:
+            return np.ndarray(out_shape, dtype=out_dtype, buffer=out_shm.buf).copy()
+        finally:
+            out_shm.close()
+            out_shm.unlink()
+
+    def shutdown(self) -> None:
+        """Shuts down the worker processes. They are restarted on the next call of `run`."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+_executors: dict[tuple[str, Any], CodecExecutor] = {}
+
+
+def get_executor(name: str) -> CodecExecutor:
+    """Returns the shared executor instance for an executor name.
+
+    Parameters
+    ----------
+    name : str
+        One of "inline", "thread" or "process".
+
+    Returns
+    -------
+    CodecExecutor
+    """
+    if name == "process":
+        options = config.get("codec_executor.process")
+        key: tuple[str, Any] = (name, tuple(sorted(options.items())))
+    else:
+        key = (name, None)
+    executor = _executors.get(key)
+    if executor is None:
+        if name == "inline":
+            executor = InlineExecutor()
+        elif name == "thread":
+            executor = ThreadExecutor()
+        elif name == "process":
+            executor = ProcessExecutor(**options)
+        else:
+            raise BadConfigError(
+                f"Executor '{name}' not found. Expected one of 'inline', 'thread', 'process'."
+            )
+        _executors[key] = executor
+    return executor
+
+
+def get_codec_executor(codec_name: str) -> CodecExecutor:
+    """Returns the executor that is configured for a codec.
+
+    Parameters
+    ----------
+    codec_name : str
+        The name of a codec, or the id of a numcodecs codec for v2 compressors and filters.
+
+    Returns
+    -------
+    CodecExecutor
+    """
+    executor_name = config.get("codec_executor.codecs").get(
+        codec_name, config.get("codec_executor.default")
+    )
+    return get_executor(executor_name)
@@ -7,7 +7,7 @@ import operator
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from functools import reduce
+from functools import lru_cache, reduce
 from types import EllipsisType
 from typing import (
     TYPE_CHECKING,
@@ -1239,9 +1239,35 @@ def decode_morton(z: int, chunk_shape: ChunkCoords) -> ChunkCoords:
     return tuple(out)
 
 
+@lru_cache
+def morton_order(chunk_shape: ChunkCoords) -> npt.NDArray[np.intp]:
+    """Returns the flat C-order indices of all chunks of a grid with shape `chunk_shape`,
+    sorted by their (compressed) Morton code. The returned array is cached and read-only."""
+    bits = tuple(math.ceil(math.log2(c)) for c in chunk_shape)
+    coords = np.indices(chunk_shape, dtype=np.uint64).reshape(
+        len(chunk_shape), product(chunk_shape)
+    )
+    codes = np.zeros(coords.shape[1], dtype=np.uint64)
+    output_bit = 0
+    for coord_bit in range(max(bits, default=0)):
+        for dim in range(len(chunk_shape)):
+            if coord_bit < bits[dim]:
+                codes |= ((coords[dim] >> np.uint64(coord_bit)) & np.uint64(1)) << np.uint64(
+                    output_bit
+                )
+                output_bit += 1
+    order = np.argsort(codes, kind="stable")
+    order.flags.writeable = False
+    return order
+
+
 def morton_order_iter(chunk_shape: ChunkCoords) -> Iterator[ChunkCoords]:
-    for i in range(product(chunk_shape)):
-        yield decode_morton(i, chunk_shape)
+    if len(chunk_shape) == 0:
+        yield ()
+        return
+    all_chunk_coords = np.stack(np.unravel_index(morton_order(chunk_shape), chunk_shape), axis=-1)
+    for chunk_coords in all_chunk_coords.tolist():
+        yield tuple(chunk_coords)
 
 
 def c_order_iter(chunks_per_shard: ChunkCoords) -> Iterator[ChunkCoords]:
@@ -1,6 +1,19 @@
+from zarr.store.cache import CacheStore, LocalCacheStore, TieredCacheStore
 from zarr.store.common import StoreLike, StorePath, make_store_path
 from zarr.store.local import LocalStore
 from zarr.store.memory import MemoryStore
 from zarr.store.remote import RemoteStore
+from zarr.store.single_flight import SingleFlightStore
 
-__all__ = ["StorePath", "StoreLike", "make_store_path", "RemoteStore", "LocalStore", "MemoryStore"]
+__all__ = [
+    "StorePath",
+    "StoreLike",
+    "make_store_path",
+    "RemoteStore",
+    "LocalStore",
+    "MemoryStore",
+    "CacheStore",
+    "LocalCacheStore",
+    "TieredCacheStore",
+    "SingleFlightStore",
+]
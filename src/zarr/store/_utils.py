@@ -23,3 +23,36 @@ def _normalize_interval_index(
             length = maybe_len
 
     return (start, length)
+
+
+def _normalize_byte_range(
+    byte_range: tuple[int | None, int | None] | None,
+) -> tuple[int | None, int | None] | None:
+    """
+    Convert byte ranges that cover the whole value to None
+    """
+    if byte_range is None or (byte_range[0] in (None, 0) and byte_range[1] is None):
+        return None
+    return byte_range
+
+
+def _coalesce_byte_ranges(
+    byte_ranges: list[tuple[int, int]], max_gap: int, max_size: int | None = None
+) -> list[tuple[int, int, list[int]]]:
+    """Merges (start, end) byte ranges that overlap or are at most `max_gap` bytes apart, as
+    long as the merged range spans at most `max_size` bytes. Returns the merged (start, end)
+    ranges in ascending order, together with the indices of the byte ranges that they contain."""
+    merged: list[tuple[int, int, list[int]]] = []
+    for i in sorted(range(len(byte_ranges)), key=lambda i: byte_ranges[i]):
+        start, end = byte_ranges[i]
+        if (
+            merged
+            and start - merged[-1][1] <= max_gap
+            and (max_size is None or max(merged[-1][1], end) - merged[-1][0] <= max_size)
+        ):
+            merged_start, merged_end, indices = merged[-1]
+            merged[-1] = (merged_start, max(merged_end, end), indices)
+            indices.append(i)
+        else:
+            merged.append((start, end, [i]))
+    return merged
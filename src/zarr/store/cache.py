@@ -0,0 +1,761 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Hashable, Iterable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+from uuid import uuid4
+
+from zarr.abc.store import Store
+from zarr.core.common import concurrent_map
+from zarr.core.config import config
+from zarr.core.executor import to_thread_pool
+from zarr.store._utils import _normalize_byte_range, _normalize_interval_index
+from zarr.store.local import LocalStore
+
+if TYPE_CHECKING:
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.core.common import AccessModeLiteral, BytesLike
+
+__all__ = ["CacheStore", "CacheStoreStats", "LocalCacheStore", "TieredCacheStore"]
+
+
+@dataclass(frozen=True)
+class CacheStoreStats:
+    """Statistics of a CacheStore."""
+
+    hits: int
+    misses: int
+    evictions: int
+    nbytes: int
+    max_nbytes: int
+
+
+class _CacheEntry(NamedTuple):
+    # the key of the value in the store, None for listings
+    key: str | None
+    value: list[str] | Buffer | None
+    nbytes: int
+
+
+class _KeyLock:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class CacheStore(Store):
+    """Store that caches the values, byte ranges and directory listings of another store in
+    memory, e.g. to avoid repeated requests to remote storage.
+
+    Cached entries are evicted in least recently used order, once their total size exceeds
+    `max_size` bytes. Values that are larger than `max_size` are not cached. Writes go through
+    to the wrapped store and invalidate the cached values of the written keys and all cached
+    listings. Changes to the wrapped store that do not go through the CacheStore are not
+    detected, see `invalidate`.
+
+    Concurrent requests for the same uncached value wait for the first request to complete,
+    instead of fetching the value again. Requests for different values run concurrently.
+
+    Parameters
+    ----------
+    store : Store
+        The store to cache.
+    max_size : int
+        The maximum size of the cached entries in bytes.
+    mode : str, optional
+        The access mode of the CacheStore. Defaults to the mode of `store`.
+    """
+
+    _store: Store
+    _max_size: int
+
+    def __init__(
+        self, store: Store, max_size: int, *, mode: AccessModeLiteral | None = None
+    ) -> None:
+        super().__init__(mode="r" if mode is None else mode)
+        if mode is None:
+            self._mode = store.mode
+        self._store = store
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        # the cache keys of the entries of each store key
+        self._cache_keys: dict[str, set[Hashable]] = {}
+        self._listing_keys: set[Hashable] = set()
+        self._locks: dict[Hashable, _KeyLock] = {}
+        # incremented on every invalidation, so that fetches that overlap with a write do not
+        # cache stale values
+        self._generation = 0
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def supports_writes(self) -> bool:
+        return self._store.supports_writes
+
+    @property
+    def supports_partial_writes(self) -> bool:
+        return self._store.supports_partial_writes
+
+    @property
+    def supports_listing(self) -> bool:
+        return self._store.supports_listing
+
+    async def _open(self) -> None:
+        if self._is_open:
+            raise ValueError("store is already open")
+        await self._store._ensure_open()
+        self._is_open = True
+
+    def close(self) -> None:
+        super().close()
+        self._store.close()
+
+    def __str__(self) -> str:
+        return str(self._store)
+
+    def __repr__(self) -> str:
+        return f"CacheStore({self._store!r}, max_size={self._max_size})"
+
+    def stats(self) -> CacheStoreStats:
+        """Returns the statistics of the cache.
+
+        Returns
+        -------
+        CacheStoreStats
+        """
+        return CacheStoreStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            nbytes=self._nbytes,
+            max_nbytes=self._max_size,
+        )
+
+    async def invalidate(self) -> None:
+        """Removes all entries from the cache."""
+        self._entries.clear()
+        self._cache_keys.clear()
+        self._listing_keys.clear()
+        self._nbytes = 0
+        self._generation += 1
+
+    @asynccontextmanager
+    async def _locked(self, cache_key: Hashable) -> AsyncIterator[None]:
+        key_lock = self._locks.get(cache_key)
+        if key_lock is None:
+            key_lock = self._locks[cache_key] = _KeyLock()
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                yield
+        finally:
+            key_lock.users -= 1
+            if key_lock.users == 0:
+                del self._locks[cache_key]
+
+    def _lookup(self, cache_key: Hashable) -> _CacheEntry | None:
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            self._entries.move_to_end(cache_key)
+        return entry
+
+    def _lookup_value(
+        self, key: str, byte_range: tuple[int | None, int | None] | None
+    ) -> tuple[bool, Buffer | None]:
+        entry = self._lookup(("get", key, None))
+        if entry is not None:
+            value = entry.value
+            assert not isinstance(value, list)
+            if value is not None and byte_range is not None:
+                start, length = _normalize_interval_index(value, byte_range)
+                value = value[start : start + length]
+            return True, value
+        if byte_range is not None:
+            entry = self._lookup(("get", key, byte_range))
+            if entry is not None:
+                assert not isinstance(entry.value, list)
+                return True, entry.value
+        return False, None
+
+    def _insert(self, cache_key: Hashable, entry: _CacheEntry, generation: int) -> None:
+        if generation != self._generation or entry.nbytes > self._max_size:
+            return
+        self._remove(cache_key)
+        self._entries[cache_key] = entry
+        self._nbytes += entry.nbytes
+        if entry.key is None:
+            self._listing_keys.add(cache_key)
+        else:
+            self._cache_keys.setdefault(entry.key, set()).add(cache_key)
+        while self._nbytes > self._max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, cache_key: Hashable) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+        self._nbytes -= entry.nbytes
+        if entry.key is None:
+            self._listing_keys.discard(cache_key)
+        else:
+            cache_keys = self._cache_keys[entry.key]
+            cache_keys.discard(cache_key)
+            if not cache_keys:
+                del self._cache_keys[entry.key]
+
+    def _invalidate_key(self, key: str) -> None:
+        for cache_key in [*self._cache_keys.get(key, ()), *self._listing_keys]:
+            self._remove(cache_key)
+        self._generation += 1
+
+    async def empty(self) -> bool:
+        return await self._store.empty()
+
+    async def clear(self) -> None:
+        await self._store.clear()
+        await self.invalidate()
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: tuple[int | None, int | None] | None = None,
+    ) -> Buffer | None:
+        if not self._is_open:
+            await self._open()
+        byte_range = _normalize_byte_range(byte_range)
+        found, value = self._lookup_value(key, byte_range)
+        if not found:
+            cache_key = ("get", key, byte_range)
+            async with self._locked(cache_key):
+                # the value may have been fetched while waiting for the lock
+                found, value = self._lookup_value(key, byte_range)
+                if not found:
+                    self._misses += 1
+                    generation = self._generation
+                    value = await self._store.get(key, prototype, byte_range=byte_range)
+                    nbytes = len(key) + (0 if value is None else len(value))
+                    self._insert(cache_key, _CacheEntry(key, value, nbytes), generation)
+                    return value
+        self._hits += 1
+        return None if value is None else prototype.buffer.from_buffer(value)
+
+    async def getsize(self, key: str) -> int:
+        entry = self._lookup(("get", key, None))
+        if entry is None:
+            return await self._store.getsize(key)
+        if entry.value is None:
+            raise FileNotFoundError(key)
+        assert not isinstance(entry.value, list)
+        return len(entry.value)
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: list[tuple[str, tuple[int | None, int | None]]],
+    ) -> list[Buffer | None]:
+        values: list[Buffer | None] = []
+        missing: list[int] = []
+        for i, (key, byte_range) in enumerate(key_ranges):
+            found, value = self._lookup_value(key, _normalize_byte_range(byte_range))
+            if found:
+                self._hits += 1
+                values.append(None if value is None else prototype.buffer.from_buffer(value))
+            else:
+                self._misses += 1
+                values.append(None)
+                missing.append(i)
+        if missing:
+            generation = self._generation
+            fetched = await self._store.get_partial_values(
+                prototype, [key_ranges[i] for i in missing]
+            )
+            for i, value in zip(missing, fetched, strict=True):
+                key, byte_range = key_ranges[i]
+                nbytes = len(key) + (0 if value is None else len(value))
+                self._insert(
+                    ("get", key, _normalize_byte_range(byte_range)),
+                    _CacheEntry(key, value, nbytes),
+                    generation,
+                )
+                values[i] = value
+        return values
+
+    async def exists(self, key: str) -> bool:
+        entry = self._lookup(("get", key, None))
+        if entry is None:
+            return await self._store.exists(key)
+        return entry.value is not None
+
+    async def set(self, key: str, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        try:
+            if byte_range is None:
+                await self._store.set(key, value)
+            else:
+                await self._store.set(key, value, byte_range=byte_range)  # type: ignore[call-arg]
+        finally:
+            self._invalidate_key(key)
+
+    async def delete(self, key: str) -> None:
+        self._check_writable()
+        try:
+            await self._store.delete(key)
+        finally:
+            self._invalidate_key(key)
+
+    async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
+        self._check_writable()
+        try:
+            await self._store.set_partial_values(key_start_values)
+        finally:
+            for key, _, _ in key_start_values:
+                self._invalidate_key(key)
+
+    def list(self) -> AsyncGenerator[str, None]:
+        return self._store.list()
+
+    def list_prefix(self, prefix: str) -> AsyncGenerator[str, None]:
+        return self._store.list_prefix(prefix)
+
+    async def list_dir(self, prefix: str) -> AsyncGenerator[str, None]:
+        cache_key = ("list_dir", prefix)
+        entry = self._lookup(cache_key)
+        if entry is None:
+            async with self._locked(cache_key):
+                entry = self._lookup(cache_key)
+                if entry is None:
+                    self._misses += 1
+                    generation = self._generation
+                    listing = [key async for key in self._store.list_dir(prefix)]
+                    nbytes = len(prefix) + sum(len(key) for key in listing)
+                    entry = _CacheEntry(None, listing, nbytes)
+                    self._insert(cache_key, entry, generation)
+                else:
+                    self._hits += 1
+        else:
+            self._hits += 1
+        assert isinstance(entry.value, list)
+        for key in entry.value:
+            yield key
+
+
+CachePolicy = Literal["read-through", "write-through"]
+
+
+def parse_cache_policy(data: Any) -> CachePolicy:
+    if data in ("read-through", "write-through"):
+        return cast(CachePolicy, data)
+    raise ValueError(f"Expected one of ('read-through', 'write-through'), got {data!r} instead.")
+
+
+def _scan_cache(root: Path) -> list[tuple[str, int]]:
+    """Returns the keys and sizes of the files below `root`, least recently used first."""
+    entries = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            # temporary files of writes in progress
+            if name.endswith(".partial"):
+                continue
+            path = Path(dirpath) / name
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path.relative_to(root).as_posix(), stat.st_size, stat.st_mtime))
+    entries.sort(key=lambda entry: entry[2])
+    return [(key, size) for key, size, _ in entries]
+
+
+def _remove_cached(root: Path, cache_keys: Iterable[str], ranges_dir: str) -> None:
+    for cache_key in cache_keys:
+        try:
+            (root / cache_key).unlink(missing_ok=True)
+        except (IsADirectoryError, NotADirectoryError):
+            pass
+    # byte ranges that were cached by other processes
+    try:
+        with os.scandir(root / ranges_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith(".partial"):
+                    Path(entry.path).unlink(missing_ok=True)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+class LocalCacheStore(Store):
+    """Store that caches the values and byte ranges of another store in a directory on the
+    local file system, e.g. to keep data of a remote store on a fast local disk.
+
+    The cached values are written to a LocalStore at `root` and persist across processes.
+    Entries are evicted in least recently used order, once their total size exceeds `max_size`
+    bytes. The order is tracked by the modification times of the files, so that processes that
+    share a cache directory evict the entries that none of them used recently.
+
+    With the "read-through" policy, values are cached when they are read. The
+    "write-through" policy additionally caches values when they are written. Writes always go
+    to the wrapped store and remove the outdated values from the cache. Changes to the wrapped
+    store that do not go through the LocalCacheStore are not detected, see `invalidate`.
+
+    Parameters
+    ----------
+    store : Store
+        The store to cache.
+    root : Path or str
+        The directory of the cache.
+    max_size : int
+        The maximum size of the cached values in bytes.
+    policy : {"read-through", "write-through"}
+    mode : str, optional
+        The access mode of the LocalCacheStore. Defaults to the mode of `store`.
+    """
+
+    _store: Store
+    _cache: LocalStore
+    _max_size: int
+    policy: CachePolicy
+
+    def __init__(
+        self,
+        store: Store,
+        root: Path | str,
+        max_size: int,
+        *,
+        policy: CachePolicy = "read-through",
+        mode: AccessModeLiteral | None = None,
+    ) -> None:
+        super().__init__(mode="r" if mode is None else mode)
+        if mode is None:
+            self._mode = store.mode
+        self._store = store
+        self._cache = LocalStore(root, mode="a")
+        self._max_size = max_size
+        self.policy = parse_cache_policy(policy)
+        # sizes of the cached files, least recently used first. Loaded from disk on first use.
+        self._index: OrderedDict[str, int] | None = None
+        self._index_lock = asyncio.Lock()
+        # the cached byte ranges of each key
+        self._ranges: dict[str, set[str]] = {}
+        self._generation = 0
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def supports_writes(self) -> bool:
+        return self._store.supports_writes
+
+    @property
+    def supports_partial_writes(self) -> bool:
+        return self._store.supports_partial_writes
+
+    @property
+    def supports_listing(self) -> bool:
+        return self._store.supports_listing
+
+    async def _open(self) -> None:
+        if self._is_open:
+            raise ValueError("store is already open")
+        await self._store._ensure_open()
+        await self._cache._ensure_open()
+        self._is_open = True
+
+    def close(self) -> None:
+        super().close()
+        self._store.close()
+        self._cache.close()
+
+    def __str__(self) -> str:
+        return str(self._store)
+
+    def __repr__(self) -> str:
+        return (
+            f"LocalCacheStore({self._store!r}, {str(self._cache.root)!r}, "
+            f"max_size={self._max_size})"
+        )
+
+    def stats(self) -> CacheStoreStats:
+        """Returns the statistics of the cache. The number of cached bytes includes the values
+        that were cached by previous processes.
+
+        Returns
+        -------
+        CacheStoreStats
+        """
+        return CacheStoreStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            nbytes=self._nbytes,
+            max_nbytes=self._max_size,
+        )
+
+    async def invalidate(self) -> None:
+        """Removes all values from the cache."""
+        self._generation += 1
+        self._index = OrderedDict()
+        self._ranges.clear()
+        self._nbytes = 0
+        await self._cache.clear()
+
+    @staticmethod
+    def _value_key(key: str) -> str:
+        return f"values/{key}"
+
+    @staticmethod
+    def _range_key(key: str, byte_range: tuple[int | None, int | None]) -> str:
+        start, length = ("" if n is None else n for n in byte_range)
+        return f"ranges/{key}/{start}-{length}"
+
+    async def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            async with self._index_lock:
+                if self._index is None:
+                    index: OrderedDict[str, int] = OrderedDict()
+                    for cache_key, size in await to_thread_pool(
+                        "io", _scan_cache, self._cache.root
+                    ):
+                        index[cache_key] = size
+                        if cache_key.startswith("ranges/"):
+                            key = cache_key.removeprefix("ranges/").rsplit("/", 1)[0]
+                            self._ranges.setdefault(key, set()).add(cache_key)
+                    self._index = index
+                    self._nbytes = sum(index.values())
+                    await self._evict()
+        return self._index
+
+    def _forget(self, cache_key: str) -> None:
+        assert self._index is not None
+        size = self._index.pop(cache_key, None)
+        if size is None:
+            return
+        self._nbytes -= size
+        if cache_key.startswith("ranges/"):
+            key = cache_key.removeprefix("ranges/").rsplit("/", 1)[0]
+            range_keys = self._ranges.get(key, set())
+            range_keys.discard(cache_key)
+            if not range_keys:
+                self._ranges.pop(key, None)
+
+    async def _evict(self) -> None:
+        assert self._index is not None
+        evicted = []
+        while self._nbytes > self._max_size:
+            cache_key = next(iter(self._index))
+            self._forget(cache_key)
+            evicted.append(cache_key)
+            self._evictions += 1
+        if evicted:
+            await concurrent_map(
+                [(cache_key,) for cache_key in evicted],
+                self._cache.delete,
+                config.get("async.concurrency"),
+            )
+
+    async def _get_cached(
+        self,
+        cache_key: str,
+        prototype: BufferPrototype,
+        byte_range: tuple[int | None, int | None] | None,
+    ) -> Buffer | None:
+        index = await self._load_index()
+        if cache_key not in index:
+            return None
+        value = await self._cache.get(cache_key, prototype, byte_range=byte_range)
+        if value is None:
+            # evicted by another process
+            self._forget(cache_key)
+            return None
+        index.move_to_end(cache_key)
+        await to_thread_pool("io", _touch, self._cache.root / cache_key)
+        return value
+
+    async def _put(self, cache_key: str, value: Buffer, generation: int) -> None:
+        if len(value) > self._max_size:
+            return
+        index = await self._load_index()
+        # write to a temporary file first, so that other processes never read partial values
+        tmp_key = f"{cache_key}.{uuid4().hex}.partial"
+        try:
+            await self._cache.set(tmp_key, value)
+            if generation != self._generation:
+                await self._cache.delete(tmp_key)
+                return
+            await to_thread_pool(
+                "io", os.replace, self._cache.root / tmp_key, self._cache.root / cache_key
+            )
+        except OSError:
+            # e.g. a file in place of a directory of the key, the value is just not cached
+            with suppress(OSError):
+                await self._cache.delete(tmp_key)
+            return
+        self._forget(cache_key)
+        index[cache_key] = len(value)
+        self._nbytes += len(value)
+        if cache_key.startswith("ranges/"):
+            key = cache_key.removeprefix("ranges/").rsplit("/", 1)[0]
+            self._ranges.setdefault(key, set()).add(cache_key)
+        await self._evict()
+
+    async def _invalidate_key(self, key: str) -> None:
+        self._generation += 1
+        await self._load_index()
+        cache_keys = [self._value_key(key), *self._ranges.get(key, ())]
+        for cache_key in cache_keys:
+            self._forget(cache_key)
+        await to_thread_pool("io", _remove_cached, self._cache.root, cache_keys, f"ranges/{key}")
+
+    async def empty(self) -> bool:
+        return await self._store.empty()
+
+    async def clear(self) -> None:
+        await self._store.clear()
+        await self.invalidate()
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: tuple[int | None, int | None] | None = None,
+    ) -> Buffer | None:
+        if not self._is_open:
+            await self._open()
+        byte_range = _normalize_byte_range(byte_range)
+        value = await self._get_cached(self._value_key(key), prototype, byte_range)
+        if value is None and byte_range is not None:
+            value = await self._get_cached(self._range_key(key, byte_range), prototype, None)
+        if value is not None:
+            self._hits += 1
+            return value
+        self._misses += 1
+        generation = self._generation
+        value = await self._store.get(key, prototype, byte_range=byte_range)
+        if value is not None:
+            cache_key = (
+                self._value_key(key) if byte_range is None else self._range_key(key, byte_range)
+            )
+            await self._put(cache_key, value, generation)
+        return value
+
+    async def getsize(self, key: str) -> int:
+        index = await self._load_index()
+        size = index.get(self._value_key(key))
+        if size is None:
+            return await self._store.getsize(key)
+        return size
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: list[tuple[str, tuple[int | None, int | None]]],
+    ) -> list[Buffer | None]:
+        async def _get(key: str, byte_range: tuple[int | None, int | None]) -> Buffer | None:
+            return await self.get(key, prototype, byte_range=byte_range)
+
+        return await concurrent_map(key_ranges, _get, config.get("async.concurrency"))
+
+    async def exists(self, key: str) -> bool:
+        index = await self._load_index()
+        if self._value_key(key) in index:
+            return True
+        return await self._store.exists(key)
+
+    async def set(self, key: str, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        try:
+            if byte_range is None:
+                await self._store.set(key, value)
+            else:
+                await self._store.set(key, value, byte_range=byte_range)  # type: ignore[call-arg]
+        finally:
+            await self._invalidate_key(key)
+        if self.policy == "write-through" and byte_range is None:
+            await self._put(self._value_key(key), value, self._generation)
+
+    async def delete(self, key: str) -> None:
+        self._check_writable()
+        try:
+            await self._store.delete(key)
+        finally:
+            await self._invalidate_key(key)
+
+    async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
+        self._check_writable()
+        try:
+            await self._store.set_partial_values(key_start_values)
+        finally:
+            for key in {key for key, _, _ in key_start_values}:
+                await self._invalidate_key(key)
+
+    def list(self) -> AsyncGenerator[str, None]:
+        return self._store.list()
+
+    def list_prefix(self, prefix: str) -> AsyncGenerator[str, None]:
+        return self._store.list_prefix(prefix)
+
+    def list_dir(self, prefix: str) -> AsyncGenerator[str, None]:
+        return self._store.list_dir(prefix)
+
+
+class TieredCacheStore(CacheStore):
+    """Store with a small in-memory cache (see `CacheStore`) in front of a large cache on the
+    local file system (see `LocalCacheStore`), which caches the values of another store.
+
+    Parameters
+    ----------
+    store : Store
+        The store to cache.
+    root : Path or str
+        The directory of the cache on the local file system.
+    memory_size : int
+        The maximum size of the in-memory cache in bytes.
+    disk_size : int
+        The maximum size of the cache on the local file system in bytes.
+    policy : {"read-through", "write-through"}
+        Whether written values are cached on the local file system.
+    mode : str, optional
+        The access mode of the store. Defaults to the mode of `store`.
+    """
+
+    disk_cache: LocalCacheStore
+
+    def __init__(
+        self,
+        store: Store,
+        root: Path | str,
+        *,
+        memory_size: int,
+        disk_size: int,
+        policy: CachePolicy = "read-through",
+        mode: AccessModeLiteral | None = None,
+    ) -> None:
+        self.disk_cache = LocalCacheStore(store, root, disk_size, policy=policy, mode=mode)
+        super().__init__(self.disk_cache, memory_size, mode=mode)
+
+    def __repr__(self) -> str:
+        return f"TieredCacheStore({self.disk_cache!r}, memory_size={self._max_size})"
+
+    async def invalidate(self) -> None:
+        """Removes all values from the in-memory cache and from the local file system."""
+        await super().invalidate()
+        await self.disk_cache.invalidate()
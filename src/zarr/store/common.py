@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-from zarr.abc.store import AccessMode, Store
+from zarr.abc.store import AccessMode, Store, _specializes_get_into
 from zarr.core.buffer import Buffer, default_buffer_prototype
 from zarr.core.common import ZARR_JSON, ZARRAY_JSON, ZGROUP_JSON, ZarrFormat
 from zarr.errors import ContainsArrayAndGroupError, ContainsArrayError, ContainsGroupError
@@ -12,6 +12,9 @@ from zarr.store.local import LocalStore
 from zarr.store.memory import MemoryStore
 
 if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
     from zarr.core.buffer import BufferPrototype
     from zarr.core.common import AccessModeLiteral
 
@@ -42,6 +45,21 @@ class StorePath:
             prototype = default_buffer_prototype()
         return await self.store.get(self.path, prototype=prototype, byte_range=byte_range)
 
+    async def get_into(self, out: npt.NDArray[np.uint8]) -> bool:
+        if _specializes_get_into(self.store):
+            return await self.store.get_into(self.path, out)
+        return await Store.get_into(self.store, self.path, out)
+
+    async def getsize(self) -> int:
+        return await self.store.getsize(self.path)
+
+    async def get_partial_values(
+        self, prototype: BufferPrototype, byte_ranges: list[tuple[int | None, int | None]]
+    ) -> list[Buffer | None]:
+        return await self.store.get_partial_values(
+            prototype, [(self.path, byte_range) for byte_range in byte_ranges]
+        )
+
     async def set(self, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
         if byte_range is not None:
             raise NotImplementedError("Store.set does not have partial writes yet")
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import contextlib
 import io
+import mmap
 import os
+import re
 import shutil
-from collections.abc import AsyncGenerator
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Generator, Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, cast
+from uuid import uuid4
+
+import numpy as np
 
 from zarr.abc.store import Store
 from zarr.core.buffer import Buffer
-from zarr.core.common import concurrent_map, to_thread
+from zarr.core.common import concurrent_map
+from zarr.core.config import config
+from zarr.core.executor import to_thread_pool
+from zarr.store._utils import _coalesce_byte_ranges
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from zarr.core.buffer import BufferPrototype
-    from zarr.core.common import AccessModeLiteral
+    from zarr.core.common import AccessModeLiteral, BytesLike
 
 
 def _get(
@@ -55,40 +68,427 @@ def _get(
         return prototype.buffer.from_bytes(f.read())
 
 
-def _put(
+def _resolve_byte_range(
+    byte_range: tuple[int | None, int | None] | None, size: int
+) -> tuple[int, int]:
+    """
+    Convert a byte range, as accepted by `_get`, into (start, end) offsets within a file.
+    """
+    if byte_range is None:
+        return 0, size
+    start, length = byte_range
+    if start is None:
+        start = 0
+    elif start < 0:
+        start = max(0, size + start)
+    start = min(start, size)
+    end = size if length is None else min(start + length, size)
+    return start, max(start, end)
+
+
+def _get_ranges(
     path: Path,
-    value: Buffer,
-    start: int | None = None,
-) -> int | None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if start is not None:
-        with path.open("r+b") as f:
+    prototype: BufferPrototype,
+    byte_ranges: list[tuple[int | None, int | None]],
+    max_gap: int,
+    max_size: int,
+    map_cache: _MapCache | None = None,
+) -> list[Buffer | None]:
+    """
+    Read several byte ranges from a file. Ranges that are at most `max_gap` bytes apart are
+    read together, up to `max_size` bytes per read, and returned as views of the merged read.
+    With a `map_cache`, the ranges are views of the memory map of the file instead.
+    """
+    if map_cache is not None:
+        try:
+            return [
+                _get_mapped(map_cache, path, prototype, byte_range) for byte_range in byte_ranges
+            ]
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return [None] * len(byte_ranges)
+    try:
+        f = path.open("rb")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return [None] * len(byte_ranges)
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        resolved = [_resolve_byte_range(byte_range, size) for byte_range in byte_ranges]
+        values: list[Buffer | None] = [None] * len(byte_ranges)
+        for start, end, indices in _coalesce_byte_ranges(resolved, max_gap, max_size):
             f.seek(start)
-            f.write(value.as_numpy_array().tobytes())
-        return None
-    else:
-        return path.write_bytes(value.as_numpy_array().tobytes())
+            merged = prototype.buffer.from_bytes(f.read(end - start))
+            for i in indices:
+                range_start, range_end = resolved[i]
+                values[i] = merged[range_start - start : range_end - start]
+    return values
+
+
+class _MapCache:
+    """
+    Least recently used cache of read-only memory maps of files, keyed by path. The maps are
+    checked against the inode, size and modification time of their file on every use, so that
+    replaced files are mapped anew. The number of maps is limited by ``store.mmap_cache_size``.
+    """
+
+    def __init__(self) -> None:
+        self._maps: OrderedDict[Path, tuple[tuple[int, int, int], mmap.mmap]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> mmap.mmap | None:
+        """
+        Return the map of a file, or None for empty files, which can not be mapped.
+        """
+        stat = path.stat()
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._maps.get(path)
+            if entry is not None and entry[0] == signature:
+                self._maps.move_to_end(path)
+                return entry[1]
+        if stat.st_size == 0:
+            return None
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with self._lock:
+            self._maps[path] = (signature, mapped)
+            self._maps.move_to_end(path)
+            # maps that are still referenced by buffers are unmapped once those are released
+            while len(self._maps) > max(config.get("store.mmap_cache_size"), 0):
+                self._maps.popitem(last=False)
+        return mapped
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._maps.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._maps.clear()
+
+    def __len__(self) -> int:
+        return len(self._maps)
+
+
+def _get_mapped(
+    map_cache: _MapCache,
+    path: Path,
+    prototype: BufferPrototype,
+    byte_range: tuple[int | None, int | None] | None,
+) -> Buffer:
+    """
+    Fetch a contiguous region of bytes from a file as a read-only view of its memory map.
+    """
+    mapped = map_cache.get(path)
+    if mapped is None:
+        return prototype.buffer.create_zero_length()
+    data = np.frombuffer(mapped, dtype="b")
+    start, end = _resolve_byte_range(byte_range, data.size)
+    return prototype.buffer.from_array_like(data[start:end])
+
+
+def _get_into(path: Path, out: npt.NDArray[np.uint8]) -> None:
+    """
+    Read a whole file into a pre-allocated byte array.
+
+    Parameters
+    ----------
+    path: Path
+        The file to read bytes from.
+    out: np.ndarray
+        Writable, contiguous uint8 array with the size of the file.
+    """
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size != out.nbytes:
+            raise ValueError(f"{path} has {size} bytes, but the output has {out.nbytes} bytes.")
+        view = memoryview(out).cast("B")  # type: ignore[arg-type]
+        while view:
+            n = f.readinto(view)
+            if not n:
+                raise ValueError(f"{path} was truncated while reading.")
+            view = view[n:]
+
+
+FsyncPolicy = Literal["none", "batch", "file"]
+
+
+def parse_fsync_policy(data: Any) -> FsyncPolicy:
+    if data in ("none", "batch", "file"):
+        return cast(FsyncPolicy, data)
+    raise ValueError(f"Expected one of ('none', 'batch', 'file'), got {data!r} instead.")
+
+
+def _as_memoryview(value: Buffer | BytesLike) -> memoryview:
+    """
+    Return a flat byte view of a value, so that it can be written without copying it.
+    """
+    if isinstance(value, Buffer):
+        data = np.ascontiguousarray(value.as_numpy_array())
+        return memoryview(data).cast("B")  # type: ignore[arg-type]
+    return memoryview(value).cast("B")
+
+
+def _write(f: BinaryIO, data: memoryview, sync: bool) -> None:
+    f.write(data)
+    if sync:
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(path: Path) -> None:
+    # directories can not be opened on windows, where renames are flushed with the file
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_paths(paths: Iterable[Path]) -> None:
+    """
+    Flush files, and the directories that contain them, to disk. Each file and directory is
+    flushed once.
+    """
+    files = dict.fromkeys(paths)
+    for path in files:
+        fd = os.open(path, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    for directory in dict.fromkeys(path.parent for path in files):
+        _fsync_directory(directory)
+
+
+# the temporary files of atomic writes are named "{name}.{uuid}.partial"
+_TMP_SUFFIX = ".partial"
+_TMP_NAME = re.compile(r"\.[0-9a-f]{32}\.partial$")
+
+
+class _FileWriter:
+    """
+    Writes the files of a LocalStore. The directories that were created are remembered, so that
+    ``mkdir`` is only called for new directories, or for directories that were removed since.
+    With ``atomic``, files are written to a temporary file next to them which is then renamed,
+    so that readers never see partially written files. With ``replace``, existing files are
+    unlinked before they are written rather than truncated.
+    """
+
+    def __init__(self, *, atomic: bool, replace: bool, fsync: FsyncPolicy) -> None:
+        self.atomic = atomic
+        self.replace = replace
+        self.fsync = fsync
+        self._created_dirs: set[Path] = set()
+
+    def forget_directories(self) -> None:
+        self._created_dirs.clear()
+
+    def _open(self, path: Path, mode: str) -> BinaryIO:
+        parent = path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+        try:
+            return cast(BinaryIO, path.open(mode))
+        except FileNotFoundError:
+            # the directory was removed after it was created
+            parent.mkdir(parents=True, exist_ok=True)
+            return cast(BinaryIO, path.open(mode))
+
+    def write(self, path: Path, value: Buffer | BytesLike, sync: bool) -> None:
+        """
+        Write a whole file, flushing it and its directory to disk if `sync` is True.
+        """
+        data = _as_memoryview(value)
+        if self.atomic:
+            tmp_path = path.with_name(f"{path.name}.{uuid4().hex}{_TMP_SUFFIX}")
+            try:
+                with self._open(tmp_path, "wb") as f:
+                    _write(f, data, sync)
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        else:
+            if self.replace:
+                # write a new file rather than truncating the old one, which may still be mapped
+                path.unlink(missing_ok=True)
+            with self._open(path, "wb") as f:
+                _write(f, data, sync)
+        if sync:
+            _fsync_directory(path.parent)
+
+    def write_at(self, path: Path, start: int, value: Buffer | BytesLike, sync: bool) -> None:
+        """
+        Write into an existing file in place, starting at byte `start`.
+        """
+        with self._open(path, "r+b") as f:
+            f.seek(start)
+            _write(f, _as_memoryview(value), sync)
+
+    def write_many(self, path_values: list[tuple[Path, Buffer]]) -> None:
+        """
+        Write several whole files according to the fsync policy.
+        """
+        for path, value in path_values:
+            self.write(path, value, sync=self.fsync == "file")
+        if self.fsync == "batch":
+            _fsync_paths(path for path, _ in path_values)
+
+
+def _get_many(
+    paths: list[Path], prototype: BufferPrototype, map_cache: _MapCache | None = None
+) -> list[Buffer | None]:
+    """
+    Read several whole files, with None for missing files.
+    """
+    values: list[Buffer | None] = []
+    for path in paths:
+        try:
+            if map_cache is not None:
+                values.append(_get_mapped(map_cache, path, prototype, None))
+            else:
+                values.append(prototype.buffer.from_bytes(path.read_bytes()))
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            values.append(None)
+    return values
+
+
+_LIST_BATCH_SIZE = 1024
+
+
+def _list_batches(
+    directory: Path, key_prefix: str = "", name_prefix: str = "", recursive: bool = True
+) -> Generator[list[str], None, None]:
+    """
+    Yield the keys of the files below a directory in batches, each key prefixed by
+    `key_prefix`. Without `recursive`, the names of the files and subdirectories of the
+    directory itself are yielded instead. Only the entries of the directory whose names start
+    with `name_prefix` are listed, and temporary files of atomic writes are skipped.
+    """
+    batch: list[str] = []
+    stack = [(str(directory), key_prefix, name_prefix)]
+    while stack:
+        path, prefix, name_prefix = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(name_prefix) or _TMP_NAME.search(name):
+                    continue
+                if recursive and entry.is_dir():
+                    stack.append((entry.path, f"{prefix}{name}/", ""))
+                    continue
+                if recursive and not entry.is_file():
+                    continue
+                batch.append(prefix + name)
+                if len(batch) >= _LIST_BATCH_SIZE:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+async def _iterate_batches(
+    batches: Generator[list[str], None, None],
+) -> AsyncGenerator[str, None]:
+    """
+    Iterate over the keys of batches that are produced in the io thread pool.
+    """
+    try:
+        while (batch := await to_thread_pool("io", next, batches, None)) is not None:
+            for key in batch:
+                yield key
+    finally:
+        # the generator is still running in the thread pool if the listing was cancelled
+        with contextlib.suppress(ValueError):
+            batches.close()
+
+
+def _delete_many(paths: list[Path]) -> None:
+    for path in paths:
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
 
 
 class LocalStore(Store):
+    """
+    Store for a directory on the local file system.
+
+    Parameters
+    ----------
+    root: Path or str
+        The directory of the store.
+    mode: str
+        The access mode of the store.
+    mmap: bool
+        If True, values are returned as read-only views of memory maps of the files, rather
+        than being copied into memory, and byte ranges are slices of the maps. The maps are
+        cached, see ``store.mmap_cache_size``. Files must not be truncated in place by other
+        writers while such views are in use.
+    atomic_writes: bool
+        If True, values are written to a temporary file which is then renamed, so that readers
+        never see partially written values. Partial writes are made in place.
+    fsync: {"none", "batch", "file"}
+        When written files are flushed to disk. With "none", flushing is left to the operating
+        system. With "batch", the files of each call to ``set``, ``set_many`` or
+        ``set_partial_values``, and their directories, are flushed once all of them are
+        written. With "file", every file is flushed as soon as it is written.
+    """
+
     supports_writes: bool = True
     supports_partial_writes: bool = True
     supports_listing: bool = True
 
     root: Path
+    mmap: bool
+    atomic_writes: bool
+    fsync: FsyncPolicy
 
-    def __init__(self, root: Path | str, *, mode: AccessModeLiteral = "r"):
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        mode: AccessModeLiteral = "r",
+        mmap: bool = False,
+        atomic_writes: bool = False,
+        fsync: FsyncPolicy = "none",
+    ):
         super().__init__(mode=mode)
         if isinstance(root, str):
             root = Path(root)
         assert isinstance(root, Path)
         self.root = root
+        self.mmap = mmap
+        self._map_cache = _MapCache() if mmap else None
+        self.atomic_writes = atomic_writes
+        self.fsync = parse_fsync_policy(fsync)
+        self._writer = _FileWriter(atomic=atomic_writes, replace=mmap, fsync=self.fsync)
+
+    def _invalidate_map(self, path: Path) -> None:
+        if self._map_cache is not None:
+            self._map_cache.invalidate(path)
 
     async def clear(self) -> None:
         self._check_writable()
+        if self._map_cache is not None:
+            self._map_cache.clear()
+        self._writer.forget_directories()
         shutil.rmtree(self.root)
         self.root.mkdir()
 
+    def close(self) -> None:
+        super().close()
+        if self._map_cache is not None:
+            self._map_cache.clear()
+
     async def empty(self) -> bool:
         try:
             subpaths = os.listdir(self.root)
@@ -118,10 +518,33 @@ class LocalStore(Store):
         path = self.root / key
 
         try:
-            return await to_thread(_get, path, prototype, byte_range)
+            if self._map_cache is not None:
+                return await to_thread_pool(
+                    "io", _get_mapped, self._map_cache, path, prototype, byte_range
+                )
+            return await to_thread_pool("io", _get, path, prototype, byte_range)
         except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             return None
 
+    async def get_into(self, key: str, out: npt.NDArray[np.uint8]) -> bool:
+        if not self._is_open:
+            await self._open()
+        assert isinstance(key, str)
+        path = self.root / key
+
+        try:
+            await to_thread_pool("io", _get_into, path, out)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return False
+        return True
+
+    async def getsize(self, key: str) -> int:
+        path = self.root / key
+        try:
+            return (await to_thread_pool("io", path.stat)).st_size
+        except (IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(key) from e
+
     async def get_partial_values(
         self,
         prototype: BufferPrototype,
@@ -135,15 +558,36 @@ class LocalStore(Store):
         key_ranges: List[Tuple[str, Tuple[int, int]]]
             A list of (key, (start, length)) tuples. The first element of the tuple is the name of
             the key in storage to fetch bytes from. The second element the tuple defines the byte
-            range to retrieve. These values are arguments to `get`, as this method wraps
-            concurrent invocation of `get`.
+            range to retrieve. Each file is opened once, and nearby ranges in the same file are
+            merged into single reads according to ``store.coalesce_max_gap`` and
+            ``store.coalesce_max_size``.
         """
-        args = []
-        for key, byte_range in key_ranges:
+        indices_by_key: dict[str, list[int]] = {}
+        for i, (key, _) in enumerate(key_ranges):
             assert isinstance(key, str)
-            path = self.root / key
-            args.append((_get, path, prototype, byte_range))
-        return await concurrent_map(args, to_thread, limit=None)  # TODO: fix limit
+            indices_by_key.setdefault(key, []).append(i)
+        max_gap = config.get("store.coalesce_max_gap")
+        max_size = config.get("store.coalesce_max_size")
+        values: list[Buffer | None] = [None] * len(key_ranges)
+
+        async def _get_key(key: str, indices: list[int]) -> None:
+            key_values = await to_thread_pool(
+                "io",
+                _get_ranges,
+                self.root / key,
+                prototype,
+                [key_ranges[i][1] for i in indices],
+                max_gap,
+                max_size,
+                self._map_cache,
+            )
+            for i, value in zip(indices, key_values, strict=True):
+                values[i] = value
+
+        await concurrent_map(
+            list(indices_by_key.items()), _get_key, config.get("async.concurrency")
+        )
+        return values
 
     async def set(self, key: str, value: Buffer) -> None:
         if not self._is_open:
@@ -153,28 +597,63 @@ class LocalStore(Store):
         if not isinstance(value, Buffer):
             raise TypeError("LocalStore.set(): `value` must a Buffer instance")
         path = self.root / key
-        await to_thread(_put, path, value)
+        self._invalidate_map(path)
+        await to_thread_pool("io", self._writer.write, path, value, self.fsync != "none")
+
+    async def get_many(self, prototype: BufferPrototype, keys: list[str]) -> list[Buffer | None]:
+        # one task in the io thread pool reads all files
+        if not self._is_open:
+            await self._open()
+        return await to_thread_pool(
+            "io", _get_many, [self.root / key for key in keys], prototype, self._map_cache
+        )
 
-    async def set_partial_values(self, key_start_values: list[tuple[str, int, bytes]]) -> None:
+    async def set_many(self, key_values: list[tuple[str, Buffer]]) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        for _, value in key_values:
+            if not isinstance(value, Buffer):
+                raise TypeError("LocalStore.set_many(): values must be Buffer instances")
+        path_values = [(self.root / key, value) for key, value in key_values]
+        for path, _ in path_values:
+            self._invalidate_map(path)
+        await to_thread_pool("io", self._writer.write_many, path_values)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        self._check_writable()
+        paths = [self.root / key for key in keys]
+        for path in paths:
+            self._invalidate_map(path)
+        await to_thread_pool("io", _delete_many, paths)
+
+    async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
         self._check_writable()
         args = []
         for key, start, value in key_start_values:
             assert isinstance(key, str)
             path = self.root / key
-            args.append((_put, path, value, start))
-        await concurrent_map(args, to_thread, limit=None)  # TODO: fix limit
+            args.append(("io", self._writer.write_at, path, start, value, self.fsync == "file"))
+        await concurrent_map(args, to_thread_pool, limit=None)  # TODO: fix limit
+        if self.fsync == "batch":
+            await to_thread_pool(
+                "io", _fsync_paths, [self.root / key for key, _, _ in key_start_values]
+            )
 
     async def delete(self, key: str) -> None:
         self._check_writable()
         path = self.root / key
+        self._invalidate_map(path)
         if path.is_dir():  # TODO: support deleting directories? shutil.rmtree?
+            self._writer.forget_directories()
             shutil.rmtree(path)
         else:
-            await to_thread(path.unlink, True)  # Q: we may want to raise if path is missing
+            # Q: we may want to raise if path is missing
+            await to_thread_pool("io", path.unlink, True)
 
     async def exists(self, key: str) -> bool:
         path = self.root / key
-        return await to_thread(path.is_file)
+        return await to_thread_pool("io", path.is_file)
 
     async def list(self) -> AsyncGenerator[str, None]:
         """Retrieve all keys in the store.
@@ -183,10 +662,8 @@ class LocalStore(Store):
         -------
         AsyncGenerator[str, None]
         """
-        to_strip = str(self.root) + "/"
-        for p in list(self.root.rglob("*")):
-            if p.is_file():
-                yield str(p).replace(to_strip, "")
+        async for key in _iterate_batches(_list_batches(self.root)):
+            yield key
 
     async def list_prefix(self, prefix: str) -> AsyncGenerator[str, None]:
         """Retrieve all keys in the store with a given prefix.
@@ -199,14 +676,12 @@ class LocalStore(Store):
         -------
         AsyncGenerator[str, None]
         """
-        for p in (self.root / prefix).rglob("*"):
-            if p.is_file():
-                yield str(p)
-
-        to_strip = str(self.root) + "/"
-        for p in (self.root / prefix).rglob("*"):
-            if p.is_file():
-                yield str(p).replace(to_strip, "")
+        # only the directory of the prefix is listed
+        head, _, name = prefix.rpartition("/")
+        key_prefix = f"{head}/" if head else ""
+        batches = _list_batches(self.root / head, key_prefix, name_prefix=name)
+        async for key in _iterate_batches(batches):
+            yield key
 
     async def list_dir(self, prefix: str) -> AsyncGenerator[str, None]:
         """
@@ -221,13 +696,6 @@ class LocalStore(Store):
         -------
         AsyncGenerator[str, None]
         """
-
-        base = self.root / prefix
-        to_strip = str(base) + "/"
-
-        try:
-            key_iter = base.iterdir()
-            for key in key_iter:
-                yield str(key).replace(to_strip, "")
-        except (FileNotFoundError, NotADirectoryError):
-            pass
+        batches = _list_batches(self.root / prefix, recursive=False)
+        async for key in _iterate_batches(batches):
+            yield key
@@ -3,14 +3,18 @@ from __future__ import annotations
 from collections.abc import AsyncGenerator, MutableMapping
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from zarr.abc.store import Store
 from zarr.core.buffer import Buffer
 from zarr.core.common import concurrent_map
 from zarr.store._utils import _normalize_interval_index
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from zarr.core.buffer import BufferPrototype
-    from zarr.core.common import AccessModeLiteral
+    from zarr.core.common import AccessModeLiteral, BytesLike
 
 
 # TODO: this store could easily be extended to wrap any MutableMapping store from v2
@@ -59,6 +63,27 @@ class MemoryStore(Store):
         except KeyError:
             return None
 
+    async def get_into(self, key: str, out: npt.NDArray[np.uint8]) -> bool:
+        if not self._is_open:
+            await self._open()
+        try:
+            value = self._store_dict[key]
+        except KeyError:
+            return False
+        data = value.as_numpy_array()
+        if data.nbytes != out.nbytes:
+            raise ValueError(
+                f"Value of {key!r} has {data.nbytes} bytes, but the output has {out.nbytes} bytes."
+            )
+        out[:] = data
+        return True
+
+    async def getsize(self, key: str) -> int:
+        try:
+            return len(self._store_dict[key])
+        except KeyError as e:
+            raise FileNotFoundError(key) from e
+
     async def get_partial_values(
         self,
         prototype: BufferPrototype,
@@ -71,6 +96,15 @@ class MemoryStore(Store):
         vals = await concurrent_map(key_ranges, _get, limit=None)
         return vals
 
+    async def get_many(self, prototype: BufferPrototype, keys: list[str]) -> list[Buffer | None]:
+        if not self._is_open:
+            await self._open()
+        values: list[Buffer | None] = []
+        for key in keys:
+            value = self._store_dict.get(key)
+            values.append(None if value is None else prototype.buffer.from_buffer(value))
+        return values
+
     async def exists(self, key: str) -> bool:
         return key in self._store_dict
 
@@ -96,8 +130,29 @@ class MemoryStore(Store):
         except KeyError:
             pass  # Q(JH): why not raise?
 
-    async def set_partial_values(self, key_start_values: list[tuple[str, int, bytes]]) -> None:
-        raise NotImplementedError
+    async def set_many(self, key_values: list[tuple[str, Buffer]]) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        for key, value in key_values:
+            if not isinstance(value, Buffer):
+                raise TypeError(f"Expected Buffer. Got {type(value)}.")
+            self._store_dict[key] = value
+
+    async def delete_many(self, keys: list[str]) -> None:
+        self._check_writable()
+        for key in keys:
+            self._store_dict.pop(key, None)
+
+    async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
+        self._check_writable()
+        for key, start, value in key_start_values:
+            data = np.frombuffer(value, dtype="uint8")
+            old = self._store_dict[key].as_numpy_array()
+            new = np.empty(max(len(old), start + len(data)), dtype="uint8")
+            new[: len(old)] = old
+            new[start : start + len(data)] = data
+            self._store_dict[key] = Buffer.from_array_like(new.view("b"))
 
     async def list(self) -> AsyncGenerator[str, None]:
         for key in self._store_dict:
@@ -7,6 +7,8 @@ import fsspec
 
 from zarr.abc.store import Store
 from zarr.core.buffer import Buffer
+from zarr.core.config import config
+from zarr.store._utils import _coalesce_byte_ranges
 from zarr.store.common import _dereference_path
 
 if TYPE_CHECKING:
@@ -128,6 +130,29 @@ class RemoteStore(Store):
         else:
             return value
 
+    async def get_many(self, prototype: BufferPrototype, keys: list[str]) -> list[Buffer | None]:
+        # a single `_cat_ranges` call, which file systems may serve with batched requests.
+        # Unlike `_cat`, it does not expand glob patterns and returns the values in order.
+        if not self._is_open:
+            await self._open()
+        if not keys:
+            return []
+        paths = [_dereference_path(self.path, key) for key in keys]
+        res = await self._fs._cat_ranges(paths, None, None, on_error="return")
+        values: list[Buffer | None] = []
+        for value in res:
+            if isinstance(value, self.allowed_exceptions):
+                values.append(None)
+            elif isinstance(value, Exception):
+                raise value
+            else:
+                values.append(prototype.buffer.from_bytes(value))
+        if len(values) != len(keys):
+            raise RuntimeError(
+                f"expected {len(keys)} values from the file system, got {len(values)}"
+            )
+        return values
+
     async def set(
         self,
         key: str,
@@ -153,6 +178,30 @@ class RemoteStore(Store):
         except self.allowed_exceptions:
             pass
 
+    async def set_many(self, key_values: list[tuple[str, Buffer]]) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        if key_values:
+            await self._fs._pipe(
+                {_dereference_path(self.path, key): value.to_bytes() for key, value in key_values}
+            )
+
+    async def delete_many(self, keys: list[str]) -> None:
+        self._check_writable()
+        if not keys:
+            return
+        try:
+            await self._fs._rm([_dereference_path(self.path, key) for key in keys])
+        except self.allowed_exceptions:
+            # some file systems refuse to delete missing paths in bulk
+            await super().delete_many(keys)
+
+    async def getsize(self, key: str) -> int:
+        path = _dereference_path(self.path, key)
+        size: int = await self._fs._size(path)
+        return size
+
     async def exists(self, key: str) -> bool:
         path = _dereference_path(self.path, key)
         exists: bool = await self._fs._exists(path)
@@ -163,29 +212,62 @@ class RemoteStore(Store):
         prototype: BufferPrototype,
         key_ranges: list[tuple[str, tuple[int | None, int | None]]],
     ) -> list[Buffer | None]:
-        if key_ranges:
-            paths, starts, stops = zip(
-                *(
-                    (
-                        _dereference_path(self.path, k[0]),
-                        k[1][0],
-                        ((k[1][0] or 0) + k[1][1]) if k[1][1] is not None else None,
-                    )
-                    for k in key_ranges
-                ),
-                strict=False,
-            )
-        else:
+        if not key_ranges:
             return []
+        # nearby ranges of the same key are fetched with a single request, and sliced back
+        # into views of the merged response
+        max_gap = config.get("store.coalesce_max_gap")
+        max_size = config.get("store.coalesce_max_size")
+        paths: list[str] = []
+        starts: list[int | None] = []
+        stops: list[int | None] = []
+        # the request of each key range, and its slice of the response
+        parts: list[tuple[int, slice]] = [(0, slice(None))] * len(key_ranges)
+        bounded_by_key: dict[str, list[int]] = {}
+        for i, (key, (start, length)) in enumerate(key_ranges):
+            if length is not None and (start is None or start >= 0):
+                bounded_by_key.setdefault(key, []).append(i)
+            else:
+                parts[i] = (len(paths), slice(None))
+                paths.append(_dereference_path(self.path, key))
+                starts.append(start)
+                stops.append(None if length is None else (start or 0) + length)
+        for key, indices in bounded_by_key.items():
+            byte_ranges = []
+            for i in indices:
+                start, length = key_ranges[i][1]
+                assert length is not None
+                byte_ranges.append((start or 0, (start or 0) + length))
+            path = _dereference_path(self.path, key)
+            for merged_start, merged_end, merged in _coalesce_byte_ranges(
+                byte_ranges, max_gap, max_size
+            ):
+                for j in merged:
+                    start, end = byte_ranges[j]
+                    parts[indices[j]] = (
+                        len(paths),
+                        slice(start - merged_start, end - merged_start),
+                    )
+                paths.append(path)
+                starts.append(merged_start)
+                stops.append(merged_end)
+
         # TODO: expectations for exceptions or missing keys?
-        res = await self._fs._cat_ranges(list(paths), starts, stops, on_error="return")
+        res = await self._fs._cat_ranges(paths, starts, stops, on_error="return")
         # the following is an s3-specific condition we probably don't want to leak
         res = [b"" if (isinstance(r, OSError) and "not satisfiable" in str(r)) else r for r in res]
         for r in res:
             if isinstance(r, Exception) and not isinstance(r, self.allowed_exceptions):
                 raise r
 
-        return [None if isinstance(r, Exception) else prototype.buffer.from_bytes(r) for r in res]
+        buffers = [
+            None if isinstance(r, Exception) else prototype.buffer.from_bytes(r) for r in res
+        ]
+        values: list[Buffer | None] = []
+        for request, part in parts:
+            buffer = buffers[request]
+            values.append(None if buffer is None else buffer[part])
+        return values
 
     async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
         raise NotImplementedError
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from zarr.abc.store import Store, _specializes_get_into
+from zarr.core.buffer import default_buffer_prototype
+from zarr.store._utils import _normalize_byte_range
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.core.common import AccessModeLiteral, BytesLike
+
+__all__ = ["SingleFlightStore", "SingleFlightStoreStats"]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStoreStats:
+    """Statistics of a SingleFlightStore."""
+
+    # the number of requests that were sent to the wrapped store
+    requests: int
+    # the number of reads that were served by a request of another read
+    shared: int
+
+
+def _retrieve_exception(task: asyncio.Future[Any]) -> None:
+    # the reads that share a request may all have been cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlightStore(Store):
+    """Store that deduplicates concurrent reads of another store.
+
+    Reads of the same key and byte range that overlap in time share a single request to the
+    wrapped store and receive the same Buffer. Nothing is kept once the request completes, so
+    unlike `CacheStore` no memory is needed beyond the values in flight. Reads that start after
+    a write to a key do not share requests that started before the write.
+
+    Parameters
+    ----------
+    store : Store
+        The store to read from.
+    mode : str, optional
+        The access mode of the SingleFlightStore. Defaults to the mode of `store`.
+    """
+
+    _store: Store
+
+    def __init__(self, store: Store, *, mode: AccessModeLiteral | None = None) -> None:
+        super().__init__(mode="r" if mode is None else mode)
+        if mode is None:
+            self._mode = store.mode
+        self._store = store
+        self._flights: dict[Hashable, asyncio.Future[Any]] = {}
+        # the flight keys of the requests in flight for each store key
+        self._flight_keys: dict[str, set[Hashable]] = {}
+        self._requests = 0
+        self._shared = 0
+
+    @property
+    def supports_writes(self) -> bool:
+        return self._store.supports_writes
+
+    @property
+    def supports_partial_writes(self) -> bool:
+        return self._store.supports_partial_writes
+
+    @property
+    def supports_listing(self) -> bool:
+        return self._store.supports_listing
+
+    async def _open(self) -> None:
+        if self._is_open:
+            raise ValueError("store is already open")
+        await self._store._ensure_open()
+        self._is_open = True
+
+    def close(self) -> None:
+        super().close()
+        self._store.close()
+
+    def __str__(self) -> str:
+        return str(self._store)
+
+    def __repr__(self) -> str:
+        return f"SingleFlightStore({self._store!r})"
+
+    def stats(self) -> SingleFlightStoreStats:
+        """Returns the number of requests and of shared reads.
+
+        Returns
+        -------
+        SingleFlightStoreStats
+        """
+        return SingleFlightStoreStats(requests=self._requests, shared=self._shared)
+
+    def _land(self, key: str, flight_key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._flights.get(flight_key) is not task:
+            return
+        del self._flights[flight_key]
+        flight_keys = self._flight_keys[key]
+        flight_keys.discard(flight_key)
+        if not flight_keys:
+            del self._flight_keys[key]
+
+    def _start(self, key: str, flight_key: Hashable, request: Awaitable[T]) -> asyncio.Future[T]:
+        task = asyncio.ensure_future(request)
+        self._flights[flight_key] = task
+        self._flight_keys.setdefault(key, set()).add(flight_key)
+        task.add_done_callback(partial(self._land, key, flight_key))
+        task.add_done_callback(_retrieve_exception)
+        return task
+
+    async def _single_flight(
+        self, key: str, flight_key: Hashable, request: Callable[[], Awaitable[T]]
+    ) -> T:
+        task = self._flights.get(flight_key)
+        if task is None:
+            self._requests += 1
+            task = self._start(key, flight_key, request())
+        else:
+            self._shared += 1
+        # cancelling one read must not cancel the request of the others
+        result: T = await asyncio.shield(task)
+        return result
+
+    def _invalidate_key(self, key: str) -> None:
+        for flight_key in self._flight_keys.pop(key, ()):
+            del self._flights[flight_key]
+
+    async def empty(self) -> bool:
+        return await self._store.empty()
+
+    async def clear(self) -> None:
+        try:
+            await self._store.clear()
+        finally:
+            self._flights.clear()
+            self._flight_keys.clear()
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: tuple[int | None, int | None] | None = None,
+    ) -> Buffer | None:
+        if not self._is_open:
+            await self._open()
+        byte_range = _normalize_byte_range(byte_range)
+        return await self._single_flight(
+            key,
+            ("get", key, byte_range, prototype),
+            partial(self._store.get, key, prototype, byte_range=byte_range),
+        )
+
+    async def get_into(self, key: str, out: npt.NDArray[np.uint8]) -> bool:
+        if not self._is_open:
+            await self._open()
+        flight_key = ("get", key, None, default_buffer_prototype())
+        if not _specializes_get_into(self._store) or flight_key in self._flights:
+            # share the value of a read in flight
+            return await super().get_into(key, out)
+        return await self._store.get_into(key, out)
+
+    async def getsize(self, key: str) -> int:
+        return await self._single_flight(key, ("getsize", key), partial(self._store.getsize, key))
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: list[tuple[str, tuple[int | None, int | None]]],
+    ) -> list[Buffer | None]:
+        flight_keys: list[Hashable] = [
+            ("get", key, _normalize_byte_range(byte_range), prototype)
+            for key, byte_range in key_ranges
+        ]
+        # the reads that are not in flight are sent as one request
+        new: dict[Hashable, int] = {}
+        new_key_ranges: list[tuple[str, tuple[int | None, int | None]]] = []
+        for flight_key, key_range in zip(flight_keys, key_ranges, strict=True):
+            if flight_key in self._flights or flight_key in new:
+                self._shared += 1
+            else:
+                new[flight_key] = len(new_key_ranges)
+                new_key_ranges.append(key_range)
+        if new_key_ranges:
+            self._requests += 1
+            request = asyncio.ensure_future(
+                self._store.get_partial_values(prototype, new_key_ranges)
+            )
+            request.add_done_callback(_retrieve_exception)
+
+            async def _item(i: int) -> Buffer | None:
+                return (await request)[i]
+
+            for flight_key, i in new.items():
+                self._start(new_key_ranges[i][0], flight_key, _item(i))
+        tasks = [self._flights[flight_key] for flight_key in flight_keys]
+        return list(await asyncio.gather(*(asyncio.shield(task) for task in tasks)))
+
+    async def exists(self, key: str) -> bool:
+        return await self._single_flight(key, ("exists", key), partial(self._store.exists, key))
+
+    async def set(self, key: str, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
+        if not self._is_open:
+            await self._open()
+        self._check_writable()
+        self._invalidate_key(key)
+        try:
+            if byte_range is None:
+                await self._store.set(key, value)
+            else:
+                await self._store.set(key, value, byte_range=byte_range)  # type: ignore[call-arg]
+        finally:
+            # reads that started during the write may return the previous value
+            self._invalidate_key(key)
+
+    async def delete(self, key: str) -> None:
+        self._check_writable()
+        self._invalidate_key(key)
+        try:
+            await self._store.delete(key)
+        finally:
+            self._invalidate_key(key)
+
+    async def set_partial_values(self, key_start_values: list[tuple[str, int, BytesLike]]) -> None:
+        self._check_writable()
+        keys = {key for key, _, _ in key_start_values}
+        for key in keys:
+            self._invalidate_key(key)
+        try:
+            await self._store.set_partial_values(key_start_values)
+        finally:
+            for key in keys:
+                self._invalidate_key(key)
+
+    def list(self) -> AsyncGenerator[str, None]:
+        return self._store.list()
+
+    def list_prefix(self, prefix: str) -> AsyncGenerator[str, None]:
+        return self._store.list_prefix(prefix)
+
+    def list_dir(self, prefix: str) -> AsyncGenerator[str, None]:
+        return self._store.list_dir(prefix)
@@ -1,5 +1,6 @@
 from typing import Any, Generic, TypeVar
 
+import numpy as np
 import pytest
 
 from zarr.abc.store import AccessMode, Store
@@ -94,6 +95,42 @@ class StoreTests(Generic[S]):
         expected = data_buf[start : start + length]
         assert_bytes_equal(observed, expected)
 
+    @pytest.mark.parametrize("key", ["c/0", "foo/c/0.0"])
+    @pytest.mark.parametrize("data", [b"\x01\x02\x03\x04", b""])
+    async def test_get_into(self, store: S, key: str, data: bytes) -> None:
+        """
+        Ensure that data can be read into a pre-allocated array using the store.get_into method.
+        """
+        self.set(store, key, Buffer.from_bytes(data))
+        out = np.zeros(len(data), dtype="uint8")
+        assert await store.get_into(key, out)
+        assert out.tobytes() == data
+        with pytest.raises(ValueError):
+            await store.get_into(key, np.zeros(len(data) + 1, dtype="uint8"))
+        assert not await store.get_into("missing", out)
+
+    @pytest.mark.parametrize("key", ["c/0", "foo/c/0.0"])
+    @pytest.mark.parametrize("data", [b"\x01\x02\x03\x04", b""])
+    async def test_getsize(self, store: S, key: str, data: bytes) -> None:
+        """
+        Ensure that the size of a value can be retrieved using the store.getsize method.
+        """
+        self.set(store, key, Buffer.from_bytes(data))
+        assert await store.getsize(key) == len(data)
+        with pytest.raises(FileNotFoundError):
+            await store.getsize("missing")
+
+    async def test_set_partial_values(self, store: S) -> None:
+        """
+        Ensure that existing values can be overwritten and extended using the
+        store.set_partial_values method.
+        """
+        if not store.supports_partial_writes:
+            pytest.skip("store does not support partial writes")
+        self.set(store, "c/0", Buffer.from_bytes(b"\x01\x02\x03\x04"))
+        await store.set_partial_values([("c/0", 1, b"\x05\x06"), ("c/0", 4, b"\x07")])
+        assert self.get(store, "c/0").to_bytes() == b"\x01\x05\x06\x04\x07"
+
     @pytest.mark.parametrize("key", ["zarr.json", "c/0", "foo/c/0.0", "foo/0/0"])
     @pytest.mark.parametrize("data", [b"\x01\x02\x03\x04", b""])
     async def test_set(self, store: S, key: str, data: bytes) -> None:
@@ -146,6 +183,58 @@ class StoreTests(Generic[S]):
             obs.to_bytes() == exp.to_bytes() for obs, exp in zip(observed, expected, strict=True)
         )
 
+    async def test_get_partial_values_coalesced(self, store: S) -> None:
+        # nearby, overlapping and open-ended ranges of the same key are merged by some stores
+        data = bytes(range(100))
+        self.set(store, "c/0", Buffer.from_bytes(data))
+        self.set(store, "c/1", Buffer.from_bytes(data[::-1]))
+        key_ranges: list[tuple[str, tuple[int | None, int | None]]] = [
+            ("c/0", (10, 5)),
+            ("c/1", (0, 2)),
+            ("c/0", (12, 10)),
+            ("c/0", (0, 3)),
+            ("c/0", (50, None)),
+            ("c/0", (90, 20)),
+            ("c/2", (0, 1)),
+            ("c/1", (98, 2)),
+        ]
+        observed = await store.get_partial_values(default_buffer_prototype(), key_ranges)
+        assert [None if v is None else v.to_bytes() for v in observed] == [
+            data[10:15],
+            data[::-1][0:2],
+            data[12:22],
+            data[0:3],
+            data[50:],
+            data[90:],
+            None,
+            data[::-1][98:],
+        ]
+
+    async def test_get_many(self, store: S) -> None:
+        self.set(store, "c/0", Buffer.from_bytes(b"\x01\x02"))
+        self.set(store, "zarr.json", Buffer.from_bytes(b"{}"))
+        observed = await store.get_many(default_buffer_prototype(), ["zarr.json", "c/1", "c/0"])
+        assert [None if v is None else v.to_bytes() for v in observed] == [
+            b"{}",
+            None,
+            b"\x01\x02",
+        ]
+        assert await store.get_many(default_buffer_prototype(), []) == []
+
+    async def test_set_many(self, store: S) -> None:
+        await store.set_many(
+            [("c/0", Buffer.from_bytes(b"\x01")), ("foo/c/0.0", Buffer.from_bytes(b""))]
+        )
+        assert self.get(store, "c/0").to_bytes() == b"\x01"
+        assert self.get(store, "foo/c/0.0").to_bytes() == b""
+
+    async def test_delete_many(self, store: S) -> None:
+        await store.set("c/0", Buffer.from_bytes(b"\x01"))
+        await store.set("c/1", Buffer.from_bytes(b"\x02"))
+        await store.delete_many(["c/0", "c/2"])
+        assert not await store.exists("c/0")
+        assert await store.exists("c/1")
+
     async def test_exists(self, store: S) -> None:
         assert not await store.exists("foo")
         await store.set("foo/zarr.json", Buffer.from_bytes(b"bar"))
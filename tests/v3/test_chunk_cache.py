@@ -0,0 +1,188 @@
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pytest
+
+from zarr import Array
+from zarr.core.chunk_cache import _chunk_cache, chunk_cache_stats, clear_chunk_cache
+from zarr.core.config import config
+from zarr.store import MemoryStore, StorePath
+
+
+@pytest.fixture(autouse=True)
+def _clear_chunk_cache() -> Iterator[None]:
+    clear_chunk_cache()
+    yield
+    clear_chunk_cache()
+
+
+def _create_array(store: MemoryStore, path: str = "cached") -> Array:
+    return Array.create(
+        StorePath(store, path),
+        shape=(40, 40),
+        chunk_shape=(10, 10),
+        dtype="i4",
+        fill_value=0,
+    )
+
+
+def _count_gets(store: MemoryStore, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    keys: list[str] = []
+    get, get_many = store.get, store.get_many
+
+    async def counting_get(key: str, *args: Any, **kwargs: Any) -> Any:
+        keys.append(key)
+        return await get(key, *args, **kwargs)
+
+    async def counting_get_many(prototype: Any, many_keys: list[str]) -> Any:
+        keys.extend(many_keys)
+        return await get_many(prototype, many_keys)
+
+    monkeypatch.setattr(store, "get", counting_get)
+    monkeypatch.setattr(store, "get_many", counting_get_many)
+    return keys
+
+
+@pytest.mark.parametrize("policy", ["lru", "arc"])
+def test_chunk_cache(policy: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MemoryStore(mode="w")
+    data = np.arange(40 * 40, dtype="i4").reshape(40, 40)
+    a = _create_array(store)
+    a[:] = data
+    keys = _count_gets(store, monkeypatch)
+    with config.set({"chunk_cache.size": 2**20, "chunk_cache.policy": policy}):
+        stats = chunk_cache_stats()
+        assert np.array_equal(a[3:5, 12:25], data[3:5, 12:25])
+        assert chunk_cache_stats().misses == stats.misses + 2
+        assert chunk_cache_stats().nbytes == 2 * 10 * 10 * 4
+        assert len(keys) == 2
+
+        # another array instance on the same store shares the cache
+        b = Array.open(StorePath(store, "cached"))
+        keys.clear()
+        assert np.array_equal(b[4, 10:20], data[4, 10:20])
+        assert np.array_equal(b[2:7, 15], data[2:7, 15])
+        assert keys == []
+        assert chunk_cache_stats().hits == stats.hits + 2
+
+        # writes invalidate the cached chunks
+        a[4, 15] = -1
+        data[4, 15] = -1
+        assert chunk_cache_stats().nbytes == 10 * 10 * 4
+        assert np.array_equal(b[:10, 10:30], data[:10, 10:30])
+
+        # missing chunks are cached with the fill value
+        assert np.array_equal(b.resize((50, 40))[45, :5], np.zeros(5, dtype="i4"))
+
+        # chunks that exceed the size of the cache are not cached
+        clear_chunk_cache()
+        with config.set({"chunk_cache.size": 100}):
+            keys.clear()
+            assert np.array_equal(a[:], data)
+            assert len(keys) == 16
+            assert chunk_cache_stats().nbytes == 0
+
+    # the cache is disabled by default
+    keys.clear()
+    assert np.array_equal(a[3:5, 12:25], data[3:5, 12:25])
+    assert len(keys) == 2
+
+
+def test_chunk_cache_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MemoryStore(mode="w")
+    with config.set({"chunk_cache.size": 2**20}):
+        a = _create_array(store)
+        a[:] = 1
+        assert np.array_equal(a[:], np.ones((40, 40), dtype="i4"))
+        assert len(_chunk_cache) == 16
+
+        # recreating the array drops the chunks of the previous array
+        b = Array.create(
+            StorePath(store, "cached"),
+            shape=(40, 40),
+            chunk_shape=(10, 10),
+            dtype="i4",
+            fill_value=0,
+            exists_ok=True,
+        )
+        assert len(_chunk_cache) == 0
+        assert np.array_equal(b[:10, :10], np.ones((10, 10), dtype="i4"))
+
+        # resizing deletes the chunks outside the new shape
+        b = b.resize((10, 10))
+        b = b.resize((40, 40))
+        assert np.array_equal(b[10:, 10:], np.zeros((30, 30), dtype="i4"))
+
+
+async def test_chunk_cache_read_overlapping_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MemoryStore(mode="w")
+    a = _create_array(store)._async_array
+    await a.setitem(slice(None), np.ones((40, 40), dtype="i4"))
+    get = store.get
+    writes = []
+
+    async def get_then_write(key: str, *args: Any, **kwargs: Any) -> Any:
+        # the chunk is written after it has been fetched, but before it is cached
+        value = await get(key, *args, **kwargs)
+        if key == "cached/c/0/0" and not writes:
+            writes.append(key)
+            await a.setitem((slice(0, 10), slice(0, 10)), np.full((10, 10), 2, dtype="i4"))
+        return value
+
+    monkeypatch.setattr(store, "get", get_then_write)
+    with config.set({"chunk_cache.size": 2**20}):
+        assert np.array_equal(await a.getitem((slice(0, 10), slice(0, 20))), np.ones((10, 20)))
+        assert writes == ["cached/c/0/0"]
+        # the stale chunk is not cached, while the other chunk of the read is
+        assert len(_chunk_cache) == 1
+        assert np.array_equal(
+            await a.getitem((slice(0, 10), slice(0, 10))), np.full((10, 10), 2, dtype="i4")
+        )
+
+
+@pytest.mark.parametrize("policy", ["lru", "arc"])
+def test_chunk_cache_eviction(policy: str) -> None:
+    store = MemoryStore(mode="w")
+    a = _create_array(store)
+    a[:] = 1
+    chunk_nbytes = 10 * 10 * 4
+    with config.set({"chunk_cache.size": 4 * chunk_nbytes, "chunk_cache.policy": policy}):
+        # a hot chunk
+        a[0, 0]
+        a[0, 0]
+        stats = chunk_cache_stats()
+        # a scan over all chunks
+        a[:]
+        assert chunk_cache_stats().nbytes == 4 * chunk_nbytes
+        assert chunk_cache_stats().evictions > stats.evictions
+        hits = chunk_cache_stats().hits
+        a[0, 0]
+        # ARC keeps the hot chunk, LRU evicts it during the scan
+        assert chunk_cache_stats().hits == hits + (policy == "arc")
+
+
+def test_chunk_cache_owns_data() -> None:
+    store = MemoryStore(mode="w")
+    a = _create_array(store)
+    a[:] = 1
+    with config.set({"chunk_cache.size": 2**20}):
+        a[:]
+        chunk_arrays = [
+            entry.chunk_array.as_numpy_array() for entry in _chunk_cache._recent.values()
+        ]
+        assert len(chunk_arrays) == 16
+        # the cached chunks are not views of the array that the batch was decoded into
+        for chunk_array in chunk_arrays:
+            assert chunk_array.flags.owndata
+            assert chunk_array.nbytes == 10 * 10 * 4
+
+
+def test_chunk_cache_policy() -> None:
+    store = MemoryStore(mode="w")
+    a = _create_array(store)
+    with (
+        config.set({"chunk_cache.size": 2**20, "chunk_cache.policy": "mru"}),
+        pytest.raises(ValueError, match=r"chunk_cache\.policy"),
+    ):
+        a[0, 0]
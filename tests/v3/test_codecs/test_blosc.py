@@ -1,12 +1,14 @@
 import json
+from typing import Any
 
 import numpy as np
 import pytest
 
-from zarr import AsyncArray
+from zarr import AsyncArray, config
 from zarr.abc.store import Store
 from zarr.codecs import BloscCodec, BytesCodec, ShardingCodec
 from zarr.core.buffer import default_buffer_prototype
+from zarr.store import MemoryStore
 from zarr.store.common import StorePath
 
 
@@ -55,3 +57,102 @@ async def test_blosc_evolve(store: Store, dtype: str) -> None:
         assert blosc_configuration_json["shuffle"] == "bitshuffle"
     else:
         assert blosc_configuration_json["shuffle"] == "shuffle"
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize("clevel", [0, 5])
+async def test_blosc_partial_decode(
+    store: Store, clevel: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = np.random.default_rng(0).random((256, 256))
+    spath = StorePath(store, "blosc_partial")
+    a = await AsyncArray.create(
+        spath,
+        shape=data.shape,
+        chunk_shape=(128, 256),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[BytesCodec(), BloscCodec(cname="lz4", clevel=clevel, blocksize=2**14)],
+    )
+    await a.setitem(slice(None), data)
+    chunk_nbytes = await store.getsize("blosc_partial/c/0/0")
+
+    fetched: list[int] = []
+    get = store.get
+
+    async def counting_get(*args: Any, **kwargs: Any) -> Any:
+        value = await get(*args, **kwargs)
+        fetched.append(0 if value is None else len(value))
+        return value
+
+    monkeypatch.setattr(store, "get", counting_get)
+    selections = [
+        (slice(3, 5), slice(10, 20)),
+        (130, slice(None)),
+        (slice(200, 210, 3), slice(None, None, 7)),
+    ]
+    # chunks are read as a whole, unless partial decompression is enabled
+    for selection in selections:
+        fetched.clear()
+        assert np.array_equal(await a.getitem(selection), data[selection])
+        assert fetched == [chunk_nbytes]
+
+    with config.set({"codec_pipeline.partial_decompress": True}):
+        for selection in selections:
+            fetched.clear()
+            assert np.array_equal(await a.getitem(selection), data[selection])
+            # the header and the block offsets are read together, followed by the blocks
+            assert len(fetched) == 2
+            assert 0 < sum(fetched) < chunk_nbytes / 2
+
+        # large selections decode the chunks as a whole
+        assert np.array_equal(await a.getitem(slice(None)), data)
+
+
+async def test_blosc_partial_decode_small_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the block offsets that are not covered by the first request are read separately
+    monkeypatch.setattr("zarr.codecs.blosc.BLOSC_MIN_AUTO_BLOCKSIZE", 2**30)
+    data = np.arange(256 * 256, dtype="f8").reshape((256, 256))
+    store = MemoryStore(mode="w")
+    a = await AsyncArray.create(
+        StorePath(store, "blosc_small_blocks"),
+        shape=data.shape,
+        chunk_shape=(256, 256),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[BytesCodec(), BloscCodec(cname="lz4")],
+    )
+    await a.setitem(slice(None), data)
+    byte_ranges: list[Any] = []
+    get = store.get
+
+    async def recording_get(*args: Any, **kwargs: Any) -> Any:
+        byte_ranges.append(kwargs.get("byte_range"))
+        return await get(*args, **kwargs)
+
+    monkeypatch.setattr(store, "get", recording_get)
+    with config.set({"codec_pipeline.partial_decompress": True}):
+        for selection in [(slice(3, 5), slice(10, 20)), (130, slice(None))]:
+            byte_ranges.clear()
+            assert np.array_equal(await a.getitem(selection), data[selection])
+            assert len(byte_ranges) == 3
+            assert byte_ranges[1][0] == byte_ranges[0][1]
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+async def test_blosc_partial_decode_sharding(store: Store) -> None:
+    data = np.arange(64 * 64, dtype="i4").reshape((64, 64))
+    spath = StorePath(store, "blosc_partial_sharding")
+    a = await AsyncArray.create(
+        spath,
+        shape=data.shape,
+        chunk_shape=(64, 64),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[ShardingCodec(chunk_shape=(32, 32), codecs=[BytesCodec(), BloscCodec()])],
+    )
+    await a.setitem(slice(None), data)
+    # small selections decode byte ranges of the inner chunks
+    with config.set({"codec_pipeline.partial_decompress": True}):
+        for selection in [(slice(3, 4), slice(3, 4)), (40, slice(33, 40))]:
+            assert np.array_equal(await a.getitem(selection), data[selection])
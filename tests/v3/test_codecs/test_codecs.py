@@ -18,7 +18,7 @@ from zarr.codecs import (
 )
 from zarr.core.buffer import default_buffer_prototype
 from zarr.core.common import MemoryOrder
-from zarr.core.indexing import Selection, morton_order_iter
+from zarr.core.indexing import Selection, morton_order, morton_order_iter
 from zarr.store import StorePath
 from zarr.testing.utils import assert_bytes_equal
 
@@ -216,6 +216,19 @@ def test_morton() -> None:
         (0, 1, 1, 1),
         (1, 1, 1, 1),
     ]
+    # shapes that are not powers of two are fully covered
+    assert list(morton_order_iter((3, 3))) == [
+        (0, 0),
+        (1, 0),
+        (0, 1),
+        (1, 1),
+        (2, 0),
+        (2, 1),
+        (0, 2),
+        (1, 2),
+        (2, 2),
+    ]
+    assert list(morton_order((3, 3))) == [0, 3, 1, 4, 6, 7, 2, 5, 8]
 
 
 @pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
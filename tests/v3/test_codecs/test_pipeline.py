@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from zarr import Array, config
+from zarr.abc.codec import Codec
+from zarr.abc.store import Store
+from zarr.codecs import (
+    BloscCodec,
+    BytesCodec,
+    Crc32cCodec,
+    GzipCodec,
+    ShardingCodec,
+    StreamingCodecPipeline,
+    TransposeCodec,
+    ZstdCodec,
+)
+from zarr.codecs.pipeline import (
+    BatchedCodecPipeline,
+    _AdaptiveBatchTuner,
+    _run_stages,
+    _StageTimings,
+    _supported_reads,
+)
+from zarr.codecs.sharding import _ShardingByteGetter, _ShardReader
+from zarr.core.array_spec import ArraySpec
+from zarr.core.buffer import Buffer, default_buffer_prototype
+from zarr.core.executor import get_thread_pool, thread_pool_stats
+from zarr.core.sync import sync
+from zarr.registry import get_pipeline_class
+from zarr.store import MemoryStore, StorePath
+
+STREAMING_PIPELINE = "zarr.codecs.pipeline.StreamingCodecPipeline"
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec()],
+        [TransposeCodec(order=(1, 0)), BytesCodec(), GzipCodec()],
+        [ShardingCodec(chunk_shape=(8, 8), codecs=[BytesCodec(), GzipCodec()])],
+    ],
+)
+def test_streaming_pipeline_roundtrip(store: Store, codecs: list[Codec]) -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    with config.set({"codec_pipeline.path": STREAMING_PIPELINE, "codec_pipeline.queue_size": 2}):
+        assert get_pipeline_class() is StreamingCodecPipeline
+        a = Array.create(
+            StorePath(store, path="streaming"),
+            shape=data.shape,
+            chunk_shape=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=codecs,
+        )
+        assert isinstance(a._async_array.codec_pipeline, StreamingCodecPipeline)
+        a[:, :] = data
+        assert np.array_equal(a[:, :], data)
+
+        # partial writes merge with the existing chunks
+        data[3:40, 5:9] = 1
+        a[3:40, 5:9] = data[3:40, 5:9]
+        assert np.array_equal(a[:, :], data)
+        assert np.array_equal(a[16:32, 16:48], data[16:32, 16:48])
+
+        # chunks that only contain the fill value are deleted
+        data[:16, :16] = 0
+        a[:16, :16] = data[:16, :16]
+        assert not sync(store.exists("streaming/c/0/0"))
+        assert sync(store.exists("streaming/c/0/1"))
+
+
+async def test_run_stages_streams_items() -> None:
+    seen: list[int] = []
+
+    async def double(x: int) -> int:
+        await asyncio.sleep(0)
+        return x * 2
+
+    async def collect(x: int) -> None:
+        seen.append(x)
+
+    await _run_stages(range(100), [double, collect], concurrency=4, queue_size=2)
+    assert sorted(seen) == [x * 2 for x in range(100)]
+
+
+async def test_run_stages_propagates_errors() -> None:
+    async def fail(x: int) -> int:
+        if x == 7:
+            raise RuntimeError("boom")
+        return x
+
+    async def noop(x: int) -> None:
+        await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await _run_stages(range(100), [fail, noop], concurrency=3, queue_size=1)
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec(), GzipCodec()],
+        [ShardingCodec(chunk_shape=(4, 4), codecs=[BytesCodec(), GzipCodec()])],
+    ],
+)
+def test_auto_batch_size_roundtrip(store: Store, codecs: list[Codec]) -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    with config.set({"codec_pipeline.batch_size": "auto"}):
+        a = Array.create(
+            StorePath(store, path="auto"),
+            shape=data.shape,
+            chunk_shape=(8, 8),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=codecs,
+        )
+        assert a._async_array.codec_pipeline.batch_size == "auto"
+        a[:, :] = data
+        assert np.array_equal(a[:, :], data)
+        data[3:40, 5:9] = 1
+        a[3:40, 5:9] = data[3:40, 5:9]
+        assert np.array_equal(a[:, :], data)
+
+
+def test_adaptive_batch_tuner_grows_while_throughput_improves(monkeypatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr("zarr.codecs.pipeline.time.perf_counter", lambda: clock[0])
+    tuner = _AdaptiveBatchTuner(
+        chunk_nbytes=1024, memory_limit=64 * 1024, max_concurrency=8, _window_start=0.0
+    )
+
+    def run_window(seconds: float, io: float, compute: float) -> None:
+        batches = max(2, tuner.concurrency)
+        for _ in range(batches):
+            clock[0] += seconds / batches
+            tuner.record(tuner.batch_size, _StageTimings(io=io, compute=compute))
+
+    # io-bound: the concurrency is grown first
+    run_window(1.0, io=1.0, compute=0.1)
+    assert (tuner.batch_size, tuner.concurrency) == (1, 2)
+    run_window(0.5, io=1.0, compute=0.1)
+    assert (tuner.batch_size, tuner.concurrency) == (1, 4)
+    # throughput drops: the last change is reverted and the concurrency is settled
+    run_window(10.0, io=1.0, compute=0.1)
+    assert (tuner.batch_size, tuner.concurrency) == (1, 2)
+    # compute-bound: the batch size is grown until the memory limit is reached
+    for _ in range(10):
+        run_window(0.1, io=0.1, compute=1.0)
+    assert tuner.concurrency == 2
+    assert tuner.batch_size * tuner.concurrency * 1024 <= 64 * 1024
+    assert tuner.batch_size == 32
+
+
+def test_fused_execution() -> None:
+    pipeline = get_pipeline_class().from_list([BytesCodec(), GzipCodec(), Crc32cCodec()])
+    assert pipeline.supports_fused_execution
+    with config.set({"codec_executor.codecs": {"gzip": "process"}}):
+        assert not pipeline.supports_fused_execution
+    assert (
+        not get_pipeline_class()
+        .from_list([ShardingCodec(chunk_shape=(8, 8))])
+        .supports_fused_execution
+    )
+
+
+def test_fused_execution_lookup_is_cached(monkeypatch) -> None:
+    pipeline = get_pipeline_class().from_list([BytesCodec(), GzipCodec(), Crc32cCodec()])
+    assert pipeline.supports_fused_execution
+
+    def fail(self: Codec) -> None:
+        raise AssertionError("the codec name is looked up again")
+
+    monkeypatch.setattr(GzipCodec, "to_dict", fail)
+    assert pipeline.supports_fused_execution
+    assert (
+        get_pipeline_class().from_list([BytesCodec(), GzipCodec(level=1)]).supports_fused_execution
+    )
+
+
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [TransposeCodec(order=(1, 0)), BytesCodec(), BloscCodec(), Crc32cCodec()],
+        [BytesCodec(), GzipCodec(), Crc32cCodec()],
+    ],
+)
+def test_fused_execution_roundtrip(codecs: list[Codec]) -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    a = Array.create(
+        StorePath(MemoryStore(mode="w"), path="fused"),
+        shape=data.shape,
+        chunk_shape=(16, 16),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=codecs,
+    )
+    assert a._async_array.codec_pipeline.supports_fused_execution
+    a[:, :] = data
+    completed = thread_pool_stats()["compute"].completed
+    assert np.array_equal(a[:, :], data)
+    # the codec chain of each chunk is run in a single task
+    assert thread_pool_stats()["compute"].completed - completed == 16
+
+
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec()],
+        [TransposeCodec(order=(1, 0)), BytesCodec(), Crc32cCodec()],
+        [ShardingCodec(chunk_shape=(2, 2))],
+    ],
+)
+def test_fused_execution_inline(codecs: list[Codec]) -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    a = Array.create(
+        StorePath(MemoryStore(mode="w"), path="inline"),
+        shape=data.shape,
+        chunk_shape=(16, 16),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=codecs,
+    )
+    get_thread_pool("compute")
+    completed = thread_pool_stats()["compute"].completed
+    a[:, :] = data
+    data[3:5, 7] = 1
+    a[3:5, 7] = data[3:5, 7]
+    assert np.array_equal(a[:, :], data)
+    # chains of cheap codecs are run on the event loop
+    assert thread_pool_stats()["compute"].completed == completed
+
+
+@pytest.mark.parametrize(("executor", "tasks"), [("inline", 0), ("thread", 2)])
+async def test_batch_codec_decodes_in_single_task(executor: str, tasks: int) -> None:
+    codec = Crc32cCodec()
+    spec = ArraySpec(
+        shape=(4,),
+        dtype=np.dtype("uint8"),
+        fill_value=0,
+        order="C",
+        prototype=default_buffer_prototype(),
+    )
+    chunks = [default_buffer_prototype().buffer.from_bytes(bytes([i]) * 4) for i in range(100)]
+    with config.set({"codec_executor.codecs": {"crc32c": executor}}):
+        completed = thread_pool_stats()["compute"].completed
+        encoded = list(await codec.encode([(chunk, spec) for chunk in chunks] + [(None, spec)]))
+        decoded = list(await codec.decode([(chunk, spec) for chunk in encoded]))
+        # the batch is run in a single task, or on the event loop for the inline executor
+        assert thread_pool_stats()["compute"].completed - completed == tasks
+    assert encoded[-1] is None
+    assert decoded[-1] is None
+    assert [chunk.to_bytes() for chunk in decoded[:-1]] == [chunk.to_bytes() for chunk in chunks]
+
+
+@pytest.mark.parametrize("endian", ["little", "big"])
+@pytest.mark.parametrize(("executor", "tasks"), [("inline", 0), ("thread", 1)])
+def test_batch_codec_pipeline_roundtrip(executor: str, tasks: int, endian: str) -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    with config.set(
+        {
+            "codec_pipeline.batch_size": 16,
+            "codec_executor.codecs": {"bytes": executor, "crc32c": "inline"},
+        }
+    ):
+        a = Array.create(
+            StorePath(MemoryStore(mode="w"), path="batch"),
+            shape=data.shape,
+            chunk_shape=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[BytesCodec(endian=endian), Crc32cCodec()],
+        )
+        a[:, :] = data
+        completed = thread_pool_stats()["compute"].completed
+        assert np.array_equal(a[:, :], data)
+        # the codec chain of the whole mini-batch is run in a single task
+        assert thread_pool_stats()["compute"].completed - completed == tasks
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+def test_batch_codec_pipeline_bulk_store_requests(store: Store, monkeypatch) -> None:
+    calls: list[tuple[str, int]] = []
+    for name in ("get_many", "set_many", "delete_many"):
+        method = getattr(store, name)
+
+        def _record(*args, name=name, method=method):  # type: ignore[no-untyped-def]
+            calls.append((name, len(args[-1])))
+            return method(*args)
+
+        monkeypatch.setattr(store, name, _record)
+
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    with config.set({"codec_pipeline.batch_size": 16}):
+        a = Array.create(
+            StorePath(store, path="bulk"),
+            shape=data.shape,
+            chunk_shape=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[BytesCodec(), GzipCodec()],
+        )
+        a[:, :] = data
+        assert calls == [("set_many", 16)]
+        calls.clear()
+        # partial writes read the existing chunks of the whole mini-batch at once
+        a[:8, :] = 0
+        assert calls == [("get_many", 4), ("set_many", 4)]
+        calls.clear()
+        # chunks that only hold the fill value are deleted
+        a[8:16, :] = 0
+        assert calls == [("get_many", 4), ("delete_many", 4)]
+        calls.clear()
+        data[:16, :] = 0
+        assert np.array_equal(a[:, :], data)
+        assert calls == [("get_many", 16)]
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec()],
+        [BytesCodec(), BloscCodec()],
+        [BytesCodec(), GzipCodec(), Crc32cCodec()],
+        [BytesCodec(), ZstdCodec()],
+    ],
+)
+def test_decode_into_output(store: Store, codecs: list[Codec], monkeypatch) -> None:
+    fetched_batches: list[list[tuple[Buffer | None, bool]]] = []
+    fetch_chunks = BatchedCodecPipeline._fetch_chunks
+
+    async def _fetch_chunks(self, *args):  # type: ignore[no-untyped-def]
+        # the chunks that are decompressed into the output are marked in place afterwards
+        fetched = await fetch_chunks(self, *args)
+        fetched_batches.append(fetched)
+        return fetched
+
+    def _in_place() -> int:
+        return sum(in_place for fetched in fetched_batches for _, in_place in fetched)
+
+    monkeypatch.setattr(BatchedCodecPipeline, "_fetch_chunks", _fetch_chunks)
+
+    data = np.arange(0, 1000, dtype="uint16")
+    a = Array.create(
+        StorePath(store, path="into"),
+        shape=data.shape,
+        chunk_shape=(100,),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=codecs,
+    )
+    a[:] = data
+    a[500:600] = 0
+
+    # chunks fully covered by the selection are decoded in place
+    assert np.array_equal(a[100:900], data[100:900] * (np.arange(100, 900) // 100 != 5))
+    assert _in_place() == 7
+    # partially covered chunks are decoded as usual
+    fetched_batches.clear()
+    assert np.array_equal(a[50:150], data[50:150])
+    assert _in_place() == 0
+
+
+def test_supported_reads_are_checked_per_class(monkeypatch) -> None:
+    store = MemoryStore(mode="w")
+    shard_getter = _ShardingByteGetter(_ShardReader(), (0,))
+    assert _supported_reads([StorePath(store, "a"), StorePath(store, "b")]) == (True, True)
+    assert _supported_reads([shard_getter]) == (False, False)
+    assert _supported_reads([StorePath(store, "a"), shard_getter]) == (False, False)
+
+    # the protocol checks are not repeated
+    monkeypatch.setattr("zarr.codecs.pipeline.ByteIntoGetter", None)
+    assert _supported_reads([StorePath(store, "c"), shard_getter]) == (False, False)
+    a = Array.create(
+        StorePath(store, path="sharded"),
+        shape=(8, 8),
+        chunk_shape=(8, 8),
+        dtype="uint8",
+        fill_value=0,
+        codecs=[ShardingCodec(chunk_shape=(2, 2), codecs=[BytesCodec()])],
+    )
+    data = np.arange(64, dtype="uint8").reshape((8, 8))
+    a[:, :] = data
+    assert np.array_equal(a[:, :], data)
+
+
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec(), GzipCodec()],
+        [ShardingCodec(chunk_shape=(4, 4), codecs=[BytesCodec()])],
+    ],
+)
+def test_read_fills_missing_chunks(codecs: list[Codec], monkeypatch) -> None:
+    create = default_buffer_prototype().nd_buffer.create
+
+    def _create_garbage(*, fill_value=None, **kwargs):  # type: ignore[no-untyped-def]
+        # outputs are allocated without being initialized
+        assert fill_value is None
+        out = create(**kwargs)
+        out.fill(123)
+        return out
+
+    a = Array.create(
+        StorePath(MemoryStore(mode="w"), path="missing"),
+        shape=(32, 32),
+        chunk_shape=(16, 16),
+        dtype="uint16",
+        fill_value=7,
+        codecs=codecs,
+    )
+    a[:8, :8] = np.ones((8, 8), dtype="uint16")
+    expected = np.full((32, 32), 7, dtype="uint16")
+    expected[:8, :8] = 1
+    monkeypatch.setattr(default_buffer_prototype().nd_buffer, "create", _create_garbage)
+    assert np.array_equal(a[:, :], expected)
+    assert np.array_equal(a[2:20, 3:30], expected[2:20, 3:30])
@@ -1,9 +1,10 @@
 import pickle
+import warnings
 
 import numpy as np
 import pytest
 
-from zarr import Array, AsyncArray
+from zarr import Array, AsyncArray, config
 from zarr.abc.store import Store
 from zarr.codecs import (
     BloscCodec,
@@ -12,7 +13,15 @@ from zarr.codecs import (
     ShardingCodecIndexLocation,
     TransposeCodec,
 )
+from zarr.codecs.sharding import (
+    _coalesce_byte_ranges,
+    _ShardBuilder,
+    _ShardReader,
+    shard_index_cache_stats,
+)
 from zarr.core.buffer import default_buffer_prototype
+from zarr.core.sync import sync
+from zarr.store import MemoryStore
 from zarr.store.common import StorePath
 
 from ..conftest import ArrayRequest
@@ -322,3 +331,333 @@ async def test_delete_empty_shards(store: Store) -> None:
 def test_pickle() -> None:
     codec = ShardingCodec(chunk_shape=(8, 8))
     assert pickle.loads(pickle.dumps(codec)) == codec
+
+
+def test_coalesce_byte_ranges() -> None:
+    byte_ranges = [(100, 150), (0, 10), (10, 20), (30, 40), (1000, 1010)]
+    assert _coalesce_byte_ranges(byte_ranges, 0) == [
+        (0, 20, [1, 2]),
+        (30, 40, [3]),
+        (100, 150, [0]),
+        (1000, 1010, [4]),
+    ]
+    assert _coalesce_byte_ranges(byte_ranges, 100) == [(0, 150, [1, 2, 3, 0]), (1000, 1010, [4])]
+    assert _coalesce_byte_ranges([], 100) == []
+    assert _coalesce_byte_ranges(byte_ranges, 100, 100) == [
+        (0, 40, [1, 2, 3]),
+        (100, 150, [0]),
+        (1000, 1010, [4]),
+    ]
+
+
+@pytest.mark.parametrize("index_location", ["start", "end"])
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+def test_sharding_partial_read_uncompressed(
+    store: Store, index_location: ShardingCodecIndexLocation
+) -> None:
+    data = np.arange(64 * 64, dtype="uint16").reshape((64, 64))
+    a = Array.create(
+        StorePath(store, "partial_read_uncompressed"),
+        shape=data.shape,
+        chunk_shape=(32, 32),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[ShardingCodec(chunk_shape=(4, 4), index_location=index_location)],
+    )
+    a[:, :] = data
+    assert np.array_equal(a[5:27, 3:9], data[5:27, 3:9])
+    assert np.array_equal(a[13, 20:50], data[13, 20:50])
+
+
+@pytest.mark.parametrize(
+    ("max_gap", "max_size", "expected_ranges"), [(0, 2**24, 2), (2**16, 2**24, 1), (2**16, 64, 4)]
+)
+def test_sharding_partial_read_coalesced(
+    max_gap: int, max_size: int, expected_ranges: int, monkeypatch
+) -> None:
+    store = MemoryStore(mode="w")
+    requests: list[list[tuple[str, tuple[int | None, int | None]]]] = []
+    get_partial_values = store.get_partial_values
+
+    async def _get_partial_values(prototype, key_ranges):  # type: ignore[no-untyped-def]
+        requests.append(key_ranges)
+        return await get_partial_values(prototype, key_ranges)
+
+    monkeypatch.setattr(store, "get_partial_values", _get_partial_values)
+
+    data = np.arange(32 * 32, dtype="uint16").reshape((32, 32))
+    a = Array.create(
+        StorePath(store),
+        shape=data.shape,
+        chunk_shape=(32, 32),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[ShardingCodec(chunk_shape=(4, 4))],
+    )
+    a[:, :] = data
+    with config.set({"sharding.coalesce_max_gap": max_gap, "store.coalesce_max_size": max_size}):
+        assert np.array_equal(a[0:8, 0:16], data[0:8, 0:16])
+    # the 8 inner chunks are fetched in a single call
+    assert len(requests) == 1
+    # inner chunks in morton order: groups of 4 chunks (128 bytes) are adjacent in the shard
+    assert len(requests[0]) == expected_ranges
+
+
+def test_shard_index_cache() -> None:
+    store = MemoryStore(mode="w")
+    data = np.arange(32 * 32, dtype="uint16").reshape((32, 32))
+    with config.set({"sharding.index_cache_size": 2**20}):
+        a = Array.create(
+            StorePath(store, "index_cache"),
+            shape=data.shape,
+            chunk_shape=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[ShardingCodec(chunk_shape=(4, 4))],
+        )
+        a[:, :] = data
+        stats = shard_index_cache_stats()
+        assert np.array_equal(a[0:4, 0:4], data[0:4, 0:4])
+        assert shard_index_cache_stats().misses == stats.misses + 1
+        assert np.array_equal(a[4:8, 0:4], data[4:8, 0:4])
+        assert shard_index_cache_stats().hits == stats.hits + 1
+        assert shard_index_cache_stats().nbytes >= 16 * 16
+
+        # writes invalidate the cached index
+        data[0:4, 0:4] = 1
+        a[0:4, 0:4] = data[0:4, 0:4]
+        assert np.array_equal(a[0:8, 0:4], data[0:8, 0:4])
+        assert shard_index_cache_stats().misses == stats.misses + 2
+
+        # indexes are evicted to stay within the budget
+        with config.set({"sharding.index_cache_size": 16 * 16 + 1}):
+            assert np.array_equal(a[16:20, 16:20], data[16:20, 16:20])
+            assert shard_index_cache_stats().evictions > stats.evictions
+            assert shard_index_cache_stats().nbytes <= 16 * 16 + 1
+
+
+@pytest.mark.parametrize(
+    "pipeline",
+    ["zarr.codecs.pipeline.BatchedCodecPipeline", "zarr.codecs.pipeline.StreamingCodecPipeline"],
+)
+def test_shard_index_cache_full_shard_write(pipeline: str) -> None:
+    store = MemoryStore(mode="w")
+    data = np.arange(8 * 8, dtype="uint16").reshape((8, 8))
+    with config.set({"sharding.index_cache_size": 2**20, "codec_pipeline.path": pipeline}):
+        a = Array.create(
+            StorePath(store, "index_cache_full_shard"),
+            shape=data.shape,
+            chunk_shape=(8, 8),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[TransposeCodec(order=(1, 0)), ShardingCodec(chunk_shape=(2, 2))],
+        )
+        a[:, :] = data
+        assert np.array_equal(a[0:2, 0:2], data[0:2, 0:2])
+        # scalars through array-to-array codecs rewrite the whole shard in the outer pipeline
+        data[0:4, 0:4] = 99
+        a[0:4, 0:4] = 99
+        assert np.array_equal(a[4:6, 4:6], data[4:6, 4:6])
+        assert np.array_equal(a[:, :], data)
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize("index_location", ["start", "end"])
+def test_sharding_append_write_mode(store: Store, index_location: str) -> None:
+    data = np.arange(32 * 32, dtype="uint16").reshape((32, 32))
+    a = Array.create(
+        StorePath(store, "append"),
+        shape=data.shape,
+        chunk_shape=(16, 16),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[
+            ShardingCodec(
+                chunk_shape=(4, 4),
+                codecs=[BytesCodec(), BloscCodec()],
+                index_location=ShardingCodecIndexLocation(index_location),
+            )
+        ],
+    )
+    a[:, :] = data
+    size = sync(store.getsize("append/c/0/0"))
+
+    with config.set({"sharding.write_mode": "append"}):
+        # partial and complete inner chunks are appended to the shard
+        data[1:7, 2:4] = 1
+        a[1:7, 2:4] = data[1:7, 2:4]
+        assert np.array_equal(a[:, :], data)
+        assert sync(store.getsize("append/c/0/0")) > size
+        # deleted inner chunks are removed from the index
+        data[0:4, 0:4] = 0
+        a[0:4, 0:4] = data[0:4, 0:4]
+        assert np.array_equal(a[:, :], data)
+        # shards that do not exist yet are written as usual
+        data[16:, 16:] = 2
+        a[16:, 16:] = data[16:, 16:]
+        assert np.array_equal(a[:, :], data)
+        # shards without any inner chunks are deleted
+        data[16:, 16:] = 0
+        a[16:, 16:] = data[16:, 16:]
+        assert not sync(store.exists("append/c/1/1"))
+
+    assert a.compact_shards() == 1
+    assert sync(store.getsize("append/c/0/0")) < size
+    assert np.array_equal(a[:, :], data)
+    assert a.compact_shards() == 0
+
+    with config.set({"sharding.write_mode": "wrong"}), pytest.raises(ValueError):
+        a[0, 0] = 1
+
+
+@pytest.mark.parametrize("index_location", ["start", "end"])
+async def test_shard_builder(index_location: str) -> None:
+    codec = ShardingCodec(
+        chunk_shape=(1, 1), index_location=ShardingCodecIndexLocation(index_location)
+    )
+    builder = _ShardBuilder.create_empty((8, 8))
+    for i in range(8):
+        builder[(i, i)] = default_buffer_prototype().buffer.from_bytes(bytes([i]) * (i + 1))
+    assert builder[(3, 3)].to_bytes() == b"\x03" * 4
+    assert builder.get((3, 4)) is None
+    # the chunks are only concatenated when the shard is finalized
+    assert len(builder.parts) == 8
+
+    shard = await builder.finalize(codec.index_location, codec._encode_shard_index)
+    assert len(shard) == sum(range(1, 9)) + codec._shard_index_size((8, 8))
+    reader = await _ShardReader.from_bytes(shard, codec, (8, 8))
+    for i in range(8):
+        assert reader[(i, i)].to_bytes() == bytes([i]) * (i + 1)
+    assert reader.get((3, 4)) is None
+
+
+def test_shard_index_vectorized_ops() -> None:
+    codec = ShardingCodec(chunk_shape=(1, 1))
+    assert codec._is_total_shard({(i, j) for i in range(3) for j in range(2)}, (3, 2))
+    assert not codec._is_total_shard({(i, j) for i in range(3) for j in range(2)}, (2, 3))
+    assert not codec._is_total_shard({(0, 0)}, (3, 2))
+
+    builder = _ShardBuilder.merge_with_morton_order(
+        (3, 3),
+        {(1, 1)},
+        {
+            (i, j): default_buffer_prototype().buffer.from_bytes(b"\x00" * 4)
+            for i in range(3)
+            for j in range(3)
+        },
+    )
+    assert builder.index.is_dense(4)
+    assert builder.index.get_chunk_slice((1, 0)) == (4, 8)
+    assert builder.index.get_chunk_slice((1, 1)) is None
+    assert builder.index.get_chunk_slice((2, 2)) == (28, 32)
+    builder.index.set_chunk_slice((0, 0), slice(4, 8))
+    assert not builder.index.is_dense(4)
+
+
+def test_sharding_non_power_of_two_shards() -> None:
+    data = np.arange(24 * 24, dtype="uint16").reshape((24, 24))
+    a = Array.create(
+        StorePath(MemoryStore(mode="w"), "npot"),
+        shape=data.shape,
+        chunk_shape=(12, 12),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[ShardingCodec(chunk_shape=(4, 4))],
+    )
+    a[:, :] = data
+    data[5:9, 5:9] = 1
+    a[5:9, 5:9] = data[5:9, 5:9]
+    assert np.array_equal(a[:, :], data)
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+@pytest.mark.parametrize("index_location", ["start", "end"])
+def test_sharding_streaming_write(store: Store, index_location: str, monkeypatch) -> None:
+    partial_writes: list[int] = []
+    set_partial_values = type(store).set_partial_values
+
+    async def _set_partial_values(self, key_start_values):  # type: ignore[no-untyped-def]
+        partial_writes.extend(len(value) for _, _, value in key_start_values)
+        await set_partial_values(self, key_start_values)
+
+    monkeypatch.setattr(type(store), "set_partial_values", _set_partial_values)
+
+    data = np.arange(64 * 64, dtype="uint16").reshape((64, 64))
+    data[:8, :8] = 0
+    codecs = [
+        ShardingCodec(
+            chunk_shape=(8, 8),
+            codecs=[BytesCodec()],
+            index_location=ShardingCodecIndexLocation(index_location),
+        )
+    ]
+    shards = {}
+    for write_buffer_size in (0, 512):
+        with config.set({"sharding.write_buffer_size": write_buffer_size}):
+            a = Array.create(
+                StorePath(store, f"streaming_{write_buffer_size}"),
+                shape=data.shape,
+                chunk_shape=(32, 32),
+                dtype=data.dtype,
+                fill_value=0,
+                codecs=codecs,
+            )
+            a[:, :] = data
+            assert np.array_equal(a[:, :], data)
+            shards[write_buffer_size] = sync(
+                store.get(f"streaming_{write_buffer_size}/c/0/0", default_buffer_prototype())
+            )
+
+    # the encoded chunks are flushed in slabs, without changing the layout of the shard
+    assert len(partial_writes) > 4
+    assert max(partial_writes) < len(shards[0]) / 4
+    assert shards[512].to_bytes() == shards[0].to_bytes()
+
+
+@pytest.mark.parametrize("store", ("local", "memory"), indirect=["store"])
+def test_sharding_partial_transpose(store: Store, monkeypatch) -> None:
+    full_decodes: list[object] = []
+    decode_single = ShardingCodec._decode_single
+
+    async def _decode_single(self, *args):  # type: ignore[no-untyped-def]
+        full_decodes.append(args)
+        return await decode_single(self, *args)
+
+    monkeypatch.setattr(ShardingCodec, "_decode_single", _decode_single)
+
+    data = np.arange(16 * 32 * 8, dtype="uint16").reshape((16, 32, 8))
+    with warnings.catch_warnings():
+        # transposing does not disable partial reads and writes
+        warnings.simplefilter("error")
+        a = Array.create(
+            StorePath(store, "transposed"),
+            shape=data.shape,
+            chunk_shape=(16, 16, 8),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[
+                TransposeCodec(order=(2, 0, 1)),
+                ShardingCodec(chunk_shape=(8, 4, 4), codecs=[BytesCodec()]),
+            ],
+        )
+    a[:, :, :] = data
+    assert a._async_array.codec_pipeline.supports_partial_decode
+
+    # selections are mapped through the transpose codec to partial reads and writes
+    assert np.array_equal(a[0:4, 3:7, 2:6], data[0:4, 3:7, 2:6])
+    assert np.array_equal(a[3, 1:9, 5], data[3, 1:9, 5])
+    assert np.array_equal(a[5, 20, 7], data[5, 20, 7])
+
+    data[1:3, 18:30, 0:5] = 7
+    a[1:3, 18:30, 0:5] = data[1:3, 18:30, 0:5]
+    data[9, 2:4, :] = 1
+    a[9, 2:4, :] = data[9, 2:4, :]
+    assert np.array_equal(a[:, :, :], data)
+    assert full_decodes == []
+
+    # fancy selections and scalar values are handled on whole shards
+    assert np.array_equal(a.oindex[[1, 3], :, [0, 7]], data[[1, 3]][:, :, [0, 7]])
+    assert len(full_decodes) > 0
+    data[:, 4:8, :] = 3
+    a[:, 4:8, :] = 3
+    assert np.array_equal(a[:, :, :], data)
@@ -45,9 +45,30 @@ def test_config_defaults_set() -> None:
             "codec_pipeline": {
                 "path": "zarr.codecs.pipeline.BatchedCodecPipeline",
                 "batch_size": 1,
+                "queue_size": 16,
+                "memory_limit": 2**28,
+                "partial_decompress": False,
             },
             "buffer": "zarr.core.buffer.Buffer",
             "ndbuffer": "zarr.core.buffer.NDBuffer",
+            "threading": {"max_workers": None, "io_workers": None, "compute_workers": None},
+            "sharding": {
+                "coalesce_max_gap": 2**16,
+                "index_cache_size": 0,
+                "write_mode": "rewrite",
+                "write_buffer_size": 2**26,
+            },
+            "chunk_cache": {"size": 0, "policy": "lru"},
+            "store": {
+                "coalesce_max_gap": 2**16,
+                "coalesce_max_size": 2**24,
+                "mmap_cache_size": 1024,
+            },
+            "codec_executor": {
+                "default": "thread",
+                "codecs": {"bytes": "inline", "crc32c": "inline", "transpose": "inline"},
+                "process": {"max_workers": None, "start_method": "spawn"},
+            },
             "codecs": {
                 "blosc": "zarr.codecs.blosc.BloscCodec",
                 "gzip": "zarr.codecs.gzip.GzipCodec",
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Iterator
+
+import numcodecs.blosc
+import numpy as np
+import pytest
+from numcodecs.gzip import GZip
+from numcodecs.vlen import VLenUTF8
+
+from zarr import Array, config
+from zarr.codecs import BytesCodec, Crc32cCodec, GzipCodec
+from zarr.core.buffer import default_buffer_prototype
+from zarr.core.config import BadConfigError
+from zarr.core.executor import (
+    InlineExecutor,
+    ProcessExecutor,
+    ThreadExecutor,
+    get_codec_executor,
+    get_executor,
+    get_thread_pool,
+    thread_pool_stats,
+    to_thread_pool,
+)
+from zarr.store import LocalStore, MemoryStore, StorePath
+
+
+def test_get_codec_executor() -> None:
+    assert isinstance(get_codec_executor("gzip"), ThreadExecutor)
+    assert isinstance(get_codec_executor("crc32c"), InlineExecutor)
+    with config.set({"codec_executor.codecs": {"gzip": "process"}}):
+        assert isinstance(get_codec_executor("gzip"), ProcessExecutor)
+        assert isinstance(get_codec_executor("zstd"), ThreadExecutor)
+    with config.set({"codec_executor.default": "inline"}):
+        assert isinstance(get_codec_executor("zstd"), InlineExecutor)
+    assert get_executor("thread") is get_executor("thread")
+    with pytest.raises(BadConfigError):
+        get_executor("wrong_name")
+
+
+@pytest.mark.parametrize("executor_name", ["inline", "thread", "process"])
+async def test_executor_run(executor_name: str) -> None:
+    executor = get_executor(executor_name)
+    data = np.arange(1000, dtype="uint16")
+    encoded = await executor.run(GZip(5).encode, data)
+    decoded = await executor.run(GZip(5).decode, encoded)
+    assert np.array_equal(decoded.view("uint16"), data)
+    assert (
+        len(await executor.run(GZip(5).decode, await executor.run(GZip(5).encode, data[:0]))) == 0
+    )
+
+
+async def test_process_executor_propagates_errors() -> None:
+    executor = ProcessExecutor(max_workers=1)
+    try:
+        with pytest.raises(Exception):  # noqa: B017
+            await executor.run(GZip(5).decode, np.arange(10, dtype="uint8"))
+    finally:
+        executor.shutdown()
+
+
+async def test_process_executor_objects() -> None:
+    # arrays of Python objects can not be shared and are pickled instead
+    executor = ProcessExecutor(max_workers=1)
+    data = np.array(["a", "bc", ""], dtype=object)
+    try:
+        encoded = await executor.run(VLenUTF8().encode, data)
+        decoded = await executor.run(VLenUTF8().decode, encoded)
+    finally:
+        executor.shutdown()
+    assert decoded.dtype == object
+    assert list(decoded) == ["a", "bc", ""]
+
+
+def _slow_copy(data: np.ndarray) -> np.ndarray:
+    time.sleep(1)
+    return data.copy()
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+async def test_process_executor_cancel_unlinks_output() -> None:
+    segments = set(os.listdir("/dev/shm"))
+    executor = ProcessExecutor(max_workers=1, start_method="fork")
+    try:
+        task = asyncio.ensure_future(executor.run(_slow_copy, np.arange(10, dtype="uint8")))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    finally:
+        # waits for the worker to finish
+        executor.shutdown()
+    assert set(os.listdir("/dev/shm")) <= segments
+
+
+def test_process_executor_roundtrip() -> None:
+    data = np.arange(0, 64 * 64, dtype="uint16").reshape((64, 64))
+    with config.set(
+        {
+            "codec_executor.codecs": {"gzip": "process", "crc32c": "process"},
+            "codec_executor.process": {"max_workers": 2, "start_method": "spawn"},
+        }
+    ):
+        a = Array.create(
+            StorePath(MemoryStore(mode="w")),
+            shape=data.shape,
+            chunk_shape=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            codecs=[BytesCodec(), GzipCodec(), Crc32cCodec()],
+        )
+        a[:, :] = data
+        assert np.array_equal(a[:, :], data)
+
+
+@pytest.fixture
+def _restore_blosc() -> Iterator[None]:
+    use_threads, nthreads = numcodecs.blosc.use_threads, numcodecs.blosc.get_nthreads()
+    yield
+    numcodecs.blosc.use_threads = use_threads
+    numcodecs.blosc.set_nthreads(nthreads)
+
+
+@pytest.mark.usefixtures("_restore_blosc")
+def test_thread_pool_sizing() -> None:
+    numcodecs.blosc.use_threads = None
+    numcodecs.blosc.set_nthreads(3)
+    get_thread_pool("compute")
+    # without a budget, the blosc settings of the process are left alone
+    assert numcodecs.blosc.use_threads is None
+    assert numcodecs.blosc.get_nthreads() == 3
+    with config.set({"threading": {"max_workers": 8, "io_workers": 3, "compute_workers": 2}}):
+        assert get_thread_pool("io")._max_workers == 3
+        assert get_thread_pool("compute")._max_workers == 2
+        assert get_thread_pool("compute") is get_thread_pool("compute")
+        # the remaining budget is given to blosc
+        assert numcodecs.blosc.get_nthreads() == 4
+        assert numcodecs.blosc.use_threads
+    with config.set({"threading": {"max_workers": 4, "io_workers": None, "compute_workers": None}}):
+        assert get_thread_pool("compute")._max_workers == 4
+        assert numcodecs.blosc.get_nthreads() == 1
+        assert not numcodecs.blosc.use_threads
+    # the blosc settings are restored when the budget is unset
+    get_thread_pool("compute")
+    assert numcodecs.blosc.use_threads is None
+    assert numcodecs.blosc.get_nthreads() == 3
+    with pytest.raises(ValueError):
+        get_thread_pool("wrong_name")  # type: ignore[arg-type]
+
+
+def test_thread_budget_is_cached(monkeypatch) -> None:
+    get_thread_pool("compute")
+    keys: list[str] = []
+    get = config.get
+
+    def _get(key: str, *args):  # type: ignore[no-untyped-def]
+        keys.append(key)
+        return get(key, *args)
+
+    monkeypatch.setattr(config, "get", _get)
+    get_thread_pool("compute")
+    get_thread_pool("io")
+    assert keys == []
+    # the budget is recomputed after the config has changed
+    with config.set({"threading.compute_workers": 1}):
+        assert get_thread_pool("compute")._max_workers == 1
+        assert "threading.compute_workers" in keys
+    keys.clear()
+    get_thread_pool("compute")
+    assert "threading.compute_workers" in keys
+
+
+async def test_thread_pool_stats(tmpdir) -> None:
+    completed_before = thread_pool_stats().get("io")
+    store = await LocalStore.open(str(tmpdir), mode="w")
+    await store.set("a", default_buffer_prototype().buffer.from_bytes(b"abc"))
+    assert await store.get("a", default_buffer_prototype()) is not None
+    stats = thread_pool_stats()["io"]
+    assert stats.completed >= 2 + (completed_before.completed if completed_before else 0)
+    assert stats.queued == 0
+    assert stats.active == 0
+    assert stats.max_queued >= 1
+
+    assert await to_thread_pool("compute", sum, [1, 2, 3]) == 6
+    assert thread_pool_stats()["compute"].completed >= 1
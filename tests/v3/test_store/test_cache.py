@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from zarr import Array
+from zarr.core.buffer import Buffer, default_buffer_prototype
+from zarr.store.cache import CacheStore, LocalCacheStore, TieredCacheStore
+from zarr.store.memory import MemoryStore
+from zarr.store.remote import RemoteStore
+from zarr.testing.store import StoreTests
+
+
+class TestCacheStore(StoreTests[CacheStore]):
+    store_cls = CacheStore
+
+    def set(self, store: CacheStore, key: str, value: Buffer) -> None:
+        assert isinstance(store._store, MemoryStore)
+        store._store._store_dict[key] = value
+
+    def get(self, store: CacheStore, key: str) -> Buffer:
+        assert isinstance(store._store, MemoryStore)
+        return store._store._store_dict[key]
+
+    @pytest.fixture(scope="function")
+    def store_kwargs(self) -> dict[str, Any]:
+        return {"store": MemoryStore(mode="r+"), "max_size": 2**20}
+
+    def test_store_repr(self, store: CacheStore) -> None:
+        assert str(store) == str(store._store)
+        assert repr(store) == f"CacheStore({store._store!r}, max_size={2**20})"
+
+    def test_store_supports_writes(self, store: CacheStore) -> None:
+        assert store.supports_writes
+
+    def test_store_supports_partial_writes(self, store: CacheStore) -> None:
+        assert store.supports_partial_writes
+
+    def test_store_supports_listing(self, store: CacheStore) -> None:
+        assert store.supports_listing
+
+    def test_list_prefix(self, store: CacheStore) -> None:
+        assert True
+
+
+def _count_requests(store: MemoryStore, monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    # MemoryStore.get_partial_values reads the values with `get`
+    requests: list[Any] = []
+    get, list_dir = store.get, store.list_dir
+
+    async def counting_get(key: str, *args: Any, **kwargs: Any) -> Any:
+        requests.append(key)
+        await asyncio.sleep(0)
+        return await get(key, *args, **kwargs)
+
+    def counting_list_dir(prefix: str) -> Any:
+        requests.append(("list_dir", prefix))
+        return list_dir(prefix)
+
+    monkeypatch.setattr(store, "get", counting_get)
+    monkeypatch.setattr(store, "list_dir", counting_list_dir)
+    return requests
+
+
+async def test_cache_store_caches_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = CacheStore(inner, max_size=2**10)
+    prototype = default_buffer_prototype()
+    await store.set("a/zarr.json", Buffer.from_bytes(b"0123456789"))
+    requests = _count_requests(inner, monkeypatch)
+
+    assert (await store.get("a/c/0", prototype)) is None
+    assert (await store.get("a/c/0", prototype)) is None
+    assert not await store.exists("a/c/0")
+    value = await store.get("a/zarr.json", prototype, byte_range=(2, 3))
+    assert value is not None
+    assert value.to_bytes() == b"234"
+    value = await store.get("a/zarr.json", prototype, byte_range=(2, 3))
+    assert value is not None
+    assert value.to_bytes() == b"234"
+    assert requests == ["a/c/0", "a/zarr.json"]
+
+    # byte ranges are served from cached values
+    value = await store.get("a/zarr.json", prototype)
+    assert value is not None
+    assert value.to_bytes() == b"0123456789"
+    values = await store.get_partial_values(
+        prototype, [("a/zarr.json", (5, None)), ("a/c/0", (0, 1)), ("a/c/1", (0, 1))]
+    )
+    assert [None if v is None else v.to_bytes() for v in values] == [b"56789", None, None]
+    assert await store.getsize("a/zarr.json") == 10
+    assert requests == ["a/c/0", "a/zarr.json", "a/zarr.json", "a/c/1"]
+
+    assert [k async for k in store.list_dir("a")] == ["zarr.json"]
+    assert [k async for k in store.list_dir("a")] == ["zarr.json"]
+    assert requests[-1] == ("list_dir", "a")
+    assert requests.count(("list_dir", "a")) == 1
+
+    stats = store.stats()
+    assert stats.misses == 5
+    assert stats.hits == 5
+    assert 10 < stats.nbytes <= stats.max_nbytes == 2**10
+
+
+async def test_cache_store_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = CacheStore(inner, max_size=2**10)
+    prototype = default_buffer_prototype()
+    await store.set("a/c/0", Buffer.from_bytes(b"0123"))
+    assert [k async for k in store.list_dir("a/c")] == ["0"]
+    requests = _count_requests(inner, monkeypatch)
+
+    await store.set("a/c/1", Buffer.from_bytes(b"4567"))
+    assert sorted([k async for k in store.list_dir("a/c")]) == ["0", "1"]
+
+    assert (await store.get("a/c/0", prototype)) is not None
+    await store.set_partial_values([("a/c/0", 4, b"89")])
+    value = await store.get("a/c/0", prototype)
+    assert value is not None
+    assert value.to_bytes() == b"012389"
+
+    await store.delete("a/c/0")
+    assert (await store.get("a/c/0", prototype)) is None
+    assert requests == [("list_dir", "a/c"), "a/c/0", "a/c/0", "a/c/0"]
+
+    # changes that bypass the cache require an explicit invalidation
+    await inner.set("a/c/0", Buffer.from_bytes(b"0"))
+    assert (await store.get("a/c/0", prototype)) is None
+    await store.invalidate()
+    assert (await store.get("a/c/0", prototype)) is not None
+    assert store.stats().nbytes == len("a/c/0") + 1
+
+
+async def test_cache_store_eviction() -> None:
+    store = CacheStore(MemoryStore(mode="w"), max_size=40)
+    prototype = default_buffer_prototype()
+    for i in range(4):
+        await store.set(f"c/{i}", Buffer.from_bytes(bytes(10)))
+    # values that exceed the size of the cache are not cached
+    await store.set("big", Buffer.from_bytes(bytes(100)))
+    await store.get("big", prototype)
+    assert store.stats().nbytes == 0
+
+    for i in range(4):
+        await store.get(f"c/{i}", prototype)
+    assert store.stats().nbytes == 39
+    assert store.stats().evictions == 1
+    # the least recently used value was evicted
+    await store.get("c/1", prototype)
+    assert store.stats().hits == 1
+    await store.get("c/0", prototype)
+    assert store.stats().hits == 1
+
+
+async def test_cache_store_concurrent_gets(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = CacheStore(inner, max_size=2**10)
+    await store.set("c/0", Buffer.from_bytes(b"0123"))
+    await store.set("c/1", Buffer.from_bytes(b"4567"))
+    requests = _count_requests(inner, monkeypatch)
+
+    values = await asyncio.gather(
+        *(store.get(key, default_buffer_prototype()) for key in ["c/0", "c/1"] * 4)
+    )
+    assert [v.to_bytes() for v in values if v is not None] == [b"0123", b"4567"] * 4
+    assert sorted(requests) == ["c/0", "c/1"]
+    assert store._locks == {}
+
+
+def test_cache_store_array() -> None:
+    store = CacheStore(MemoryStore(mode="w"), max_size=2**20)
+    data = np.arange(100, dtype="i4").reshape(10, 10)
+    a = Array.create(store, shape=(10, 10), chunk_shape=(5, 5), dtype="i4", fill_value=0)
+    a[:] = data
+    assert np.array_equal(a[:], data)
+    a[2:4] = 0
+    data[2:4] = 0
+    assert np.array_equal(Array.open(store)[:], data)
+    assert store.stats().hits > 0
+
+
+class TestLocalCacheStore(StoreTests[LocalCacheStore]):
+    store_cls = LocalCacheStore
+
+    def set(self, store: LocalCacheStore, key: str, value: Buffer) -> None:
+        assert isinstance(store._store, MemoryStore)
+        store._store._store_dict[key] = value
+
+    def get(self, store: LocalCacheStore, key: str) -> Buffer:
+        assert isinstance(store._store, MemoryStore)
+        return store._store._store_dict[key]
+
+    @pytest.fixture(scope="function")
+    def store_kwargs(self, tmpdir: Path) -> dict[str, Any]:
+        return {"store": MemoryStore(mode="r+"), "root": str(tmpdir), "max_size": 2**20}
+
+    def test_store_repr(self, store: LocalCacheStore) -> None:
+        assert str(store) == str(store._store)
+        assert repr(store) == (
+            f"LocalCacheStore({store._store!r}, {str(store._cache.root)!r}, max_size={2**20})"
+        )
+
+    def test_store_supports_writes(self, store: LocalCacheStore) -> None:
+        assert store.supports_writes
+
+    def test_store_supports_partial_writes(self, store: LocalCacheStore) -> None:
+        assert store.supports_partial_writes
+
+    def test_store_supports_listing(self, store: LocalCacheStore) -> None:
+        assert store.supports_listing
+
+    def test_list_prefix(self, store: LocalCacheStore) -> None:
+        assert True
+
+
+async def test_local_cache_store_persistence(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inner = MemoryStore(mode="w")
+    await inner.set("a/c/0", Buffer.from_bytes(b"0123456789"))
+    await inner.set("a/c/1", Buffer.from_bytes(b"abcdefghij"))
+    requests = _count_requests(inner, monkeypatch)
+    prototype = default_buffer_prototype()
+
+    store = LocalCacheStore(inner, tmp_path, max_size=2**10)
+    value = await store.get("a/c/0", prototype)
+    assert value is not None
+    assert value.to_bytes() == b"0123456789"
+    value = await store.get("a/c/1", prototype, byte_range=(2, 3))
+    assert value is not None
+    assert value.to_bytes() == b"cde"
+    assert (await store.get("a/c/2", prototype)) is None
+    assert requests == ["a/c/0", "a/c/1", "a/c/2"]
+    store.close()
+
+    # another process with the same cache directory reads the cached values from disk
+    store = LocalCacheStore(inner, tmp_path, max_size=2**10)
+    value = await store.get("a/c/0", prototype, byte_range=(5, None))
+    assert value is not None
+    assert value.to_bytes() == b"56789"
+    value = await store.get("a/c/1", prototype, byte_range=(2, 3))
+    assert value is not None
+    assert value.to_bytes() == b"cde"
+    assert await store.getsize("a/c/0") == 10
+    assert requests == ["a/c/0", "a/c/1", "a/c/2"]
+    assert store.stats().hits == 2
+    assert store.stats().nbytes == 13
+
+    # writes remove the cached values and byte ranges of the key
+    await store.set("a/c/1", Buffer.from_bytes(b"ABCDEFGHIJ"))
+    value = await store.get("a/c/1", prototype, byte_range=(2, 3))
+    assert value is not None
+    assert value.to_bytes() == b"CDE"
+    await store.delete("a/c/0")
+    assert (await store.get("a/c/0", prototype)) is None
+    assert requests[-2:] == ["a/c/1", "a/c/0"]
+    assert sorted(p.name for p in tmp_path.rglob("*") if p.is_file()) == ["2-3"]
+
+
+async def test_local_cache_store_eviction(tmp_path: Path) -> None:
+    store = LocalCacheStore(MemoryStore(mode="w"), tmp_path, max_size=40)
+    prototype = default_buffer_prototype()
+    for i in range(4):
+        await store.set(f"c/{i}", Buffer.from_bytes(bytes(10)))
+    await store.set("big", Buffer.from_bytes(bytes(100)))
+    await store.get("big", prototype)
+    assert store.stats().nbytes == 0
+
+    for i in range(4):
+        await store.get(f"c/{i}", prototype)
+    await store.get("c/0", prototype)
+    value = await store.get("c/4", prototype, byte_range=(0, 5))
+    assert value is None
+    await store.set("c/4", Buffer.from_bytes(bytes(10)))
+    await store.get("c/4", prototype)
+    # the least recently used value was evicted
+    assert store.stats().nbytes == 40
+    assert store.stats().evictions == 1
+    assert not (tmp_path / "values" / "c" / "1").exists()
+
+    # the cache directory is trimmed to the size of the cache when it is opened
+    store = LocalCacheStore(MemoryStore(mode="w"), tmp_path, max_size=20)
+    assert not await store.exists("c/2")
+    assert store.stats().nbytes == 20
+    assert sorted(p.name for p in (tmp_path / "values" / "c").iterdir()) == ["0", "4"]
+
+
+@pytest.mark.parametrize("policy", ["read-through", "write-through"])
+async def test_local_cache_store_policy(
+    tmp_path: Path, policy: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inner = MemoryStore(mode="w")
+    store = LocalCacheStore(inner, tmp_path, max_size=2**10, policy=policy)  # type: ignore[arg-type]
+    await store.set("c/0", Buffer.from_bytes(b"0123"))
+    requests = _count_requests(inner, monkeypatch)
+    value = await store.get("c/0", default_buffer_prototype())
+    assert value is not None
+    assert value.to_bytes() == b"0123"
+    assert requests == ([] if policy == "write-through" else ["c/0"])
+
+    with pytest.raises(ValueError, match="write-back"):
+        LocalCacheStore(inner, tmp_path, max_size=2**10, policy="write-back")  # type: ignore[arg-type]
+
+
+async def test_tiered_cache_store(tmp_path: Path) -> None:
+    asyn_wrapper = pytest.importorskip("fsspec.implementations.asyn_wrapper")
+    from fsspec.implementations.local import LocalFileSystem
+
+    class LocalPath:
+        # stands in for the UPath of a remote file system
+        protocol = "file"
+
+        def __init__(self, path: Path) -> None:
+            self.path = str(path)
+            self.fs = asyn_wrapper.AsyncFileSystemWrapper(LocalFileSystem(auto_mkdir=True))
+
+        def __str__(self) -> str:
+            return f"file://{self.path}"
+
+    remote = RemoteStore(LocalPath(tmp_path / "remote"), mode="w")  # type: ignore[arg-type]
+    data = np.arange(100, dtype="i4").reshape(10, 10)
+    store = TieredCacheStore(
+        remote, tmp_path / "cache", memory_size=2**10, disk_size=2**20, policy="write-through"
+    )
+    assert repr(store) == f"TieredCacheStore({store.disk_cache!r}, memory_size={2**10})"
+    a = Array.create(store, shape=(10, 10), chunk_shape=(5, 5), dtype="i4", fill_value=0)
+    a[:] = data
+    assert np.array_equal(a[:], data)
+    assert store.disk_cache.stats().hits > 0
+
+    # a new process reads the chunks from the cache directory
+    store = TieredCacheStore(remote, tmp_path / "cache", memory_size=2**10, disk_size=2**20)
+    assert np.array_equal(Array.open(store)[:], data)
+    assert store.disk_cache.stats().misses == 0
+
+    # changes that bypass the cache are read after both tiers are invalidated
+    await remote.set("c/0/0", await store.get("c/1/1", default_buffer_prototype()))
+    assert np.array_equal(Array.open(store)[:5, :5], data[:5, :5])
+    await store.invalidate()
+    assert store.stats().nbytes == 0
+    assert store.disk_cache.stats().nbytes == 0
+    assert np.array_equal(Array.open(store)[:5, :5], data[5:, 5:])
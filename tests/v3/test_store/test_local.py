@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import os
+import shutil
+import stat
+
+import numpy as np
 import pytest
 
-from zarr.core.buffer import Buffer
+from zarr import Array
+from zarr.codecs import BloscCodec, BytesCodec, ShardingCodec, TransposeCodec
+from zarr.core.buffer import Buffer, default_buffer_prototype
+from zarr.core.config import config
+from zarr.store import local
 from zarr.store.local import LocalStore
 from zarr.testing.store import StoreTests
 
@@ -35,5 +44,194 @@ class TestLocalStore(StoreTests[LocalStore]):
     def test_store_supports_listing(self, store: LocalStore) -> None:
         assert store.supports_listing
 
-    def test_list_prefix(self, store: LocalStore) -> None:
-        assert True
+    async def test_list_prefix(self, store: LocalStore) -> None:
+        keys = ["foo/zarr.json", "foo/c/0", "foo/c/1", "foobar/c/0", "bar"]
+        for key in keys:
+            await store.set(key, Buffer.from_bytes(b"\x01"))
+        assert sorted([k async for k in store.list_prefix("")]) == sorted(keys)
+        assert sorted([k async for k in store.list_prefix("foo")]) == sorted(keys[:4])
+        assert sorted([k async for k in store.list_prefix("foo/")]) == sorted(keys[:3])
+        assert sorted([k async for k in store.list_prefix("foo/c/")]) == ["foo/c/0", "foo/c/1"]
+        assert [k async for k in store.list_prefix("baz/")] == []
+
+
+async def test_local_store_get_partial_values_coalesced(tmpdir) -> None:
+    store = await LocalStore.open(root=str(tmpdir), mode="w")
+    await store.set("c/0", Buffer.from_bytes(bytes(range(100))))
+    key_ranges: list[tuple[str, tuple[int | None, int | None]]] = [
+        ("c/0", (0, 10)),
+        ("c/0", (20, 10)),
+        ("c/0", (80, 10)),
+    ]
+    with config.set({"store.coalesce_max_gap": 10, "store.coalesce_max_size": 30}):
+        values = await store.get_partial_values(default_buffer_prototype(), key_ranges)
+    assert [v.to_bytes() for v in values if v is not None] == [
+        bytes(range(10)),
+        bytes(range(20, 30)),
+        bytes(range(80, 90)),
+    ]
+    # merged ranges are views of a single read
+    arrays = [v.as_numpy_array() for v in values if v is not None]
+    assert np.shares_memory(arrays[0].base, arrays[1].base)
+    assert not np.shares_memory(arrays[1].base, arrays[2].base)
+
+    # ranges are not merged beyond the maximum request size
+    with config.set({"store.coalesce_max_gap": 10, "store.coalesce_max_size": 20}):
+        values = await store.get_partial_values(default_buffer_prototype(), key_ranges)
+    arrays = [v.as_numpy_array() for v in values if v is not None]
+    assert not np.shares_memory(arrays[0].base, arrays[1].base)
+
+
+class TestLocalStoreMmap(TestLocalStore):
+    @pytest.fixture
+    def store_kwargs(self, tmpdir) -> dict[str, str | bool]:
+        return {"root": str(tmpdir), "mode": "r+", "mmap": True}
+
+
+async def test_local_store_mmap(tmpdir) -> None:
+    store = await LocalStore.open(root=str(tmpdir), mode="w", mmap=True)
+    prototype = default_buffer_prototype()
+    await store.set("c/0", Buffer.from_bytes(bytes(range(100))))
+    await store.set("c/1", Buffer.from_bytes(b""))
+    value = await store.get("c/0", prototype)
+    assert value is not None
+    assert value.to_bytes() == bytes(range(100))
+    # values are read-only views of the cached map of the file
+    data = value.as_numpy_array()
+    assert not data.flags.writeable
+    part = await store.get("c/0", prototype, byte_range=(10, 5))
+    assert part is not None
+    assert part.to_bytes() == bytes(range(10, 15))
+    assert np.shares_memory(part.as_numpy_array(), data)
+    values = await store.get_partial_values(prototype, [("c/0", (-2, None)), ("c/2", (0, 1))])
+    assert values[0] is not None
+    assert values[0].to_bytes() == bytes([98, 99])
+    assert values[1] is None
+    value = await store.get("c/1", prototype)
+    assert value is not None
+    assert value.to_bytes() == b""
+    assert store._map_cache is not None
+    assert len(store._map_cache) == 1
+
+    # replaced files are mapped anew, without changing the views of the old file
+    await store.set("c/0", Buffer.from_bytes(b"abc"))
+    new_value = await store.get("c/0", prototype)
+    assert new_value is not None
+    assert new_value.to_bytes() == b"abc"
+    assert bytes(data[:3]) == bytes(range(3))
+
+    with config.set({"store.mmap_cache_size": 1}):
+        await store.set("c/2", Buffer.from_bytes(b"xyz"))
+        assert [
+            None if v is None else v.to_bytes()
+            for v in await store.get_many(prototype, ["c/0", "c/2", "c/3"])
+        ] == [b"abc", b"xyz", None]
+        assert len(store._map_cache) == 1
+    store.close()
+    assert len(store._map_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "codecs",
+    [
+        [BytesCodec()],
+        [TransposeCodec(order=(1, 0)), BytesCodec(), BloscCodec()],
+        [ShardingCodec(chunk_shape=(4, 4), codecs=[BytesCodec()])],
+    ],
+)
+def test_local_store_mmap_array(tmpdir, codecs) -> None:
+    store = LocalStore(str(tmpdir), mode="w", mmap=True)
+    data = np.arange(16 * 16, dtype="uint16").reshape((16, 16))
+    a = Array.create(
+        store, shape=data.shape, chunk_shape=(8, 8), dtype=data.dtype, fill_value=0, codecs=codecs
+    )
+    a[:, :] = data
+    assert np.array_equal(a[:, :], data)
+    a[2:5, 3:12] = data[2:5, 3:12] + 1
+    data[2:5, 3:12] += 1
+    assert np.array_equal(a[:, :], data)
+    assert np.array_equal(a[9, 1:15], data[9, 1:15])
+
+
+class TestLocalStoreAtomic(TestLocalStore):
+    @pytest.fixture
+    def store_kwargs(self, tmpdir) -> dict[str, str | bool]:
+        return {"root": str(tmpdir), "mode": "r+", "atomic_writes": True, "fsync": "batch"}
+
+
+async def test_local_store_atomic_writes(tmpdir) -> None:
+    store = await LocalStore.open(root=str(tmpdir), mode="w", atomic_writes=True)
+    await store.set("a/b/c", Buffer.from_bytes(b"123"))
+    await store.set_many([("a/b/c", Buffer.from_bytes(b"456")), ("a/d", Buffer.from_bytes(b""))])
+    await store.set_partial_values([("a/b/c", 1, b"x")])
+    assert (tmpdir / "a" / "b" / "c").read_binary() == b"4x6"
+    assert (tmpdir / "a" / "d").read_binary() == b""
+    # no temporary files are left behind
+    assert sorted(p.basename for p in tmpdir.visit() if p.isfile()) == ["c", "d"]
+
+
+async def test_local_store_write_without_copy(tmpdir) -> None:
+    store = await LocalStore.open(root=str(tmpdir), mode="w")
+    data = np.arange(20, dtype="b")
+    # the bytes of non-contiguous values are written in order
+    await store.set("c/0", Buffer.from_array_like(data[::2]))
+    assert (tmpdir / "c" / "0").read_binary() == data[::2].tobytes()
+
+
+async def test_local_store_removed_directory(tmpdir) -> None:
+    store = await LocalStore.open(root=str(tmpdir), mode="w")
+    await store.set("a/b/c", Buffer.from_bytes(b"123"))
+    # the directories are created again when they are removed by another writer
+    shutil.rmtree(tmpdir / "a")
+    await store.set("a/b/c", Buffer.from_bytes(b"456"))
+    assert (tmpdir / "a" / "b" / "c").read_binary() == b"456"
+    await store.delete("a/b")
+    await store.set_many([("a/b/c", Buffer.from_bytes(b"789"))])
+    assert (tmpdir / "a" / "b" / "c").read_binary() == b"789"
+
+
+@pytest.mark.parametrize("atomic_writes", [True, False])
+@pytest.mark.parametrize(
+    ("fsync", "files", "directories"), [("none", 0, 0), ("batch", 3, 1), ("file", 3, 3)]
+)
+async def test_local_store_fsync(
+    tmpdir, monkeypatch, atomic_writes: bool, fsync: str, files: int, directories: int
+) -> None:
+    store = await LocalStore.open(
+        root=str(tmpdir), mode="w", atomic_writes=atomic_writes, fsync=fsync
+    )
+    synced: list[str] = []
+    fsync_fd = os.fsync
+
+    def _fsync(fd: int) -> None:
+        synced.append("dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file")
+        fsync_fd(fd)
+
+    monkeypatch.setattr(os, "fsync", _fsync)
+    await store.set_many([(f"c/{i}", Buffer.from_bytes(b"123")) for i in range(3)])
+    assert synced.count("file") == files
+    if os.name != "nt":
+        assert synced.count("dir") == directories
+
+
+def test_local_store_fsync_policy(tmpdir) -> None:
+    with pytest.raises(ValueError, match="Expected one of"):
+        LocalStore(str(tmpdir), mode="w", fsync="always")  # type: ignore[arg-type]
+
+
+async def test_local_store_list_batches(tmpdir, monkeypatch) -> None:
+    monkeypatch.setattr(local, "_LIST_BATCH_SIZE", 3)
+    store = await LocalStore.open(root=str(tmpdir), mode="w")
+    keys = [f"c/{i}/{j}" for i in range(3) for j in range(4)]
+    await store.set_many([(key, Buffer.from_bytes(b"1")) for key in keys])
+    # temporary files of atomic writes are not listed
+    (tmpdir / "c" / f"0.{'0' * 32}.partial").write_binary(b"1")
+    listed = [k async for k in store.list()]
+    assert sorted(listed) == sorted(keys)
+    assert sorted([k async for k in store.list_prefix("c/1")]) == keys[4:8]
+    assert sorted([k async for k in store.list_dir("c")]) == ["0", "1", "2"]
+    assert sorted([k async for k in store.list_dir("c/1/")]) == ["0", "1", "2", "3"]
+
+    # listings that are not exhausted are closed
+    async for _ in store.list():
+        break
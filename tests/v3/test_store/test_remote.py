@@ -97,6 +97,22 @@ async def test_basic():
     assert out[0].to_bytes() == data[1:]
 
 
+async def test_get_many_literal_keys():
+    store = await RemoteStore.open(
+        f"s3://{test_bucket_name}", mode="w", endpoint_url=endpoint_url, anon=False
+    )
+    # keys are not expanded as glob patterns
+    await store.set("a[0]", Buffer.from_bytes(b"x"))
+    await store.set("a0", Buffer.from_bytes(b"y"))
+    await store.set("b", Buffer.from_bytes(b"z"))
+    values = await store.get_many(default_buffer_prototype(), ["a[0]", "missing", "b"])
+    assert [value.to_bytes() if value is not None else None for value in values] == [
+        b"x",
+        None,
+        b"z",
+    ]
+
+
 class TestRemoteStoreS3(StoreTests[RemoteStore]):
     store_cls = RemoteStore
 
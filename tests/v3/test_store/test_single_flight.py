@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import numpy as np
+import pytest
+
+from zarr import Array
+from zarr.core.buffer import Buffer, default_buffer_prototype
+from zarr.store.memory import MemoryStore
+from zarr.store.single_flight import SingleFlightStore
+from zarr.testing.store import StoreTests
+
+
+class TestSingleFlightStore(StoreTests[SingleFlightStore]):
+    store_cls = SingleFlightStore
+
+    def set(self, store: SingleFlightStore, key: str, value: Buffer) -> None:
+        assert isinstance(store._store, MemoryStore)
+        store._store._store_dict[key] = value
+
+    def get(self, store: SingleFlightStore, key: str) -> Buffer:
+        assert isinstance(store._store, MemoryStore)
+        return store._store._store_dict[key]
+
+    @pytest.fixture(scope="function")
+    def store_kwargs(self) -> dict[str, Any]:
+        return {"store": MemoryStore(mode="r+")}
+
+    def test_store_repr(self, store: SingleFlightStore) -> None:
+        assert str(store) == str(store._store)
+        assert repr(store) == f"SingleFlightStore({store._store!r})"
+
+    def test_store_supports_writes(self, store: SingleFlightStore) -> None:
+        assert store.supports_writes
+
+    def test_store_supports_partial_writes(self, store: SingleFlightStore) -> None:
+        assert store.supports_partial_writes
+
+    def test_store_supports_listing(self, store: SingleFlightStore) -> None:
+        assert store.supports_listing
+
+    def test_list_prefix(self, store: SingleFlightStore) -> None:
+        assert True
+
+
+def _slow_requests(store: MemoryStore, monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    # MemoryStore.get_partial_values reads the values with `get`
+    requests: list[Any] = []
+    get = store.get
+
+    async def slow_get(key: str, *args: Any, **kwargs: Any) -> Any:
+        requests.append((key, kwargs.get("byte_range")))
+        await asyncio.sleep(0.01)
+        return await get(key, *args, **kwargs)
+
+    monkeypatch.setattr(store, "get", slow_get)
+    return requests
+
+
+async def test_single_flight_store_shares_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = SingleFlightStore(inner)
+    await store.set("c/0", Buffer.from_bytes(b"0123"))
+    await store.set("c/1", Buffer.from_bytes(b"4567"))
+    requests = _slow_requests(inner, monkeypatch)
+    prototype = default_buffer_prototype()
+
+    values = await asyncio.gather(
+        *(store.get(key, prototype) for key in ["c/0", "c/1", "c/2"] * 4),
+        store.get("c/0", prototype, byte_range=(0, None)),
+        store.get("c/0", prototype, byte_range=(1, 2)),
+        store.get_partial_values(prototype, [("c/0", (1, 2)), ("c/1", (0, 1)), ("c/1", (0, 1))]),
+    )
+    assert [None if v is None else v.to_bytes() for v in values[:12]] == [
+        b"0123",
+        b"4567",
+        None,
+    ] * 4
+    assert values[12] is values[0]
+    assert [None if v is None else v.to_bytes() for v in values[14]] == [b"12", b"4", b"4"]
+    assert sorted(requests, key=str) == sorted(
+        [("c/0", None), ("c/1", None), ("c/2", None), ("c/0", (1, 2)), ("c/1", (0, 1))], key=str
+    )
+    assert store.stats().requests == 5
+    assert store.stats().shared == 12
+    assert store._flights == {}
+    assert store._flight_keys == {}
+
+    # reads that do not overlap in time are not shared
+    requests.clear()
+    await store.get("c/0", prototype)
+    await store.get("c/0", prototype)
+    assert len(requests) == 2
+
+
+async def test_single_flight_store_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = SingleFlightStore(inner)
+    await store.set("c/0", Buffer.from_bytes(b"0123"))
+    requests = _slow_requests(inner, monkeypatch)
+    prototype = default_buffer_prototype()
+
+    before = asyncio.ensure_future(store.get("c/0", prototype))
+    await asyncio.sleep(0)
+    await store.set("c/0", Buffer.from_bytes(b"4567"))
+    after = await store.get("c/0", prototype)
+    assert after is not None
+    assert after.to_bytes() == b"4567"
+    await before
+    assert len(requests) == 2
+
+
+async def test_single_flight_store_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    inner = MemoryStore(mode="w")
+    store = SingleFlightStore(inner)
+    calls = 0
+
+    async def failing_get(key: str, *args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise OSError("connection reset")
+
+    monkeypatch.setattr(inner, "get", failing_get)
+    prototype = default_buffer_prototype()
+    results = await asyncio.gather(
+        *(store.get("c/0", prototype) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(r, OSError) for r in results)
+
+    # cancelling one read does not cancel the shared request
+    first = asyncio.ensure_future(store.get("c/0", prototype))
+    second = asyncio.ensure_future(store.get("c/0", prototype))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(OSError, match="connection reset"):
+        await second
+    assert calls == 2
+
+
+def test_single_flight_store_array() -> None:
+    store = SingleFlightStore(MemoryStore(mode="w"))
+    data = np.arange(100, dtype="i4").reshape(10, 10)
+    a = Array.create(store, shape=(10, 10), chunk_shape=(5, 5), dtype="i4", fill_value=0)
+    a[:] = data
+    assert np.array_equal(a[:], data)
+    assert np.array_equal(Array.open(store)[2:8, 3], data[2:8, 3])